@@ -0,0 +1,73 @@
+"""
+Benchmark for plotting long DMP channels through the DMPDownsampler.
+
+Builds the min/max pyramid of synthetic speed and acceleration channels and
+compares a chart of every raw row against the points served for the full
+dump and for zoom windows of decreasing width. Reports the points per
+channel, the serialized size of the figure, which is what Streamlit ships to
+the browser, and the time spent building it.
+
+Usage:
+    python benchmarks/bench_dmp_downsampling.py [rows]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.data_processors.dmp_downsampler import DMPDownsampler
+
+CHANNELS = ['REF_SPEED', 'SPEED_1', 'SPEED_2', 'SPEED_3', 'SPEED_4', 'ACC_1', 'ACC_2', 'ACC_3', 'ACC_4']
+
+
+def make_dmp(rows):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'MOD_TICK': np.arange(rows, dtype=np.int64) * 100})
+    speed = np.cumsum(rng.integers(-2, 3, rows)).astype(np.int16)
+    df['REF_SPEED'] = speed
+    for axle in range(1, 5):
+        df[f'SPEED_{axle}'] = (speed + rng.integers(-5, 6, rows)).astype(np.int16)
+        df[f'ACC_{axle}'] = rng.integers(0, 256, rows).astype(np.uint8)
+    return df
+
+
+def measure(series):
+    start = time.perf_counter()
+    fig = go.Figure([go.Scattergl(x=x, y=y, mode='lines', name=channel) for channel, (x, y) in series.items()])
+    size = len(fig.to_json())
+    return time.perf_counter() - start, size
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    df = make_dmp(rows)
+    start = time.perf_counter()
+    downsampler = DMPDownsampler(df)
+    build_time = time.perf_counter() - start
+    print(f"{rows} rows, {len(downsampler.channels)} channels, {downsampler.get_level_count('SPEED_1')} levels")
+    print(f"Pyramid: built in {1000 * build_time:.0f} ms, {downsampler.get_memory_usage() / 2**20:.1f} MiB")
+
+    print(f"\n{'window':<20}{'level':>7}{'points/channel':>16}{'figure (ms)':>13}{'bytes':>14}")
+    raw = {channel: (df['MOD_TICK'].to_numpy(), df[channel].to_numpy()) for channel in CHANNELS}
+    raw_time, raw_size = measure(raw)
+    print(f"{'raw, full dump':<20}{'-':>7}{rows:>16}{1000 * raw_time:>13.0f}{raw_size:>14}")
+    x_start, x_end = downsampler.get_x_range()
+    for fraction in (1, 0.1, 0.01, 0.001):
+        window_end = x_start + int((x_end - x_start) * fraction)
+        start = time.perf_counter()
+        windows = {channel: downsampler.get_window(channel, x_start, window_end) for channel in CHANNELS}
+        query_time = time.perf_counter() - start
+        figure_time, size = measure({channel: (x, y) for channel, (x, y, _) in windows.items()})
+        level = windows['SPEED_1'][2]
+        print(f"{f'pyramid, {fraction:.1%}':<20}{level:>7}{len(windows['SPEED_1'][0]):>16}"
+              f"{1000 * (query_time + figure_time):>13.0f}{size:>14}")
+
+
+if __name__ == "__main__":
+    main()
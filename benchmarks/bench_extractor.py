@@ -0,0 +1,124 @@
+"""
+Benchmark for DataFrameExtractor.get_df_from_file.
+
+Compares the single-pass byte-buffer extractor against the previous
+two-pass pipeline (single column text read followed by a second
+pd.read_csv of the section) on a synthetic DMP dump.
+
+The single-pass extractor memory-maps the file, so its disk I/O shows up
+as the mapped file size rather than as read() syscalls. Both are reported
+so the totals are comparable.
+
+Usage (from the repository root):
+    python benchmarks/bench_extractor.py [size_in_mb]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.data_extractor.dataframe_extractor import DataFrameExtractor
+
+SAMPLE_DMP = ROOT_DIR / "csv" / "log0058_2024-10-06 22-41-51.csv"
+
+
+def legacy_get_df_from_file(file_path):
+    """Previous two-pass implementation, kept here for comparison only."""
+    df = pd.read_csv(file_path, header=None, names=['single_col'], sep='\0', skip_blank_lines=True)
+    df.iloc[:, 0] = df.iloc[:, 0].str.strip()
+    df = df[df.iloc[:, 0] != '']
+    df.iloc[:, 0] = df.iloc[:, 0].str.strip(' ;,')
+
+    header_line_idx, delimiter = None, None
+    for delim in (';', ','):
+        counts = df.iloc[:, 0].str.count(delim)
+        index = counts[counts > 2].index
+        if not index.empty:
+            header_line_idx, delimiter = index[0], delim
+            break
+
+    column_count = df.iloc[header_line_idx, 0].count(delimiter) + 1
+    column_counts = df.iloc[header_line_idx + 1:, 0].str.count(delimiter) + 1
+    different = np.where(column_counts != column_count)[0]
+    end = len(df) if len(different) == 0 else header_line_idx + different[0]
+
+    return pd.read_csv(file_path, skiprows=range(0, header_line_idx),
+                       nrows=end - header_line_idx, delimiter=delimiter).dropna(axis=1, how='all')
+
+
+def read_bytes_counter():
+    """Bytes read by this process so far (Linux only)."""
+    try:
+        with open('/proc/self/io') as io_stats:
+            for line in io_stats:
+                if line.startswith('rchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def make_synthetic_dump(path, size_mb):
+    with open(SAMPLE_DMP, 'r') as sample:
+        header, *rows = sample.read().splitlines()
+    block = '\n'.join(rows) + '\n'
+    repeats = max(1, int(size_mb * 1024 * 1024 / len(block)))
+    with open(path, 'w') as out:
+        out.write(header + '\n')
+        for _ in range(repeats):
+            out.write(block)
+
+
+def measure(func, file_path):
+    before = read_bytes_counter()
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = func(file_path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    after = read_bytes_counter()
+    bytes_read = after - before if before is not None and after is not None else None
+    return df, elapsed, peak, bytes_read
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic_dump.csv")
+        make_synthetic_dump(path, size_mb)
+        file_size = os.path.getsize(path)
+        print(f"Synthetic DMP file: {file_size / 1e6:.1f} MB")
+
+        results = {}
+        for name, func, mapped in (("two-pass (legacy)", legacy_get_df_from_file, 0),
+                                   ("single-pass", DataFrameExtractor.get_df_from_file, file_size)):
+            results[name] = measure(func, path) + (mapped,)
+
+        legacy_df = results["two-pass (legacy)"][0]
+        new_df = results["single-pass"][0]
+        # The extractor narrows DMP columns to the DMP schema, only the
+        # values have to match
+        pd.testing.assert_frame_equal(legacy_df, new_df, check_dtype=False)
+
+        print(f"{'method':<20}{'time (s)':>10}{'peak heap (MB)':>16}"
+              f"{'read() (MB)':>14}{'mapped (MB)':>14}{'total I/O (MB)':>16}")
+        for name, (df, elapsed, peak, bytes_read, mapped) in results.items():
+            if bytes_read is None:
+                read_mb, total_mb = "n/a", "n/a"
+            else:
+                read_mb, total_mb = f"{bytes_read / 1e6:.1f}", f"{(bytes_read + mapped) / 1e6:.1f}"
+            print(f"{name:<20}{elapsed:>10.2f}{peak / 1e6:>16.1f}"
+                  f"{read_mb:>14}{mapped / 1e6:>14.1f}{total_mb:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark for DMPProcessor.process_fill_vent_events.
+
+Compares the array based FILL/VENT event detection against the previous
+implementation, which sliced the DMP frame and took a diff() of every
+FILL interval in a Python loop, on a synthetic DMP log with millions of
+rows and thousands of FILL intervals per channel. Both must find the same
+events.
+
+Usage (from the repository root):
+    python benchmarks/bench_fill_vent.py [rows_in_millions] [events_per_channel]
+"""
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.data_processors.dmp_processor import DMPProcessor
+
+
+def legacy_process_fill_vent_events(df_dmp):
+    """Previous per-interval implementation, kept here for comparison only."""
+    result = {}
+    for i in range(1, 5):
+        fill_col, vent_col, time_col, mod_tick_col = f'FILL_{i}', f'VENT_{i}', 'Time', 'MOD_TICK'
+        if fill_col not in df_dmp.columns or vent_col not in df_dmp.columns:
+            logging.warning(f"Missing columns: {fill_col} or {vent_col}")
+            continue
+        df_subset = df_dmp[[time_col, mod_tick_col, fill_col, vent_col]]
+
+        fill_diff = df_subset[fill_col].diff().fillna(0)
+        fill_start_indices = fill_diff[fill_diff == 1].index
+        fill_end_indices = fill_diff[fill_diff == -1].index
+
+        events = []
+        for idx, start_idx in enumerate(fill_start_indices):
+            end_idx = fill_end_indices[idx] if idx < len(fill_end_indices) else df_subset.index[-1]
+            interval_df = df_subset.loc[start_idx:end_idx]
+
+            vent_start_idx = start_idx - 1 if start_idx > 0 else start_idx
+            vent_series = df_subset[vent_col].iloc[vent_start_idx:end_idx + 1].reset_index(drop=True)
+            vent_diff = vent_series.diff().fillna(vent_series.iloc[0])
+
+            events.append({
+                'start_time': interval_df.at[start_idx, time_col],
+                'end_time': interval_df.at[end_idx, time_col],
+                'mod_tick_start': interval_df.at[start_idx, mod_tick_col],
+                'mod_tick_end': interval_df.at[end_idx, mod_tick_col],
+                'vent_transition_count': int((vent_diff == 1).sum()),
+            })
+        result[f'FILL_{i}_VENT_{i}'] = events
+    return result
+
+
+def make_synthetic_dmp(rows, events_per_channel, seed=0):
+    """DMP columns needed by the detection, with FILL pulses of random length."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Time': np.arange(rows) / 10,
+        'MOD_TICK': (126450348 + 100 * np.arange(rows)).astype('int32'),
+    })
+    for i in range(1, 5):
+        # Row changes of FILL at sorted random positions, the first row is 0
+        changes = np.sort(rng.choice(np.arange(1, rows), size=2 * events_per_channel, replace=False))
+        toggles = np.zeros(rows, dtype=np.int8)
+        toggles[changes] = 1
+        df[f'FILL_{i}'] = (np.cumsum(toggles) % 2).astype('int8')
+        df[f'VENT_{i}'] = (rng.random(rows) < 0.01).astype('int8')
+    return df
+
+
+def measure(func, df):
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rows = int(float(sys.argv[1]) * 1e6) if len(sys.argv) > 1 else 5_000_000
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    df = make_synthetic_dmp(rows, events)
+    print(f"Synthetic DMP log: {rows} rows, {events} FILL intervals per channel")
+
+    results = {}
+    for name, func in (("per-interval (legacy)", legacy_process_fill_vent_events),
+                       ("vectorized", DMPProcessor.process_fill_vent_events)):
+        results[name] = measure(func, df)
+
+    legacy_events, new_events = results["per-interval (legacy)"][0], results["vectorized"][0]
+    assert legacy_events == new_events, "event detection results differ"
+
+    print(f"{'method':<24}{'time (s)':>10}{'events':>10}")
+    for name, (events_found, elapsed) in results.items():
+        print(f"{name:<24}{elapsed:>10.2f}{sum(map(len, events_found.values())):>10}")
+
+
+if __name__ == "__main__":
+    main()
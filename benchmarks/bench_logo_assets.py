@@ -0,0 +1,60 @@
+"""
+Benchmark for the logo drawn on every chart.
+
+Compares adding the logo to a figure as a PIL image, which Plotly encodes
+into a base64 PNG for every figure, against referencing the data URI the
+AssetRegistry encodes once per process. Reports the time spent adding the
+logo and the size of the serialized figure, which is what Streamlit ships
+to the browser, per figure and for a rerun drawing the given number of
+charts.
+
+Usage (from the repository root, where the logo is):
+    python benchmarks/bench_logo_assets.py [charts_per_rerun]
+"""
+import sys
+import time
+from pathlib import Path
+
+import plotly.graph_objects as go
+from PIL import Image
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from frontend.utils.asset_registry import AssetRegistry, LOGO_PATH
+
+
+def make_figure(logo_source):
+    fig = go.Figure(go.Bar(x=[f"Axle {axle}" for axle in range(1, 5)], y=[3, 1, 4, 1]))
+    fig.add_layout_image(dict(source=logo_source, xref="paper", yref="paper", x=0, y=1.2,
+                              sizex=0.12, sizey=0.1, xanchor="left", yanchor="top", layer="above"))
+    return fig
+
+
+def measure(logo_source, charts):
+    start = time.perf_counter()
+    figures = [make_figure(logo_source) for _ in range(charts)]
+    build_time = time.perf_counter() - start
+    return build_time, sum(len(fig.to_json()) for fig in figures)
+
+
+def main():
+    charts = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    logo = Image.open(LOGO_PATH)
+    start = time.perf_counter()
+    data_uri = AssetRegistry.get_logo()
+    encode_time = time.perf_counter() - start
+    print(f"Logo {LOGO_PATH}: {logo.width}x{logo.height} px, {Path(LOGO_PATH).stat().st_size} bytes on disk")
+    print(f"Registry: encoded once in {1000 * encode_time:.1f} ms, {len(data_uri)} bytes as data URI")
+
+    results = {"PIL image per figure": measure(logo, charts), "registry data URI": measure(data_uri, charts)}
+    print(f"\n{charts} charts per rerun")
+    print(f"{'logo source':<24}{'build (ms)':>12}{'bytes/figure':>14}{'bytes/rerun':>14}")
+    for name, (build_time, size) in results.items():
+        print(f"{name:<24}{1000 * build_time:>12.1f}{size // charts:>14}{size:>14}")
+    saved = results["PIL image per figure"][1] - results["registry data URI"][1]
+    print(f"\nSerialized bytes saved per rerun: {saved} ({saved / results['PIL image per figure'][1]:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark for merging the per-file dataframes of a folder.
+
+Compares the previous accumulation (pd.concat of the merged frame with
+every new file) against FrameMerger, which merges all files with a single
+concatenation, for 10, 100 and 1000 synthetic DMP files.
+
+The synthetic files are slices of the sample DMP log held in memory, so
+only the merge stage is measured.
+
+Usage (from the repository root):
+    python benchmarks/bench_merge.py [rows_per_file]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.data_extractor.dataframe_extractor import DataFrameExtractor
+from backend.data_extractor.frame_merger import FrameMerger
+
+SAMPLE_DMP = ROOT_DIR / "csv" / "log0058_2024-10-06 22-41-51.csv"
+FILE_COUNTS = (10, 100, 1000)
+
+
+def legacy_merge(frames):
+    """Previous accumulation, kept here for comparison only."""
+    merged = pd.DataFrame()
+    for _, df in frames:
+        merged = pd.concat([merged, df])
+    merged.reset_index(drop=True, inplace=True)
+    return merged
+
+
+def batched_merge(frames):
+    merger = FrameMerger()
+    for source, df in frames:
+        merger.add(source, df)
+    merged, _ = merger.build()
+    return merged
+
+
+def make_synthetic_frames(sample, file_count, rows_per_file):
+    repeats = -(-rows_per_file // len(sample))
+    rows = pd.concat([sample] * repeats, ignore_index=True).iloc[:rows_per_file]
+    return [(f"log{i:04d}.csv", rows.copy()) for i in range(file_count)]
+
+
+def measure(func, frames):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = func(frames)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak
+
+
+def main():
+    rows_per_file = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    sample = DataFrameExtractor.get_df_from_file(SAMPLE_DMP)
+    print(f"Synthetic DMP files: {rows_per_file} rows x {sample.shape[1]} columns each")
+
+    print(f"{'files':>6}{'method':>14}{'time (s)':>10}{'peak heap (MB)':>16}")
+    for file_count in FILE_COUNTS:
+        frames = make_synthetic_frames(sample, file_count, rows_per_file)
+        results = {}
+        for name, func in (("concat loop", legacy_merge), ("FrameMerger", batched_merge)):
+            results[name] = measure(func, frames)
+
+        pd.testing.assert_frame_equal(results["concat loop"][0], results["FrameMerger"][0])
+        for name, (_, elapsed, peak) in results.items():
+            print(f"{file_count:>6}{name:>14}{elapsed:>10.3f}{peak / 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark for the streaming ingestion mode of DataHandler.
+
+Loads folders holding one synthetic DMP dump of growing size, once with
+the DMP rows kept in memory and once streamed in chunks, and reports the
+peak Python heap of each load. The streamed peak should stay flat while
+the in-memory one grows with the dump.
+
+Usage (from the repository root):
+    python benchmarks/bench_streaming.py [size_in_mb ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.data_handler import DataHandler
+
+SAMPLE_DMP = ROOT_DIR / "csv" / "log0058_2024-10-06 22-41-51.csv"
+CONFIG_PATH = ROOT_DIR / "src" / "config.json"
+
+
+def make_synthetic_dump(path, size_mb):
+    with open(SAMPLE_DMP, 'r') as sample:
+        header, *rows = sample.read().splitlines()
+    block = '\n'.join(rows) + '\n'
+    repeats = max(1, int(size_mb * 1024 * 1024 / len(block)))
+    with open(path, 'w') as out:
+        out.write(header + '\n')
+        for _ in range(repeats):
+            out.write(block)
+
+
+def measure(folder, streaming):
+    tracemalloc.start()
+    start = time.perf_counter()
+    dh = DataHandler(folder, str(CONFIG_PATH), cache_dir=None, streaming=streaming)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dh, elapsed, peak
+
+
+def main():
+    sizes = [float(size) for size in sys.argv[1:]] or [20, 80, 160]
+    print(f"{'dump (MB)':>10}{'mode':>12}{'time (s)':>10}{'peak heap (MB)':>16}")
+    for size_mb in sizes:
+        with tempfile.TemporaryDirectory() as folder:
+            make_synthetic_dump(os.path.join(folder, "log0001.csv"), size_mb)
+            results = {}
+            for name, streaming in (("in memory", False), ("streaming", True)):
+                results[name] = measure(folder, streaming)
+
+            in_memory, streamed = results["in memory"][0], results["streaming"][0]
+            assert in_memory.fill_vent_events == streamed.fill_vent_events
+            assert in_memory.dmp_freq_summary.equals(streamed.dmp_freq_summary)
+            for name, (_, elapsed, peak) in results.items():
+                print(f"{size_mb:>10.0f}{name:>12}{elapsed:>10.2f}{peak / 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark for the SUMMARY_TAB table builder.
+
+Compares SummaryTableBuilder, which compiles the config once into index
+matrices and fills every table with a gather, against the previous
+get_tables, which appended the rows one by one and re-indexed the whole
+frequency summary for every row. Configs with a growing number of tables
+and rows are built over the same synthetic frequency summary. Both must
+produce the same tables.
+
+The gather does not depend on the size of the config, what is left of the
+build time is wrapping every table in its dataframe, a constant cost per
+table that does not grow with its number of rows.
+
+Usage (from the repository root):
+    python benchmarks/bench_summary_tables.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.json_config_loader import JSONConfigReader
+from backend.data_processors.table_maker_for_summary_tab import SummaryTableBuilder
+
+AXLES = 4
+ERROR_NAMES = 5_000
+SIZES = [(4, 3), (20, 10), (100, 25), (400, 50)]
+
+
+def legacy_get_tables(ecl_freq_summary, jcr):
+    """Previous row by row implementation, kept here for comparison only."""
+    error_desc_col = jcr.get_error_description()
+    df_dicts = dict()
+    for table_name, table_details in jcr.get_summary_tab().items():
+        df = pd.DataFrame(columns=table_details["COLUMNS"])
+        for row_name, row_details in table_details.items():
+            if row_name != "COLUMNS":
+                freqs = ecl_freq_summary.set_index(error_desc_col).reindex(row_details)['Frequency']
+                df.loc[len(df)] = [row_name] + freqs.fillna(0.0).astype(int).reset_index(drop=True).tolist()
+        df_dicts[table_name] = df
+    return df_dicts
+
+
+def make_config(tables, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    summary_tab = {}
+    for table in range(tables):
+        details = {"COLUMNS": ["Description"] + [f"Axle {axle}" for axle in range(1, AXLES + 1)]}
+        for row in range(rows):
+            details[f"Row {row}"] = [f"E_{code}" for code in rng.integers(0, ERROR_NAMES, AXLES)]
+        summary_tab[f"Table {table}"] = details
+    return JSONConfigReader({"ERROR_DESCRIPTION": "Description", "SUMMARY_TAB": summary_tab})
+
+
+def make_summary(seed=0):
+    rng = np.random.default_rng(seed)
+    # Only some of the configured errors occur in the data
+    codes = np.flatnonzero(rng.random(ERROR_NAMES) < 0.5)
+    return pd.DataFrame({'Description': [f"E_{code}" for code in codes],
+                         'Frequency': rng.integers(1, 100, len(codes))})
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    summary = make_summary()
+    print(f"{'tables':>8}{'rows':>8}{'legacy (s)':>12}{'compile (s)':>13}{'build (s)':>11}"
+          f"{'build/table (ms)':>18}")
+    for tables, rows in SIZES:
+        jcr = make_config(tables, rows)
+        legacy_tables, legacy_time = measure(legacy_get_tables, summary, jcr)
+        builder, compile_time = measure(SummaryTableBuilder, jcr)
+        new_tables, build_time = measure(builder.build, summary)
+
+        assert list(legacy_tables) == list(new_tables)
+        for name in legacy_tables:
+            pd.testing.assert_frame_equal(legacy_tables[name], new_tables[name], check_dtype=False)
+        print(f"{tables:>8}{rows:>8}{legacy_time:>12.3f}{compile_time:>13.3f}{build_time:>11.3f}"
+              f"{1000 * build_time / tables:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
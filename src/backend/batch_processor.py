@@ -0,0 +1,228 @@
+import glob
+import json
+import logging
+import os
+import re
+import time
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tqdm import tqdm
+from backend.utils.logging_config import configure_logging
+from backend.data_handler import DataHandler
+from backend.data_extractor.parsed_file_cache import FEATHER_AVAILABLE
+
+# Writers of every output format, by name: file extension and write function
+OUTPUT_FORMATS = {
+    'csv': ('.csv', lambda df, path: df.to_csv(path, index=False)),
+    'json': ('.json', lambda df, path: df.to_json(path, orient='records', indent=2)),
+    'feather': ('.feather', lambda df, path: df.reset_index(drop=True).to_feather(path)),
+}
+
+def _process_folder(folder_path, output_dir, json_config_path, formats, streaming):
+    """
+    Load a folder and write its products.
+
+    Kept at module level so that it can be pickled and run inside
+    a worker process of the batch pool.
+
+    Args:
+        folder_path (str): Folder containing the CSV files
+        output_dir (str): Folder the products are written to
+        json_config_path (str): Path to the JSON config
+        formats (list): Names of the OUTPUT_FORMATS to write
+        streaming (bool): Stream the DMP files, see DataHandler
+
+    Returns:
+        dict: Folder, output folder, number of ECL and DMP rows, files
+              written, processing time in seconds and error message (None
+              when the folder was processed)
+    """
+    result = {'folder': folder_path, 'output': output_dir, 'ecl_rows': 0, 'dmp_rows': 0,
+              'files': 0, 'seconds': 0.0, 'error': None}
+    start = time.perf_counter()
+    try:
+        # The folders are processed in parallel, so every folder is read by a
+        # single process. The parsed file cache is safe to share between them.
+        dh = DataHandler(folder_path, json_config_path, max_workers=1, streaming=streaming)
+        result['ecl_rows'] = len(dh.ecl)
+        result['dmp_rows'] = int(dh.dmp_sources['Stop'].iloc[-1]) if dh.has_dmp_data() else 0
+        if result['ecl_rows'] == 0 and result['dmp_rows'] == 0:
+            raise ValueError("No ECL or DMP data found")
+        result['files'] = BatchProcessor.write_products(BatchProcessor.get_products(dh), output_dir, formats)
+        dh.print_report(os.path.join(output_dir, BatchProcessor.FOLDER_REPORT_FILE))
+        result['files'] += 1
+    except Exception as e:
+        logging.error(f"Batch processing of {folder_path} failed: {e}")
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+class BatchProcessor:
+    """
+    Non-interactive processing of many folders.
+
+    Every folder is loaded by its own DataHandler in a worker process, and
+    its frequency summaries, summary tables, fill/vent events and processing
+    report are written to a folder of its own in the output folder. A report
+    of every folder and of the throughput of the whole batch is written next
+    to them.
+    """
+
+    REPORT_FILE = 'batch_report.json'
+    # Written by DataHandler.print_report() into the output folder of every folder
+    FOLDER_REPORT_FILE = 'data_processing_report.log'
+
+    @staticmethod
+    def expand_folders(patterns):
+        """
+        Expand folder paths and glob patterns into a list of folders.
+
+        Args:
+            patterns (list): Folder paths or glob patterns, '**' matches
+                             nested folders
+
+        Returns:
+            list: Absolute paths of the matching folders, in the order of the
+                  patterns and without duplicates
+        """
+        folders = []
+        seen = set()
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+            for match in matches:
+                folder = os.path.abspath(match)
+                if os.path.isdir(folder) and folder not in seen:
+                    seen.add(folder)
+                    folders.append(folder)
+                elif not os.path.isdir(folder):
+                    logging.warning(f"Skipping {match}, not a folder")
+        return folders
+
+    @staticmethod
+    def get_products(dh: DataHandler):
+        """
+        Get the products of a loaded folder as dataframes.
+
+        Args:
+            dh (DataHandler): Loaded folder
+
+        Returns:
+            dict: Dataframe of every product, by output file name. Summary
+                  tables whose names give the same file name are numbered.
+        """
+        products = {
+            'ecl_freq_summary': dh.ecl_freq_summary,
+            'dmp_freq_summary': dh.dmp_freq_summary.rename_axis('Column').reset_index(name='Total'),
+        }
+        for table_name, table in dh.tables.items():
+            name = 'summary_table_' + re.sub(r'\W+', '_', table_name).strip('_').lower()
+            candidate, number = name, 2
+            while candidate in products:
+                candidate, number = f"{name}_{number}", number + 1
+            products[candidate] = table
+        events = [dict(Pair=key, **event) for key, pair_events in dh.fill_vent_events.items() for event in pair_events]
+        products['fill_vent_events'] = pd.DataFrame(events, columns=None if events else ['Pair'])
+        return products
+
+    @staticmethod
+    def write_products(products, output_dir, formats):
+        """
+        Write products in every requested format.
+
+        Args:
+            products (dict): Dataframe of every product, by file name
+            output_dir (str): Folder to write to, created if missing
+            formats (list): Names of the OUTPUT_FORMATS to write
+
+        Returns:
+            int: Number of files written
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        written = 0
+        for name, df in products.items():
+            for output_format in formats:
+                extension, write = OUTPUT_FORMATS[output_format]
+                write(df, os.path.join(output_dir, name + extension))
+                written += 1
+        return written
+
+    @staticmethod
+    def __get_output_dirs(folders, output_dir):
+        """Output folder of every folder, numbered when folder names repeat."""
+        output_dirs = []
+        used = set()
+        for folder in folders:
+            name = os.path.basename(folder) or 'root'
+            candidate, number = name, 2
+            while candidate in used:
+                candidate, number = f"{name}_{number}", number + 1
+            used.add(candidate)
+            output_dirs.append(os.path.join(output_dir, candidate))
+        return output_dirs
+
+    @staticmethod
+    def run(patterns, output_dir, json_config_path, formats=('csv',), max_workers=1, streaming=False):
+        """
+        Process every folder matching the patterns.
+
+        Args:
+            patterns (list): Folder paths or glob patterns
+            output_dir (str): Folder the outputs and the report are written to
+            json_config_path (str): Path to the JSON config
+            formats (list): Names of the OUTPUT_FORMATS to write
+            max_workers (int): Number of folders processed in parallel, None
+                uses one worker per CPU core
+            streaming (bool): Stream the DMP files, see DataHandler
+
+        Returns:
+            dict: Batch report, with the result of every folder in 'folders'
+
+        Raises:
+            ValueError: If a format is unknown or unavailable
+        """
+        configure_logging()
+        formats = list(dict.fromkeys(formats))
+        unknown = [output_format for output_format in formats if output_format not in OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown output formats: {unknown}")
+        if 'feather' in formats and not FEATHER_AVAILABLE:
+            raise ValueError("pyarrow is not installed, feather output is not available")
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        folders = BatchProcessor.expand_folders(patterns)
+        output_dirs = BatchProcessor.__get_output_dirs(folders, output_dir)
+        json_config_path = os.path.abspath(json_config_path)
+        os.makedirs(output_dir, exist_ok=True)
+        logging.info(f'Batch processing {len(folders)} folders with {max_workers} worker processes')
+
+        start = time.perf_counter()
+        results = []
+        if folders:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_logging) as executor:
+                futures = [executor.submit(_process_folder, folder, folder_output_dir, json_config_path,
+                                           formats, streaming)
+                           for folder, folder_output_dir in zip(folders, output_dirs)]
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Processing Folders"):
+                    results.append(future.result())
+        elapsed = time.perf_counter() - start
+
+        # Reported in the order of the patterns, whichever worker finished first
+        order = {folder: position for position, folder in enumerate(folders)}
+        results.sort(key=lambda result: order[result['folder']])
+        processed = [result for result in results if result['error'] is None]
+        rows = sum(result['ecl_rows'] + result['dmp_rows'] for result in processed)
+        report = {
+            'folders': results,
+            'processed': len(processed),
+            'failed': len(results) - len(processed),
+            'rows': rows,
+            'seconds': elapsed,
+            'folders_per_second': len(processed) / elapsed if elapsed > 0 else 0.0,
+            'rows_per_second': rows / elapsed if elapsed > 0 else 0.0,
+            'max_workers': max_workers,
+            'formats': formats,
+        }
+        with open(os.path.join(output_dir, BatchProcessor.REPORT_FILE), 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+        return report
@@ -1,41 +1,74 @@
 import logging
-import pandas as pd
 from enum import Enum
+from backend.data_extractor.dmp_schema import DMPSchema
 
 class DataFrameClasses(Enum):
     ECL = 1
     DMP = 2
     UNKNOWN = 3
 
- 
+
 class DataFrameClassifier:
+    # Number of bytes read from the start of a file by classify_file
+    PROBE_SIZE = 4096
+
+    # Banner line on top of error code listings
+    ECL_BANNER = b'ERROR CODE LISTING'
+    # Columns that identify the header of an error code listing
+    ECL_KEY_COLUMNS = ('Code(hex)', 'Ticks(hex)')
+
     @staticmethod
-    def get_dataframe_class(df: pd.DataFrame = None):
+    def __find_header(lines):
+        # Same heuristic as the extractor: the header is the first line with
+        # more than two delimiters, semicolons take precedence over commas
+        for delimiter in (';', ','):
+            for line in lines:
+                stripped = line.strip().strip(' ;,')
+                if stripped.count(delimiter) > 2:
+                    return delimiter, [col.strip() for col in stripped.split(delimiter)]
+        return None, []
+
+    @staticmethod
+    def classify_file(file_path, probe_size=PROBE_SIZE):
         """
-        Determine file class with more robust type detection.
+        Determine the file class from the first bytes of a file only, before
+        anything is parsed. Error code listings are recognized by their banner
+        or header columns, DMP logs by their header columns. Everything else,
+        e.g. unrelated CSV files in the folder, is UNKNOWN.
         
         Args:
             file_path (str): Path to the CSV file
+            probe_size (int): Number of bytes to look at
         
         Returns:
-            FileClasses: Detected file class
+            DataFrameClasses: Detected file class
         """
         try:
-            # Validate readability
-            if df.empty:
-                logging.warning(f"Empty dataframe passed. Unable to classify.")
+            with open(file_path, 'rb') as file:
+                probe = file.read(probe_size)
+                is_complete = file.read(1) == b''
+            if not probe.strip():
+                logging.warning(f"Empty file {file_path}. Unable to classify.")
                 return DataFrameClasses.UNKNOWN
 
-            first_row = df.iloc[0]  # Get the first row
-            all_numeric = first_row.apply(lambda x: x.isnumeric() if isinstance(x, str) else isinstance(x, (int, float))).all()
-            if all_numeric:
-                return DataFrameClasses.DMP
-            else:
+            if DataFrameClassifier.ECL_BANNER in probe:
                 return DataFrameClasses.ECL
-            # Implement UNKNOWN condition
-            # return DataFrameClasses.UNKNOWN
 
-        except Exception as e:
-            logging.error(f"Unexpected error in file classification: {e}")
+            # A line cut off by the end of the probe is not looked at
+            lines = probe.decode('latin-1').splitlines()
+            if not is_complete and not probe.endswith(b'\n'):
+                lines = lines[:-1]
+            delimiter, columns = DataFrameClassifier.__find_header(lines)
+            if delimiter is None:
+                logging.warning(f"No header found in the first {probe_size} bytes of {file_path}")
+                return DataFrameClasses.UNKNOWN
+
+            if all(col in columns for col in DataFrameClassifier.ECL_KEY_COLUMNS):
+                return DataFrameClasses.ECL
+            if DMPSchema.is_dmp_header(columns):
+                return DataFrameClasses.DMP
             return DataFrameClasses.UNKNOWN
 
+        except Exception as e:
+            logging.error(f"Unexpected error in file classification of {file_path}: {e}")
+            return DataFrameClasses.UNKNOWN
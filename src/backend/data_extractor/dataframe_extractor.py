@@ -1,152 +1,276 @@
+import mmap
+import os
+from contextlib import contextmanager
 import pandas as pd
 import numpy as np
+from backend.data_extractor.dataframe_classifier import DataFrameClasses
+from backend.data_extractor.dmp_schema import DMPSchema
+from backend.data_extractor.ecl_decoder import ECLDecoder
 # Defning all the methods as static as
 # this class is not meant to stay for
 # time. It is meant for importing purposes
 # only.
 
 class DataFrameExtractor:
+    # Lines are scanned in blocks of roughly this many bytes so that
+    # the temporary numpy arrays stay small even for very large dumps.
+    SCAN_BLOCK_SIZE = 1 << 22  # 4 MiB
+
+    # Default number of rows per chunk when a file is streamed
+    DEFAULT_CHUNK_ROWS = 100_000
+
+    # Characters stripped from both ends of a line before counting
+    # delimiters (whitespace followed by ' ;,' in the old text pipeline).
+    __TRIM_CHARS = b' \t\r\n\x0b\x0c;,'
+    __IS_TRIM_CHAR = np.isin(np.arange(256), np.frombuffer(__TRIM_CHARS, dtype=np.uint8))
+
     @staticmethod
-    def __read_csv_single_column(file_path):
+    @contextmanager
+    def __map_file(file_path):
         """
-        Read a CSV file as a single column, preserving entire line contents
-        and skipping blank lines.
+        Memory-map the complete file as a read-only raw byte buffer. The
+        same mapping is scanned for the section boundaries and then handed
+        to the parser, so the file is only read from disk once.
 
         Parameters:
         file_path (str): Path to the CSV file
 
-        Returns:
-        pandas.DataFrame: DataFrame with entire line contents in a single column
+        Yields:
+        mmap.mmap: Read-only buffer over the file contents
         """
-        try:
-            # Read the file with all columns as text and no parsing
-            df = pd.read_csv(file_path,
-                             header=None,  # No header
-                             names=['single_col'],  # Column name
-                             sep='\0',  # Use newline as separator to read full lines
-                             skip_blank_lines=True,
-                             )
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                raise ValueError(f"File '{file_path}' is empty.")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield buffer
+            finally:
+                buffer.close()
 
-            # Remove any potential whitespace from the beginning and end of lines
-            df.iloc[:, 0] = df.iloc[:, 0].str.strip()
+    @staticmethod
+    def __iter_line_stats(buffer, delimiter, offset=0):
+        """
+        Walk the buffer line by line (in blocks) and compute, for every line,
+        the number of delimiters left after trimming the line.
 
-            # Remove any completely blank lines that might have remained
-            df = df[df.iloc[:, 0] != '']
+        Parameters:
+        buffer (mmap.mmap): Raw file contents
+        delimiter (str): Delimiter to count (';' or ',')
+        offset (int): Byte offset to start scanning from (must be a line start)
 
-            return df
+        Yields:
+        tuple: (line_starts, delimiter_counts, blank_mask) numpy arrays for
+               one block, with line starts as absolute byte offsets
+        """
+        view = memoryview(buffer)
+        size = len(buffer)
+        delimiter_byte = ord(delimiter)
 
-        except FileNotFoundError:
-            print(f"Error: File '{file_path}' not found.")
-            return pd.DataFrame()
-        except Exception as e:
-            print(f"An error occurred while reading the file: {e}")
-            return pd.DataFrame()
+        while offset < size:
+            stop = min(offset + DataFrameExtractor.SCAN_BLOCK_SIZE, size)
+            if stop < size:
+                # Always end a block on a line boundary
+                newline = buffer.rfind(b'\n', offset, stop)
+                if newline == -1:
+                    newline = buffer.find(b'\n', stop)
+                stop = size if newline == -1 else newline + 1
+
+            block = np.frombuffer(view[offset:stop], dtype=np.uint8)
+            newlines = np.flatnonzero(block == 10)
+            starts = np.concatenate(([0], newlines + 1))
+            ends = np.concatenate((newlines, [len(block)]))
+            if starts[-1] == len(block):
+                # Block ends with a newline, no trailing partial line
+                starts, ends = starts[:-1], ends[:-1]
+
+            # Raw delimiter count of every line
+            counts = np.add.reduceat(block == delimiter_byte, starts, dtype=np.int64)
+            blank = np.zeros(len(starts), dtype=bool)
+
+            # Only lines that start or end with a trim character (or are
+            # empty) need trimming. These are rare (header with a trailing
+            # ';', blank lines...) so they are handled one by one.
+            ends = ends - (block[np.maximum(ends - 1, 0)] == 13) * (ends > starts)
+            empty = ends <= starts
+            needs_trim = empty.copy()
+            needs_trim[~empty] = (DataFrameExtractor.__IS_TRIM_CHAR[block[starts[~empty]]]
+                                  | DataFrameExtractor.__IS_TRIM_CHAR[block[ends[~empty] - 1]])
+            for idx in np.flatnonzero(needs_trim):
+                line = bytes(view[offset + starts[idx]:offset + ends[idx]])
+                blank[idx] = line.strip() == b''
+                counts[idx] = line.strip(DataFrameExtractor.__TRIM_CHARS).count(delimiter_byte)
+
+            yield starts + offset, counts, blank
+            offset = stop
 
     @staticmethod
-    def __find_start_index(df):
+    def __find_start_index(buffer):
         """
-        Find the first line index that contains ';' or ',' as a delimiter 
-        with more than 2 occurrences using pandas single-column DataFrame.
+        Find the first line that contains ';' or ',' as a delimiter
+        with more than 2 occurrences.
 
         Parameters:
-        file_path (str): Path to the CSV file
+        buffer (mmap.mmap): Raw file contents
 
         Returns:
-        int: Index of the first line with delimiter (0-based), or -1 if not found
+        int: Byte offset of the header line, or None if not found
         str: The detected delimiter (';' or ',')
+        int: Number of delimiters in the (trimmed) header line
         """
-        try:
-            # Apply delimiter counting
-            semicolon_counts = df.iloc[:, 0].str.count(';')
-            comma_counts = df.iloc[:, 0].str.count(',')
-            # print(semicolon_counts, semicolon_counts)
-            # Find first line with more than 2 semicolons
-            # An heuristic measure that the header row will
-            # contain more than two columns hence, more than
-            # two delimiters
-            # display(semicolon_counts)
-            # display(comma_counts)
-
-            semicolon_index = semicolon_counts[semicolon_counts > 2].index
-            if not semicolon_index.empty:
-                return semicolon_index[0], ';'
-
-            # Find first line with more than 2 commas
-            comma_index = comma_counts[comma_counts > 2].index
-            if not comma_index.empty:
-                return comma_index[0], ','
-
-            # If no line with delimiter found
-            return None, None
-
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None, None
+        # An heuristic measure that the header row will
+        # contain more than two columns hence, more than
+        # two delimiters. Semicolons take precedence over
+        # commas anywhere in the file.
+        for delimiter in (';', ','):
+            if buffer.find(delimiter.encode()) == -1:
+                continue
+            for starts, counts, blank in DataFrameExtractor.__iter_line_stats(buffer, delimiter):
+                candidates = np.flatnonzero(~blank & (counts > 2))
+                if len(candidates) > 0:
+                    idx = candidates[0]
+                    return int(starts[idx]), delimiter, int(counts[idx])
+
+        # If no line with delimiter found
+        return None, None, None
 
     @staticmethod
-    def __find_end_index(df, delimiter, header_line_idx):
+    def __find_end_index(buffer, delimiter, header_offset, header_count):
         """
-        Efficiently detect the end of the upper section based on column count consistency
-        using pandas vectorized operations.
+        Detect the end of the upper section based on column count consistency
+        with the header line.
 
         Parameters:
-        df (pandas.DataFrame): DataFrame with single column
+        buffer (mmap.mmap): Raw file contents
         delimiter (str): Delimiter used in the file
+        header_offset (int): Byte offset of the header line
+        header_count (int): Number of delimiters in the header line
 
         Returns:
-        int: Index marking the end of the upper section
+        int: Number of data rows in the section, or None if the section
+             runs until the end of the file
         """
-        # Get the column count for the header line
-        column_count = df.iloc[header_line_idx, 0].count(delimiter) + 1
-
-        # Vectorized column count calculation
-        column_counts = df.iloc[header_line_idx+1:, 0].str.count(delimiter) + 1
-
-        # Find indices where column count differs
-        different_count_indices = np.where(column_counts != column_count)[0]
-    
-        # If no different count found, return end of DataFrame
-        if len(different_count_indices) == 0:
-            return len(df)
-        
-        # Return the first index where column count differs
-        return header_line_idx + different_count_indices[0]
+        newline = buffer.find(b'\n', header_offset)
+        if newline == -1:
+            return None
 
-    @staticmethod
-    def __extract_main_section(df, file_path):
+        data_rows = 0
+        for starts, counts, blank in DataFrameExtractor.__iter_line_stats(buffer, delimiter, newline + 1):
+            different = np.flatnonzero(~blank & (counts != header_count))
+            if len(different) > 0:
+                return data_rows + int(np.count_nonzero(~blank[:different[0]]))
+            data_rows += int(np.count_nonzero(~blank))
 
-        delimiter = None
-        header_line_idx = None
+        # If no different count found, the section runs till the end
+        return None
 
+    @staticmethod
+    def __locate_main_section(buffer):
         # Detect delimiter and header line
-        header_line_idx, delimiter = DataFrameExtractor.__find_start_index(df)
+        header_offset, delimiter, header_count = DataFrameExtractor.__find_start_index(buffer)
 
-        if header_line_idx is None or delimiter is None:
+        if header_offset is None or delimiter is None:
             raise ValueError(
                 "Failed to locate a valid header or delimiter in the file.")
 
-        main_section_end = DataFrameExtractor.__find_end_index(df, delimiter, header_line_idx)
+        nrows = DataFrameExtractor.__find_end_index(buffer, delimiter, header_offset, header_count)
+
+        # The mapping is file-like, so positioning it at the header feeds
+        # the located section straight to the parser without copying it.
+        buffer.seek(header_offset)
+        return delimiter, nrows
+
+    @staticmethod
+    def __read_header(buffer, delimiter):
+        # Parse only the header line, then rewind to it
+        header_offset = buffer.tell()
+        columns = pd.read_csv(buffer, nrows=0, delimiter=delimiter).columns
+        buffer.seek(header_offset)
+        return columns
+
+    @staticmethod
+    def __is_dmp_section(buffer, delimiter, df_class):
+        # Files classified up front are not looked at again
+        if df_class is None or df_class == DataFrameClasses.UNKNOWN:
+            return DMPSchema.is_dmp_header(DataFrameExtractor.__read_header(buffer, delimiter))
+        return df_class == DataFrameClasses.DMP
+
+    @staticmethod
+    def __extract_main_section(buffer, file_path=None, df_class=None):
+        delimiter, nrows = DataFrameExtractor.__locate_main_section(buffer)
+
+        if DataFrameExtractor.__is_dmp_section(buffer, delimiter, df_class):
+            return DataFrameExtractor.__parse_dmp_section(buffer, delimiter, nrows, file_path)
+        return DataFrameExtractor.__parse_ecl_section(buffer, delimiter, nrows)
+
+    @staticmethod
+    def __parse_ecl_section(buffer, delimiter, nrows):
         df_ecl_fmtd = pd.read_csv(
-                            file_path, 
-                            skiprows=range(0, header_line_idx),        # Skip rows before the start line
-                            nrows=main_section_end - header_line_idx,  # Read only the specified number of rows
+                            buffer,
+                            nrows=nrows,               # Read only the rows of the main section
                             delimiter=delimiter
                         )
+        return ECLDecoder.apply(df_ecl_fmtd.dropna(axis=1, how='all'))
 
-        return df_ecl_fmtd.dropna(axis=1, how='all')
+    @staticmethod
+    def __parse_dmp_section(buffer, delimiter, nrows, file_path=None):
+        # DMP sections are parsed in chunks and every chunk is narrowed to
+        # the DMP schema right away, so the int64/float64 version of the
+        # whole section never exists. The dtype argument of read_csv is not
+        # used since it silently wraps values that do not fit.
+        bytes_before, chunks = 0, []
+        with pd.read_csv(buffer, nrows=nrows, delimiter=delimiter,
+                         chunksize=DataFrameExtractor.DEFAULT_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                bytes_before += chunk.memory_usage(index=False).sum()
+                chunks.append(DMPSchema.apply(chunk))
+        if not chunks:
+            return pd.DataFrame()
+        df_dmp = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+        DMPSchema.log_memory_reduction(file_path, bytes_before, df_dmp.memory_usage(index=False).sum())
+
+        return df_dmp.dropna(axis=1, how='all')
 
     @staticmethod
-    def __trim_df(df):
-        chars_to_trim = ' ;,'
+    def get_df_from_file(file_path, df_class=None):
+        """
+        Parse the main section of a file.
+
+        Parameters:
+        file_path (str): Path to the CSV file
+        df_class (DataFrameClasses): Class of the file if it is already known
+                                     (see DataFrameClassifier.classify_file),
+                                     otherwise it is told from the header
 
-        # Use str.strip() to remove both leading and trailing characters
-        df.iloc[:, 0] = df.iloc[:, 0].str.strip(
-            chars_to_trim)  
+        Returns:
+        pd.DataFrame: DMP sections narrowed to the DMP schema, other sections
+                      with the decoded ECL columns
+        """
+        with DataFrameExtractor.__map_file(file_path) as buffer:
+            df = DataFrameExtractor.__extract_main_section(buffer, file_path, df_class)
         return df
 
     @staticmethod
-    def get_df_from_file(file_path):
-        df: pd.DataFrame = DataFrameExtractor.__read_csv_single_column(file_path=file_path)
-        df = DataFrameExtractor.__trim_df(df)
-        df = DataFrameExtractor.__extract_main_section(df, file_path)
-        return df
\ No newline at end of file
+    def iter_df_chunks(file_path, chunk_rows=DEFAULT_CHUNK_ROWS, df_class=None):
+        """
+        Parse the main section of a file in chunks of a fixed number of rows,
+        so that memory use does not depend on the length of the file. DMP
+        chunks are narrowed to the DMP schema, other chunks get the decoded
+        ECL columns.
+
+        Unlike get_df_from_file, empty columns are not dropped since that
+        can only be decided once the whole file is read.
+
+        Parameters:
+        file_path (str): Path to the CSV file
+        chunk_rows (int): Number of rows per chunk
+        df_class (DataFrameClasses): Class of the file if it is already known
+
+        Yields:
+        pd.DataFrame: Consecutive chunks of the main section
+        """
+        with DataFrameExtractor.__map_file(file_path) as buffer:
+            delimiter, nrows = DataFrameExtractor.__locate_main_section(buffer)
+            is_dmp = DataFrameExtractor.__is_dmp_section(buffer, delimiter, df_class)
+            with pd.read_csv(buffer, nrows=nrows, delimiter=delimiter, chunksize=chunk_rows) as reader:
+                for chunk in reader:
+                    yield DMPSchema.apply(chunk) if is_dmp else ECLDecoder.apply(chunk)
@@ -0,0 +1,130 @@
+import logging
+import re
+import numpy as np
+import pandas as pd
+
+class DMPSchema:
+    """
+    Narrow dtypes for the known columns of DMP logs.
+
+    pd.read_csv gives every numeric column int64 or float64, while most DMP
+    channels are 0/1 flags or small integers. Every known column is given
+    the narrowest dtype listed here. If a value does not fit, the next wider
+    dtype is used instead, so no value is ever changed. Columns holding
+    missing values and unknown columns are left as parsed.
+
+    Per-axle channels of vehicles with more than four axles (FILL_5,
+    SPEED_6...) get the dtype of their channel through CHANNEL_DTYPES.
+    """
+
+    FLAG_COLUMNS = ['DEV_ON', 'V5', 'V45', 'ZEROSPD', 'WSP_FAIL', 'V5_2', 'V30', 'V5_1',
+                    'FILL_1', 'VENT_1', 'FILL_2', 'VENT_2', 'FILL_3', 'VENT_3', 'FILL_4', 'VENT_4',
+                    'SD_TR_SLIDE', 'SD_TR_ERR']
+    SPEED_COLUMNS = ['REF_SPEED', 'RF_SP_NF20', 'SPEED_1', 'SPEED_2', 'SPEED_3', 'SPEED_4',
+                     'SP_1_NF20', 'SP_2_NF20', 'SP_3_NF20', 'SP_4_NF20']
+    ACCELERATION_COLUMNS = ['ACC_1', 'ACC_2', 'ACC_3', 'ACC_4']
+    DIAGNOSTIC_COLUMNS = ['DIA_BYTE_0', 'DIA_BYTE_1', 'DIA_BYTE_2', 'DIA_BYTE_3', 'DIA_BYTE_4']
+
+    COLUMN_DTYPES = {
+        # float32 would change the times, e.g. 39.9 to 39.900001525878906
+        'Time': 'float64',
+        'MOD_TICK': 'int32',
+        'MONTIME': 'int32',
+        'ODOMETER': 'int32',
+        'SW_REL': 'int16',
+        **{col: 'int8' for col in FLAG_COLUMNS},
+        **{col: 'int16' for col in SPEED_COLUMNS + ACCELERATION_COLUMNS},
+        **{col: 'uint8' for col in DIAGNOSTIC_COLUMNS},
+    }
+
+    # Numbered per-axle channels not listed in COLUMN_DTYPES
+    CHANNEL_DTYPES = [
+        (re.compile(r'^(FILL|VENT)_\d+$'), 'int8'),
+        (re.compile(r'^(SPEED|ACC)_\d+$|^SP_\d+_NF20$'), 'int16'),
+    ]
+
+    # Dtypes tried in order when a value does not fit the listed one
+    __WIDER_DTYPES = {
+        'int8': ['int8', 'int16', 'int32', 'int64'],
+        'int16': ['int16', 'int32', 'int64'],
+        'int32': ['int32', 'int64'],
+        'uint8': ['uint8', 'int16', 'int32', 'int64'],
+    }
+
+    # Columns that identify the header of a DMP log
+    __KEY_COLUMNS = ('Time', 'MOD_TICK', 'MONTIME')
+
+    @staticmethod
+    def is_dmp_header(columns):
+        """
+        Check whether parsed column names belong to a DMP log.
+
+        Parameters:
+        columns (list): Column names of the section
+
+        Returns:
+        bool: True if the schema applies to these columns
+        """
+        return all(col in columns for col in DMPSchema.__KEY_COLUMNS)
+
+    @staticmethod
+    def get_dtype(col):
+        """
+        Narrow dtype of a DMP column.
+
+        Parameters:
+        col (str): Column name
+
+        Returns:
+        str: dtype name, or None for unknown columns
+        """
+        if col in DMPSchema.COLUMN_DTYPES:
+            return DMPSchema.COLUMN_DTYPES[col]
+        for pattern, dtype in DMPSchema.CHANNEL_DTYPES:
+            if pattern.match(str(col)):
+                return dtype
+        return None
+
+    @staticmethod
+    def __get_fitting_dtype(series, dtype):
+        if dtype.startswith('float'):
+            return dtype if pd.api.types.is_numeric_dtype(series) else None
+        if not pd.api.types.is_integer_dtype(series) or series.empty:
+            return None
+        low, high = series.min(), series.max()
+        for candidate in DMPSchema.__WIDER_DTYPES[dtype]:
+            limits = np.iinfo(candidate)
+            if limits.min <= low and high <= limits.max:
+                return candidate
+        return None
+
+    @staticmethod
+    def apply(df):
+        """
+        Convert the known DMP columns of a freshly parsed frame (or chunk) to
+        their narrow dtypes.
+
+        Parameters:
+        df (pd.DataFrame): Parsed DMP rows
+
+        Returns:
+        pd.DataFrame: The same rows with narrowed columns
+        """
+        dtypes = {}
+        for col in df.columns:
+            dtype = DMPSchema.get_dtype(col)
+            if dtype is None:
+                continue
+            fitting_dtype = DMPSchema.__get_fitting_dtype(df[col], dtype)
+            if fitting_dtype is not None and fitting_dtype != df[col].dtype:
+                dtypes[col] = fitting_dtype
+        return df.astype(dtypes, copy=False) if dtypes else df
+
+    @staticmethod
+    def log_memory_reduction(file_path, bytes_before, bytes_after):
+        """Log how much memory the schema saved on the frame of a file."""
+        if bytes_before <= 0:
+            return
+        saved = 100 * (bytes_before - bytes_after) / bytes_before
+        logging.info(f"DMP schema for {file_path}: {bytes_before / 1e6:.2f} MB -> "
+                     f"{bytes_after / 1e6:.2f} MB ({saved:.0f}% less)")
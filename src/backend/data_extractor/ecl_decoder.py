@@ -0,0 +1,143 @@
+import re
+import numpy as np
+import pandas as pd
+
+class ECLDecoder:
+    """
+    Decodes the text fields of ECL listings into numeric columns.
+
+    Every 'Name(hex)' column ('0x...' strings) gets an integer 'Name' column
+    next to it, and the 'Date' and 'Time' columns are combined into a single
+    datetime64 'DateTime' column. The original text columns are kept as
+    they are displayed in the GUI.
+
+    The decoding works on whole columns at once, no Python code runs per row.
+    """
+
+    HEX_COLUMN_PATTERN = re.compile(r'^(?P<name>.+)\(hex\)$')
+    DATE_COLUMN = 'Date'
+    TIME_COLUMN = 'Time'
+    DATETIME_COLUMN = 'DateTime'
+    DATETIME_FORMAT = '%d/%m/%y %H:%M:%S'
+
+    # More digits than this do not fit into an int64
+    MAX_HEX_DIGITS = 15
+
+    # Value of every byte as a hex digit, -1 for blanks (and the padding of
+    # fixed width byte strings) and -2 for bytes not allowed in a hex number
+    __DIGIT_VALUES = np.full(256, -2, dtype=np.int8)
+    __DIGIT_VALUES[[0, ord(' '), ord('\t')]] = -1
+    __DIGIT_VALUES[np.frombuffer(b'0123456789abcdefABCDEF', dtype=np.uint8)] = [*range(16), *range(10, 16)]
+    __PREFIX_CHARS = (ord('x'), ord('X'))
+
+    @staticmethod
+    def decode_hex(series):
+        """
+        Decode a column of hex strings such as '0x00000AAC' into integers.
+
+        The strings are turned into a (rows, width) byte matrix and the
+        digits are accumulated one character position at a time for all rows
+        together, so the work per row is a few array operations per character.
+
+        Parameters:
+        series (pd.Series): Hex strings, with or without the '0x' prefix
+
+        Returns:
+        pd.Series: int64 values, or nullable Int64 values with <NA> for
+                   missing and malformed entries
+        """
+        missing = series.isna().to_numpy()
+        raw = series.to_numpy(dtype=object, copy=True)
+        raw[missing] = ''
+        raw = raw.astype('S')
+        rows, width = len(raw), raw.dtype.itemsize
+        matrix = raw.view(np.uint8).reshape(rows, width) if width else np.empty((rows, 0), dtype=np.uint8)
+
+        decoded = np.zeros(rows, dtype=np.int64)
+        digit_count = np.zeros(rows, dtype=np.int64)
+        has_prefix = np.zeros(rows, dtype=bool)
+        invalid = missing.copy()
+        for position in range(width):
+            chars = matrix[:, position]
+            values = ECLDecoder.__DIGIT_VALUES[chars]
+            is_digit = values >= 0
+            decoded = np.where(is_digit, (decoded << 4) + values, decoded)
+            digit_count += is_digit
+            # An 'x' right after a single leading zero is the prefix, the
+            # zero does not count as a digit
+            is_prefix = np.isin(chars, ECLDecoder.__PREFIX_CHARS) & (digit_count == 1) \
+                & (decoded == 0) & ~has_prefix
+            has_prefix |= is_prefix
+            digit_count[is_prefix] = 0
+            invalid |= (values == -2) & ~is_prefix
+
+        # Longer numbers overflow the int64 accumulator
+        invalid |= (digit_count == 0) | (digit_count > ECLDecoder.MAX_HEX_DIGITS)
+        if invalid.any():
+            return pd.Series(pd.arrays.IntegerArray(decoded, invalid), index=series.index)
+        return pd.Series(decoded, index=series.index)
+
+    @staticmethod
+    def combine_date_time(dates, times):
+        """
+        Combine 'dd/mm/yy' date strings and 'HH:MM:SS' time strings.
+
+        Parameters:
+        dates (pd.Series): Date strings
+        times (pd.Series): Time strings
+
+        Returns:
+        pd.Series: datetime64 values, NaT where the fields do not parse
+        """
+        return pd.to_datetime(dates.astype(str) + ' ' + times.astype(str),
+                              format=ECLDecoder.DATETIME_FORMAT, errors='coerce')
+
+    @staticmethod
+    def get_decoded_columns(columns):
+        """
+        Find the columns added by apply(), which are meant for processing and
+        are not shown to the user next to the text columns they come from.
+
+        Parameters:
+        columns (list): Columns of an ECL frame
+
+        Returns:
+        list: The decoded columns among them
+        """
+        columns = [str(col) for col in columns]
+        decoded = []
+        for col in columns:
+            match = ECLDecoder.HEX_COLUMN_PATTERN.match(col)
+            if match and match.group('name') in columns:
+                decoded.append(match.group('name'))
+        if ECLDecoder.DATE_COLUMN in columns and ECLDecoder.TIME_COLUMN in columns \
+                and ECLDecoder.DATETIME_COLUMN in columns:
+            decoded.append(ECLDecoder.DATETIME_COLUMN)
+        return decoded
+
+    @staticmethod
+    def apply(df):
+        """
+        Add the decoded columns to an ECL frame. Frames without hex or date
+        and time columns are returned unchanged.
+
+        Parameters:
+        df (pd.DataFrame): Parsed ECL rows
+
+        Returns:
+        pd.DataFrame: The same rows with the decoded columns added
+        """
+        decoded = {}
+        for col in df.columns:
+            match = ECLDecoder.HEX_COLUMN_PATTERN.match(str(col))
+            if match and match.group('name') not in df.columns:
+                decoded[match.group('name')] = ECLDecoder.decode_hex(df[col])
+
+        if ECLDecoder.DATE_COLUMN in df.columns and ECLDecoder.TIME_COLUMN in df.columns \
+                and ECLDecoder.DATETIME_COLUMN not in df.columns:
+            decoded[ECLDecoder.DATETIME_COLUMN] = ECLDecoder.combine_date_time(
+                df[ECLDecoder.DATE_COLUMN], df[ECLDecoder.TIME_COLUMN])
+
+        if not decoded:
+            return df
+        return df.assign(**decoded)
@@ -0,0 +1,88 @@
+import pandas as pd
+
+class FrameMerger:
+    """
+    Collects the dataframes read from the individual files of a folder and
+    merges them with a single concatenation once all files are read.
+
+    Appending to an accumulated frame copies everything merged so far on
+    every file, which is quadratic in the number of files. Here the frames
+    are only referenced until build() is called.
+
+    The merger also keeps track of where every file ended up in the merged
+    frame, so rows can be traced back to their source file.
+    """
+
+    SOURCE_COLUMNS = ['Source', 'Start', 'Stop']
+
+    def __init__(self):
+        self.__frames = []
+        self.__sources = []
+
+    def __len__(self):
+        return len(self.__frames)
+
+    def add(self, source, df):
+        """
+        Queue the dataframe of one file for merging. Empty frames are ignored.
+
+        Parameters:
+        source (str): Path of the file the dataframe was read from
+        df (pd.DataFrame): Extracted dataframe of the file
+        """
+        if df is None or df.empty:
+            return
+        self.__frames.append(df)
+        self.__sources.append(source)
+
+    def build(self):
+        """
+        Merge the queued dataframes in the order they were added.
+
+        Returns:
+        pd.DataFrame: Merged dataframe with a fresh RangeIndex
+        pd.DataFrame: Provenance table with one row per file giving its
+                      'Source' path and the [Start, Stop) row range it
+                      occupies in the merged dataframe
+        """
+        if not self.__frames:
+            return pd.DataFrame(), pd.DataFrame(columns=FrameMerger.SOURCE_COLUMNS)
+
+        merged = pd.concat(self.__frames, ignore_index=True, copy=False)
+        sources = FrameMerger.get_sources(self.__sources, [len(df) for df in self.__frames])
+        return merged, sources
+
+    @staticmethod
+    def get_sources(sources, lengths):
+        """
+        Build the provenance table of files merged one after the other.
+
+        Parameters:
+        sources (list): Paths of the files in merge order
+        lengths (list): Number of rows of every file
+
+        Returns:
+        pd.DataFrame: 'Source', 'Start' and 'Stop' of every file
+        """
+        lengths = pd.Series(lengths, dtype='int64')
+        stops = lengths.cumsum()
+        return pd.DataFrame({
+            'Source': list(sources),
+            'Start': (stops - lengths).values,
+            'Stop': stops.values,
+        }, columns=FrameMerger.SOURCE_COLUMNS)
+
+    @staticmethod
+    def get_source_of_rows(sources, rows):
+        """
+        Look up the source file of rows of a merged dataframe.
+
+        Parameters:
+        sources (pd.DataFrame): Provenance table returned by build()
+        rows (array-like): Positional row numbers in the merged dataframe
+
+        Returns:
+        pd.Series: Source path of every requested row
+        """
+        positions = sources['Stop'].searchsorted(rows, side='right')
+        return pd.Series(sources['Source'].values[positions], index=rows)
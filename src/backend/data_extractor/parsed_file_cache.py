@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import os
+import pandas as pd
+from backend.data_extractor.dataframe_classifier import DataFrameClasses
+
+try:
+    import pyarrow  # noqa: F401  (required by DataFrame.to_feather / read_feather)
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
+class ParsedFileCache:
+    """
+    On-disk cache of the dataframes extracted from CSV files.
+
+    Parsed frames are stored as Feather (Arrow IPC) files, which load much
+    faster than parsing the CSV again. An entry is keyed by the absolute
+    path, size, modification time and content hash of the source file, so
+    any change to the file makes the old entry unreachable.
+
+    Every entry is a Feather file and a small JSON file describing it, and
+    the modification time of the JSON file is the time it was last used.
+    There is no shared index, so handlers, sessions and processes using the
+    same folder never overwrite each other's entries, and entries dropped by
+    any of them are gone for all of them.
+
+    The total size of the stored frames is capped; evict() drops the least
+    recently used entries, found by scanning the folder, until the cap is
+    met. The cache disables itself (every lookup misses) when pyarrow is
+    not installed.
+    """
+
+    # Fixed location, so the cache does not depend on the working directory
+    DEFAULT_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'brakes_gui', 'parsed_files')
+    DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+    HASH_BLOCK_SIZE = 1 << 20
+    # Part of every key, bump it when the parser output changes so that
+    # frames cached by an older version are not used any more
+    FORMAT_VERSION = 6
+    __FRAME_EXTENSION = '.feather'
+    __ENTRY_EXTENSION = '.json'
+
+    def __init__(self, cache_dir=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str): Folder the cached frames are stored in
+            max_bytes (int): Size cap of the stored frames in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = FEATHER_AVAILABLE
+        self.hits = 0
+        self.misses = 0
+        if not self.enabled:
+            logging.warning("pyarrow is not installed, parsed file cache disabled")
+            return
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def __frame_path(self, file_key):
+        return os.path.join(self.cache_dir, file_key + ParsedFileCache.__FRAME_EXTENSION)
+
+    def __entry_path(self, file_key):
+        return os.path.join(self.cache_dir, file_key + ParsedFileCache.__ENTRY_EXTENSION)
+
+    @staticmethod
+    def __write_atomic(path, write):
+        # Written to a temporary file first so that an interrupted write or
+        # a concurrent reader never sees a truncated file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def get_file_key(file_path):
+        """
+        Build the cache key of a file from its path, size, modification time
+        and content hash.
+
+        Args:
+            file_path (str): Path to the source file
+
+        Returns:
+            str: Hex digest identifying this exact version of the file
+        """
+        stat = os.stat(file_path)
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(ParsedFileCache.HASH_BLOCK_SIZE), b''):
+                content_hash.update(block)
+        key = (f"{ParsedFileCache.FORMAT_VERSION}|{os.path.abspath(file_path)}|"
+               f"{stat.st_size}|{stat.st_mtime_ns}|{content_hash.hexdigest()}")
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def get(self, file_key):
+        """
+        Load a cached frame.
+
+        Args:
+            file_key (str): Key returned by get_file_key()
+
+        Returns:
+            tuple: (DataFrameClasses, pd.DataFrame) as stored by put(),
+                   or None on a miss
+        """
+        if not self.enabled:
+            self.misses += 1
+            return None
+        try:
+            with open(self.__entry_path(file_key), 'r') as entry_file:
+                entry = json.load(entry_file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Dropping unreadable cache entry {file_key}: {e}")
+            self.__remove(file_key)
+            self.misses += 1
+            return None
+        try:
+            df = pd.read_feather(self.__frame_path(file_key))
+            # Marks the entry as used, for evict()
+            os.utime(self.__entry_path(file_key))
+        except Exception as e:
+            logging.warning(f"Dropping unreadable cache entry for {entry['source']}: {e}")
+            self.__remove(file_key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return DataFrameClasses[entry['type']], df
+
+    def put(self, file_key, source, df_type, df):
+        """
+        Store the frame parsed from a file. Frames that cannot be stored as
+        Feather are skipped. Call evict() once the files of a load are
+        stored to enforce the size cap.
+
+        Args:
+            file_key (str): Key returned by get_file_key()
+            source (str): Path of the source file
+            df_type (DataFrameClasses): Detected class of the frame
+            df (pd.DataFrame): Parsed frame
+        """
+        if not self.enabled:
+            return
+        try:
+            ParsedFileCache.__write_atomic(self.__frame_path(file_key),
+                                           lambda path: df.reset_index(drop=True).to_feather(path))
+        except Exception as e:
+            logging.warning(f"Could not cache parsed frame of {source}: {e}")
+            return
+        entry = {'source': os.path.abspath(source), 'type': df_type.name}
+        # The entry is written last, a frame without one is never read
+        def write_entry(path):
+            with open(path, 'w') as entry_file:
+                json.dump(entry, entry_file)
+        ParsedFileCache.__write_atomic(self.__entry_path(file_key), write_entry)
+
+    def __remove(self, file_key):
+        for path in (self.__entry_path(file_key), self.__frame_path(file_key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def __scan(self):
+        """
+        Find the stored frames.
+
+        Returns:
+            dict: (size in bytes, last use time) of every file key, frames
+                  without an entry file count as last used when written
+        """
+        if not self.enabled or not os.path.isdir(self.cache_dir):
+            return {}
+        frames = {}
+        for directory_entry in os.scandir(self.cache_dir):
+            file_key, extension = os.path.splitext(directory_entry.name)
+            if extension != ParsedFileCache.__FRAME_EXTENSION:
+                continue
+            try:
+                size = directory_entry.stat().st_size
+                try:
+                    last_used = os.stat(self.__entry_path(file_key)).st_mtime
+                except FileNotFoundError:
+                    last_used = directory_entry.stat().st_mtime
+            except FileNotFoundError:
+                # Removed by another handler meanwhile
+                continue
+            frames[file_key] = (size, last_used)
+        return frames
+
+    def evict(self):
+        """
+        Drop the least recently used frames until the stored frames fit in
+        the size cap.
+
+        Returns:
+            int: Number of entries removed
+        """
+        frames = self.__scan()
+        total = sum(size for size, _ in frames.values())
+        removed = 0
+        for file_key in sorted(frames, key=lambda key: frames[key][1]):
+            if total <= self.max_bytes:
+                break
+            total -= frames[file_key][0]
+            logging.info(f"Evicting cached frame {file_key}")
+            self.__remove(file_key)
+            removed += 1
+        return removed
+
+    def invalidate(self, source=None):
+        """
+        Drop cached frames.
+
+        Args:
+            source (str): Only drop the entries of this source file, or of
+                every file inside it if it is a folder. None drops everything.
+
+        Returns:
+            int: Number of entries removed
+        """
+        file_keys = list(self.__scan())
+        if source is not None:
+            source = os.path.abspath(source)
+            matching = []
+            for file_key in file_keys:
+                try:
+                    with open(self.__entry_path(file_key), 'r') as entry_file:
+                        entry_source = json.load(entry_file)['source']
+                except (OSError, ValueError, KeyError):
+                    continue
+                if entry_source == source or os.path.dirname(entry_source) == source:
+                    matching.append(file_key)
+            file_keys = matching
+        for file_key in file_keys:
+            self.__remove(file_key)
+        logging.info(f"Invalidated {len(file_keys)} cached frames")
+        return len(file_keys)
+
+    def get_size(self):
+        """Total size of the stored frames in bytes."""
+        return sum(size for size, _ in self.__scan().values())
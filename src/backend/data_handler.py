@@ -1,25 +1,88 @@
+import copy
 import glob
+import hashlib
+import os
 import pandas as pd
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
 from backend.utils.logging_config import configure_logging
 from backend.utils.folder_validator import FolderValidator
 from backend.data_extractor.dataframe_classifier import DataFrameClassifier, DataFrameClasses
 from backend.data_processors.ecl_processor import ECLProcessor
+from backend.data_processors.error_code_dictionary import ErrorCodeDictionary
 from backend.data_processors.dmp_processor import DMPProcessor
+from backend.data_processors.fill_vent_event_detector import FillVentEventDetector
 from backend.data_extractor.dataframe_extractor import DataFrameExtractor
+from backend.data_extractor.frame_merger import FrameMerger
+from backend.data_extractor.parsed_file_cache import ParsedFileCache
 from backend.json_config_loader import JSONConfigReader
 from backend.data_processors.error_grouper_for_error_log_tab import get_error_groups
-from backend.data_processors.table_maker_for_summary_tab import get_tables
-from backend.data_processors.detailed_data_for_error_grouper import get_detailed_data_for_error_groups
+from backend.data_processors.table_maker_for_summary_tab import SummaryTableBuilder
+from backend.data_processors.detailed_data_for_error_grouper import ErrorGroupIndex
+from backend.data_processors.dmp_downsampler import DMPDownsampler
+
+def _load_csv_file(csv_file_path, df_type=None):
+    """
+    Classify and extract a single CSV file.
+
+    Kept at module level so that it can be pickled and run inside
+    a worker process of the ingestion pool.
+
+    Args:
+        csv_file_path (str): Path to the CSV file
+        df_type (DataFrameClasses): Class of the file if it is already known
+
+    Returns:
+        tuple: Detected DataFrameClasses value and the extracted dataframe,
+               which is left empty for files of unknown class
+    """
+    if df_type is None:
+        df_type = DataFrameClassifier.classify_file(csv_file_path)
+    if df_type == DataFrameClasses.UNKNOWN:
+        return df_type, pd.DataFrame()
+    return df_type, DataFrameExtractor.get_df_from_file(csv_file_path, df_type)
 
 class DataHandler:
-    def __init__(self, folder_path, json_config_path):
+    # Config sections the derived products can depend on
+    CONFIG_SECTIONS = ('ERROR_DESCRIPTION', 'ERROR_LOG_TAB', 'SUMMARY_TAB', 'FILL_VENT_PAIRS')
+
+    # Products derived from the loaded data, computed on first access and
+    # kept until one of the inputs, config sections or products they are
+    # computed from changes. Every product is listed after the ones it
+    # depends on, with the value it takes when computing it fails.
+    DERIVED_PRODUCTS = {
+        'ecl_freq_summary': (('ecl', 'ERROR_DESCRIPTION'), pd.DataFrame),
+        'error_grps': (('ecl_freq_summary', 'ERROR_LOG_TAB'), dict),
+        'tables': (('ecl_freq_summary', 'SUMMARY_TAB'), dict),
+        'error_group_index': (('ecl', 'ERROR_DESCRIPTION', 'ERROR_LOG_TAB'), lambda: None),
+        'filtered_dmp': (('dmp', 'FILL_VENT_PAIRS'), pd.DataFrame),
+        'filtered_dmp_stats': (('filtered_dmp',), lambda: DMPProcessor.get_filtered_statistics(None)),
+        'dmp_scan': (('dmp', 'FILL_VENT_PAIRS'), lambda: (pd.DataFrame(columns=DMPProcessor.TOTAL_COLUMNS), {})),
+        'dmp_freq_summary': (('dmp_scan',), pd.Series),
+        'fill_vent_events': (('dmp_scan',), dict),
+        'dmp_downsampler': (('dmp',), lambda: None),
+    }
+
+    def __init__(self, folder_path, json_config_path, max_workers=1, cache_dir=ParsedFileCache.DEFAULT_DIR,
+                 streaming=False, chunk_rows=DataFrameExtractor.DEFAULT_CHUNK_ROWS):
         """
         Initialize DataHandler with robust folder path validation.
         
         Args:
             folder_path (str): Path to the folder containing CSV files
+            max_workers (int): Number of worker processes used to read the
+                CSV files. 1 reads them sequentially in this process, None
+                uses one worker per CPU core.
+            cache_dir (str): Folder of the parsed file cache, None disables
+                the cache.
+            streaming (bool): Stream DMP files in chunks of chunk_rows rows
+                through the frequency summary and the fill/vent detection
+                instead of keeping them in memory. dmp and filtered_dmp stay
+                empty, dmp_downsampler has no rows, and files are read
+                sequentially without the cache.
+            chunk_rows (int): Number of rows per chunk when streaming
         
         Raises:
             FileNotFoundError: If the folder does not exist
@@ -31,15 +94,37 @@ class DataHandler:
             FolderValidator.validate_folder(folder_path)
             
             self.__folder_path = folder_path
+            self.__max_workers = max_workers
+            self.__streaming = streaming
+            self.__chunk_rows = chunk_rows
+            self.parsed_cache = ParsedFileCache(cache_dir) if cache_dir else None
             self.ecl = pd.DataFrame()
             self.dmp = pd.DataFrame()
-            self.ecl_freq_summary = pd.DataFrame()
-            self.filtered_dmp = pd.DataFrame()
-            self.dmp_freq_summary = pd.Series()
+            self.ecl_sources = pd.DataFrame(columns=FrameMerger.SOURCE_COLUMNS)
+            self.dmp_sources = pd.DataFrame(columns=FrameMerger.SOURCE_COLUMNS)
             self.jcr = JSONConfigReader(json_config_path)
-            self.error_grps = dict()
-            self.tables = dict()
-            self.fill_vent_events = {}
+            # Shared by all ECL files, so their description codes agree
+            self.error_codes = ErrorCodeDictionary.from_config(self.jcr)
+            self.fill_vent_pairs = FillVentEventDetector.get_pairs_from_config(self.jcr)
+            # Compiled from the config on first use
+            self.__table_builder = None
+            # Derived products computed so far, see DERIVED_PRODUCTS
+            self.__derived = {}
+            self.__bind_derived_computers()
+            # Guards the derived products and the state of the last load,
+            # the handler is shared by all sessions of the app
+            self.__lock = threading.RLock()
+            # State of the last load, used by refresh()
+            self.__file_states = {}
+            self.__ecl_counts = pd.Series(dtype='int64')
+            self.__dmp_files = []
+            self.__dmp_file_totals = {}
+            self.__dmp_totals = pd.DataFrame(columns=DMPProcessor.TOTAL_COLUMNS)
+            self.__fill_vent_checkpoints = [None]
+            self.__fill_vent_events = {}
+            # Position of the first DMP file whose totals and events are
+            # not computed yet
+            self.__dmp_resume_from = 0
             # Set csv folder
             self.set_folder(folder_path)
             
@@ -47,6 +132,312 @@ class DataHandler:
             logging.error(f"Initialization error: {e}")
             raise
 
+    def __bind_derived_computers(self):
+        """Bind the functions computing every derived product to this handler."""
+        self.__derived_computers = {
+            'ecl_freq_summary': self.__compute_ecl_freq_summary,
+            'error_grps': self.__compute_error_grps,
+            'tables': self.__compute_tables,
+            'error_group_index': lambda: ErrorGroupIndex(self.ecl, self.jcr),
+            'filtered_dmp': lambda: DMPProcessor.filter_dmp(self.dmp, self.jcr),
+            'filtered_dmp_stats': lambda: DMPProcessor.get_filtered_statistics(self.__get_derived('filtered_dmp')),
+            'dmp_scan': self.__compute_dmp_scan,
+            'dmp_freq_summary': lambda: DMPProcessor.get_summary_from_totals(self.__get_derived('dmp_scan')[0]),
+            'fill_vent_events': lambda: self.__get_derived('dmp_scan')[1],
+            'dmp_downsampler': lambda: DMPDownsampler(self.dmp),
+        }
+
+    def __load_csv_files(self, csv_files):
+        """
+        Load the frames of the given CSV files, from the parsed file cache
+        when the file is unchanged and by parsing it otherwise. Newly parsed
+        frames are added to the cache. Files are classified from their first
+        bytes beforehand, files of unknown class are neither hashed nor parsed.
+
+        Args:
+            csv_files (list): Paths of the CSV files to read
+
+        Yields:
+            tuple: (csv_file_path, result) in the order of csv_files, where
+                   result is either (df_type, df) or the raised exception
+        """
+        file_types = {csv_file_path: DataFrameClassifier.classify_file(csv_file_path) for csv_file_path in csv_files}
+        log_files = [path for path in csv_files if file_types[path] != DataFrameClasses.UNKNOWN]
+
+        cached, file_keys = {}, {}
+        if self.parsed_cache is not None and self.parsed_cache.enabled:
+            for csv_file_path in log_files:
+                try:
+                    file_keys[csv_file_path] = ParsedFileCache.get_file_key(csv_file_path)
+                except OSError as e:
+                    logging.warning(f"Could not fingerprint {csv_file_path}: {e}")
+                    continue
+                result = self.parsed_cache.get(file_keys[csv_file_path])
+                if result is not None:
+                    cached[csv_file_path] = result
+            logging.info(f'{len(cached)} of {len(log_files)} files loaded from the parsed file cache')
+
+        parsed = self.__parse_csv_files([path for path in log_files if path not in cached], file_types)
+        for csv_file_path in csv_files:
+            if file_types[csv_file_path] == DataFrameClasses.UNKNOWN:
+                yield csv_file_path, (DataFrameClasses.UNKNOWN, pd.DataFrame())
+                continue
+            if csv_file_path in cached:
+                yield csv_file_path, cached[csv_file_path]
+                continue
+            _, result = next(parsed)
+            if not isinstance(result, Exception) and csv_file_path in file_keys:
+                self.parsed_cache.put(file_keys[csv_file_path], csv_file_path, *result)
+            yield csv_file_path, result
+        # The size cap is enforced once per load, not on every stored frame
+        if file_keys:
+            self.parsed_cache.evict()
+
+    def invalidate_cache(self, source=None):
+        """
+        Drop entries of the parsed file cache.
+
+        Args:
+            source (str): File or folder whose entries are dropped, None
+                drops the whole cache.
+
+        Returns:
+            int: Number of entries removed
+        """
+        if self.parsed_cache is None:
+            return 0
+        return self.parsed_cache.invalidate(source)
+
+    def __parse_csv_files(self, csv_files, file_types):
+        """
+        Extract the given CSV files, in a process pool when more than one
+        worker is configured.
+
+        Every file is handled on its own: a failure is logged and reported
+        as an exception for that file only.
+
+        Args:
+            csv_files (list): Paths of the CSV files to read
+            file_types (dict): DataFrameClasses value of every file
+
+        Yields:
+            tuple: (csv_file_path, result) in the order of csv_files, where
+                   result is either (df_type, df) or the raised exception
+        """
+        if not csv_files:
+            return
+        max_workers = self.__max_workers or os.cpu_count() or 1
+        max_workers = min(max_workers, len(csv_files))
+
+        if max_workers <= 1:
+            for csv_file_path in tqdm(csv_files, desc="Reading Files"):
+                try:
+                    yield csv_file_path, _load_csv_file(csv_file_path, file_types[csv_file_path])
+                except Exception as file_error:
+                    yield csv_file_path, file_error
+            return
+
+        logging.info(f'Reading files with {max_workers} worker processes')
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=configure_logging) as executor:
+            futures = [executor.submit(_load_csv_file, csv_file_path, file_types[csv_file_path])
+                       for csv_file_path in csv_files]
+            # Collect in submission order so that the merged frames do not
+            # depend on which worker finished first
+            for csv_file_path, future in tqdm(zip(csv_files, futures), total=len(futures), desc="Reading Files"):
+                try:
+                    yield csv_file_path, future.result()
+                except Exception as file_error:
+                    yield csv_file_path, file_error
+
+    @staticmethod
+    def __get_file_states(folder_path):
+        """
+        Get the size and modification time of the CSV files in a folder.
+        
+        Args:
+            folder_path (str): Path to the folder containing CSV files
+        
+        Returns:
+            dict: (size, mtime) per CSV file path, sorted by path
+        """
+        file_states = {}
+        # Sorted so that the row order of the merged frames is deterministic
+        for csv_file_path in sorted(glob.glob(f"{folder_path}/*.csv")):
+            try:
+                stat = os.stat(csv_file_path)
+            except OSError as e:
+                logging.warning(f"Could not stat {csv_file_path}: {e}")
+                continue
+            file_states[csv_file_path] = (stat.st_size, stat.st_mtime_ns)
+        return file_states
+
+    def __read_csv_files(self, csv_files):
+        """
+        Read the given CSV files and sort their frames by class.
+        
+        Args:
+            csv_files (list): Paths of the CSV files to read
+        
+        Returns:
+            tuple: ECL and DMP frames, each a dict of dataframe per file path
+        """
+        ecl_frames, dmp_frames = {}, {}
+        for csv_file_path, result in self.__load_csv_files(csv_files):
+            if isinstance(result, Exception):
+                logging.error(f"Error processing file {csv_file_path}: {result}")
+                continue
+
+            df_type, df = result
+            if df_type == DataFrameClasses.ECL:
+                ecl_frames[csv_file_path] = df
+            elif df_type == DataFrameClasses.DMP:
+                dmp_frames[csv_file_path] = df
+            else:
+                logging.warning(f"Skipping unrecognized file: {csv_file_path}")
+        return ecl_frames, dmp_frames
+
+    @staticmethod
+    def __merge_frames(frames):
+        """
+        Merge per-file frames in file path order.
+        
+        Args:
+            frames (dict): Dataframe per file path
+        
+        Returns:
+            tuple: Merged dataframe and its provenance table
+        """
+        # Frames are only collected and merged once at the end
+        merger = FrameMerger()
+        for csv_file_path in sorted(frames):
+            merger.add(csv_file_path, frames[csv_file_path])
+        return merger.build()
+
+    @staticmethod
+    def __get_frames_by_source(merged, sources, exclude=()):
+        """
+        Split a merged dataframe back into per-file frames.
+        
+        Args:
+            merged (pd.DataFrame): Merged dataframe
+            sources (pd.DataFrame): Its provenance table
+            exclude (set): File paths to leave out
+        
+        Returns:
+            dict: Dataframe per file path
+        """
+        return {source: merged.iloc[start:stop]
+                for source, start, stop in sources[FrameMerger.SOURCE_COLUMNS].itertuples(index=False)
+                if source not in exclude}
+
+    @staticmethod
+    def __combine_totals(total, added, removed):
+        """
+        Add and subtract per-file counts or totals (Series or DataFrames
+        indexed by key) from a running total.
+        """
+        parts = [part for part in [total, *added] if not part.empty]
+        parts += [-part for part in removed if not part.empty]
+        if not parts:
+            return total.iloc[0:0]
+        return pd.concat(parts).groupby(level=0, sort=False).sum()
+
+    def __encode_descriptions(self, ecl_frames):
+        """Store the description column of ECL frames as codes of the error code dictionary."""
+        return self.error_codes.encode_frames(ecl_frames, self.jcr.get_error_description())
+
+    def __get_ecl_counts(self, df_ecl):
+        if df_ecl.empty or self.jcr.get_error_description() not in df_ecl.columns:
+            return pd.Series(dtype='int64')
+        return ECLProcessor.get_frequency_counts(df_ecl, self.jcr)
+
+    def __scan_csv_files(self, csv_files):
+        """
+        Streaming counterpart of __read_csv_files. Files are classified from
+        their first bytes: ECL files are small and read completely, DMP files
+        are left to be streamed.
+        
+        Args:
+            csv_files (list): Paths of the CSV files to read
+        
+        Returns:
+            tuple: ECL frames as a dict of dataframe per file path, and the
+                   paths of the DMP files
+        """
+        ecl_frames, dmp_files = {}, []
+        for csv_file_path in tqdm(csv_files, desc="Scanning Files"):
+            try:
+                df_type = DataFrameClassifier.classify_file(csv_file_path)
+                if df_type == DataFrameClasses.ECL:
+                    ecl_frames[csv_file_path] = DataFrameExtractor.get_df_from_file(csv_file_path, df_type)
+                elif df_type == DataFrameClasses.DMP:
+                    dmp_files.append(csv_file_path)
+                else:
+                    logging.warning(f"Skipping unrecognized file: {csv_file_path}")
+            except Exception as e:
+                logging.error(f"Error processing file {csv_file_path}: {e}")
+        return ecl_frames, dmp_files
+
+    def __get_dmp_pieces(self, dmp_files):
+        """
+        Pair every DMP file with the dataframes its rows are read from: the
+        file's slice of the merged frame, or its chunks when streaming.
+        """
+        if self.__streaming:
+            return [(source, DataFrameExtractor.iter_df_chunks(source, self.__chunk_rows, DataFrameClasses.DMP))
+                    for source in dmp_files]
+        frames = self.__get_frames_by_source(self.dmp, self.dmp_sources)
+        return [(source, [frames[source]]) for source in dmp_files]
+
+    def __process_dmp_files(self, dmp_files, first_file=0):
+        """
+        Compute the column totals and detect the fill/vent events of the DMP
+        files from first_file on. The detection resumes from the state saved
+        after the files before it, and their totals are kept as they are.
+        
+        Args:
+            dmp_files (list): Paths of the DMP files in merge order
+            first_file (int): Position of the first file to process
+        
+        Returns:
+            dict: Number of rows of every processed file
+        """
+        checkpoints = self.__fill_vent_checkpoints[:first_file + 1]
+        file_totals = {source: self.__dmp_file_totals[source] for source in dmp_files[:first_file]}
+        file_rows = {}
+        detector = FillVentEventDetector(pairs=self.fill_vent_pairs, state=checkpoints[-1])
+        empty_totals = pd.DataFrame(columns=DMPProcessor.TOTAL_COLUMNS)
+
+        for source, chunks in self.__get_dmp_pieces(dmp_files[first_file:]):
+            parts, file_rows[source] = [], 0
+            try:
+                for chunk in chunks:
+                    detector.feed(chunk)
+                    parts.append(DMPProcessor.get_column_totals(chunk, self.jcr))
+                    file_rows[source] += len(chunk)
+            except Exception as e:
+                logging.error(f"Error processing file {source}: {e}")
+            file_totals[source] = self.__combine_totals(empty_totals, parts, [])
+            checkpoints.append(detector.get_state())
+
+        self.__dmp_files = list(dmp_files)
+        self.__dmp_resume_from = len(dmp_files)
+        self.__fill_vent_checkpoints = checkpoints
+        self.__dmp_file_totals = file_totals
+        self.__dmp_totals = self.__combine_totals(empty_totals, list(file_totals.values()), [])
+        self.__fill_vent_events = detector.get_events()
+        return file_rows
+
+    def __get_streamed_sources(self, dmp_files, file_rows):
+        """
+        Provenance table of streamed DMP files, with row numbers counted as if
+        the files had been merged. Files not in file_rows keep their length.
+        """
+        lengths = dict(zip(self.dmp_sources['Source'], self.dmp_sources['Stop'] - self.dmp_sources['Start']))
+        lengths.update(file_rows)
+        dmp_files = [source for source in dmp_files if lengths.get(source, 0) > 0]
+        return FrameMerger.get_sources(dmp_files, [lengths[source] for source in dmp_files])
+
     def __read_csv_from_folder(self, folder_path):
         """
         Read and merge CSV files from folder with comprehensive error handling.
@@ -55,47 +446,134 @@ class DataHandler:
             folder_path (str): Path to the folder containing CSV files
         
         Returns:
-            tuple: Merged ECL and DMP dataframes
+            tuple: Merged ECL and DMP dataframes, followed by their
+                   provenance tables (source file and row range per file).
+                   When streaming, the DMP dataframe is left empty and the
+                   third item is the list of DMP file paths instead.
         """
-        merged_ecl = pd.DataFrame()
-        merged_dmp = pd.DataFrame()
+        ecl_frames, dmp_frames = {}, {}
         try:
-            csv_files = glob.glob(f"{folder_path}/*.csv")
+            self.__file_states = self.__get_file_states(folder_path)
+            csv_files = list(self.__file_states)
             logging.info(f'CSV Files found: {csv_files}')
 
             if len(csv_files) == 0 or csv_files == None:
                 logging.warning(f"No CSV files found in folder: {folder_path}")
-                return merged_ecl, merged_dmp
 
-            for csv_file_path in tqdm(csv_files, desc="Reading Files"):
+            if self.__streaming:
+                ecl_frames, dmp_files = self.__scan_csv_files(csv_files)
+                merged_ecl, ecl_sources = self.__merge_frames(self.__encode_descriptions(ecl_frames))
+                return merged_ecl, pd.DataFrame(), ecl_sources, dmp_files
+
+            ecl_frames, dmp_frames = self.__read_csv_files(csv_files)
+            ecl_frames = self.__encode_descriptions(ecl_frames)
+
+        except Exception as e:
+            logging.error(f"Unexpected error reading CSV files: {e}")
+
+        merged_ecl, ecl_sources = self.__merge_frames(ecl_frames)
+        merged_dmp, dmp_sources = self.__merge_frames(dmp_frames)
+        return merged_ecl, merged_dmp, ecl_sources, dmp_sources
+
+    def __get_derived(self, name):
+        """
+        Get a derived product, computing it if it is not up to date. A
+        failing computation is logged and gives the product's empty value.
+        
+        Args:
+            name (str): Name of the product in DERIVED_PRODUCTS
+        
+        Returns:
+            The derived product
+        """
+        with self.__lock:
+            if name not in self.__derived:
                 try:
-                    df = DataFrameExtractor.get_df_from_file(csv_file_path)
-                    df_type = DataFrameClassifier.get_dataframe_class(df)
-                    # print(df)
-                    if df_type == DataFrameClasses.ECL:
-                        if not df.empty:
-                            # print("ECL file Processed")
-                            merged_ecl = pd.concat([merged_ecl, df])
-                    elif df_type == DataFrameClasses.DMP:
-                        if not df.empty:
-                            # print("DMP file Processed")
-                            merged_dmp = pd.concat([merged_dmp, df])
-                    else:
-                        logging.warning(f"Skipping unrecognized file: {csv_file_path}")
+                    self.__derived[name] = self.__derived_computers[name]()
+                except Exception as e:
+                    logging.error(f"Error computing {name}: {e}")
+                    self.__derived[name] = DataHandler.DERIVED_PRODUCTS[name][1]()
+            return self.__derived[name]
 
-                except Exception as file_error:
-                    logging.error(f"Error processing file {csv_file_path}: {file_error}")
-                    continue
+    def __invalidate(self, *inputs):
+        """
+        Drop the derived products computed from the given inputs, directly
+        or through other products, so that they are computed again on their
+        next access.
+        
+        Args:
+            inputs (str): Names of the changed inputs or products
+        """
+        stale = set(inputs)
+        for name, (dependencies, _) in DataHandler.DERIVED_PRODUCTS.items():
+            if stale.intersection(dependencies):
+                stale.add(name)
+                self.__derived.pop(name, None)
 
-            # Reset indices
-            merged_ecl.reset_index(drop=True, inplace=True)
-            merged_dmp.reset_index(drop=True, inplace=True)
+    def __compute_ecl_freq_summary(self):
+        # Counts of removed files leave zeros behind after a refresh
+        if not (self.__ecl_counts > 0).any():
+            logging.warning("No ECL counts available for the frequency summary")
+            return pd.DataFrame()
+        return ECLProcessor.get_summary_from_counts(self.__ecl_counts, self.jcr)
 
-            return merged_ecl, merged_dmp
+    def __compute_error_grps(self):
+        if self.ecl_freq_summary.empty:
+            return dict()
+        return get_error_groups(self.jcr, self.ecl_freq_summary)
 
-        except Exception as e:
-            logging.error(f"Unexpected error reading CSV files: {e}")
-            return merged_ecl, merged_dmp
+    def __compute_tables(self):
+        if self.ecl_freq_summary.empty:
+            return dict()
+        if self.__table_builder is None:
+            self.__table_builder = SummaryTableBuilder(self.jcr, self.error_codes)
+        return self.__table_builder.build(self.ecl_freq_summary)
+
+    def __compute_dmp_scan(self):
+        """Column totals and fill/vent events, after processing the DMP files not processed yet."""
+        if self.__dmp_resume_from < len(self.__dmp_files):
+            self.__process_dmp_files(self.__dmp_files, self.__dmp_resume_from)
+        return self.__dmp_totals, self.__fill_vent_events
+
+    @property
+    def ecl_freq_summary(self):
+        """pd.DataFrame: Frequency of every error description."""
+        return self.__get_derived('ecl_freq_summary')
+
+    @property
+    def error_grps(self):
+        """dict: Frequency summary of every ERROR_LOG_TAB group."""
+        return self.__get_derived('error_grps')
+
+    @property
+    def tables(self):
+        """dict: SUMMARY_TAB tables."""
+        return self.__get_derived('tables')
+
+    @property
+    def filtered_dmp(self):
+        """pd.DataFrame: DMP rows with active flags."""
+        return self.__get_derived('filtered_dmp')
+
+    @property
+    def filtered_dmp_stats(self):
+        """tuple: describe() and non zero counts of the filtered_dmp columns."""
+        return self.__get_derived('filtered_dmp_stats')
+
+    @property
+    def dmp_freq_summary(self):
+        """pd.Series: Totals of the DMP columns."""
+        return self.__get_derived('dmp_freq_summary')
+
+    @property
+    def fill_vent_events(self):
+        """dict: Fill/vent events of every FILL/VENT pair."""
+        return self.__get_derived('fill_vent_events')
+
+    @property
+    def dmp_downsampler(self):
+        """DMPDownsampler: Level of detail pyramid of the DMP channels, None if it cannot be built."""
+        return self.__get_derived('dmp_downsampler')
 
     def set_folder(self, folder_path):
         """
@@ -108,43 +586,240 @@ class DataHandler:
             FolderValidator.validate_folder(folder_path)
             self.__folder_path = folder_path
             logging.info(f'Reading files from path: {folder_path}')
-            self.ecl, self.dmp = self.__read_csv_from_folder(self.__folder_path)
-            
+            self.ecl, self.dmp, self.ecl_sources, dmp_sources = self.__read_csv_from_folder(self.__folder_path)
+            self.__fill_vent_checkpoints = [None]
+            self.__dmp_resume_from = 0
+            self.__derived = {}
+
+            if self.__streaming:
+                # DMP rows are only streamed through the totals and the
+                # event detection, no DMP frame is kept
+                self.dmp_sources = pd.DataFrame(columns=FrameMerger.SOURCE_COLUMNS)
+                file_rows = self.__process_dmp_files(dmp_sources)
+                self.dmp_sources = self.__get_streamed_sources(dmp_sources, file_rows)
+            else:
+                # Totals and events are computed on their first access
+                self.dmp_sources = dmp_sources
+                self.__dmp_files = list(dmp_sources['Source'])
+
             if self.ecl.empty:
                 logging.warning("No ECL data processed")
-            if self.dmp.empty:
+            if not self.has_dmp_data():
                 logging.warning("No DMP data processed")
 
-
-            self.ecl_freq_summary = ECLProcessor.get_frequency_summary(self.ecl, self.jcr)
-            self.filtered_dmp = DMPProcessor.filter_dmp(self.dmp, self.jcr)
-            self.dmp_freq_summary = DMPProcessor.get_frequency_summary(self.filtered_dmp)
-            self.error_grps = get_error_groups(self.jcr, self.ecl_freq_summary)
-            self.error_group_details = get_detailed_data_for_error_groups(self.ecl, self.error_grps, self.jcr)
-            self.tables = get_tables(self.ecl_freq_summary, self.jcr)
-            self.fill_vent_events = DMPProcessor.process_fill_vent_events(self.dmp)
-            self.print_report()
-            # print(self.filtered_dmp)
+            self.__ecl_counts = self.__get_ecl_counts(self.ecl)
             
         except Exception as e:
             logging.error(f"Error setting folder: {e}")
             self._reset_state()
 
+    def copy(self):
+        """
+        Copy of the handler that can be refreshed or given a new config
+        without changing this one, e.g. while other sessions use it. The
+        loaded frames and derived products are shared, they are only ever
+        replaced and never changed in place.
+        
+        Returns:
+            DataHandler: The copy
+        """
+        with self.__lock:
+            data_handler = copy.copy(self)
+            data_handler.__lock = threading.RLock()
+            data_handler.__bind_derived_computers()
+            data_handler.__derived = dict(self.__derived)
+            # Descriptions of new files are added to the dictionary, and the
+            # table builder refers to it. The state of the last load is only
+            # ever replaced, like the frames.
+            data_handler.error_codes = copy.deepcopy(self.error_codes)
+            data_handler.__table_builder = None
+        return data_handler
+
+    def refresh(self):
+        """
+        Bring the data up to date with the files added to, modified in or
+        removed from the folder since it was last loaded. Only the added and
+        modified files are read. The frequency summaries are updated with the
+        counts of the changed files, and the fill/vent event detection resumes
+        from the first changed DMP file. The handler is changed in place,
+        refresh a copy() of a handler other sessions use.
+        
+        Returns:
+            dict: Paths of the 'added', 'modified' and 'removed' files
+        """
+        changes = {'added': [], 'modified': [], 'removed': []}
+        try:
+            FolderValidator.validate_folder(self.__folder_path)
+            file_states = self.__get_file_states(self.__folder_path)
+            for csv_file_path, state in file_states.items():
+                if csv_file_path not in self.__file_states:
+                    changes['added'].append(csv_file_path)
+                elif self.__file_states[csv_file_path] != state:
+                    changes['modified'].append(csv_file_path)
+            changes['removed'] = [path for path in self.__file_states if path not in file_states]
+
+            if not any(changes.values()):
+                logging.info("No changes in folder since the last load")
+                return changes
+            logging.info(f"Refreshing folder: {len(changes['added'])} added, "
+                         f"{len(changes['modified'])} modified, {len(changes['removed'])} removed")
+
+            stale = set(changes['modified']) | set(changes['removed'])
+            changed_files = sorted(changes['added'] + changes['modified'])
+            if self.__streaming:
+                new_ecl_frames, new_dmp_files = self.__scan_csv_files(changed_files)
+            else:
+                new_ecl_frames, new_dmp_frames = self.__read_csv_files(changed_files)
+                new_dmp_files = list(new_dmp_frames)
+            new_ecl_frames = self.__encode_descriptions(new_ecl_frames)
+
+            # Take the rows of the stale files out of the running counts and
+            # add the ones of the new files
+            old_ecl_frames = self.__get_frames_by_source(self.ecl, self.ecl_sources)
+            ecl_counts = self.__combine_totals(
+                self.__ecl_counts,
+                [self.__get_ecl_counts(df) for df in new_ecl_frames.values()],
+                [self.__get_ecl_counts(df) for source, df in old_ecl_frames.items() if source in stale])
+
+            # Merge the untouched rows with the new files, no file is re-read
+            ecl_frames = {source: df for source, df in old_ecl_frames.items() if source not in stale}
+            ecl_frames.update(new_ecl_frames)
+            ecl, ecl_sources = self.__merge_frames(self.__encode_descriptions(ecl_frames))
+
+            old_dmp_files = self.__dmp_files
+            dmp_files = sorted({source for source in old_dmp_files if source not in stale} | set(new_dmp_files))
+            if not self.__streaming:
+                dmp_frames = self.__get_frames_by_source(self.dmp, self.dmp_sources, exclude=stale)
+                dmp_frames.update(new_dmp_frames)
+                dmp, dmp_sources = self.__merge_frames(dmp_frames)
+                dmp_files = list(dmp_sources['Source'])
+
+            # Totals and events before the first changed DMP file are still valid
+            first_file = 0
+            while (first_file < min(len(old_dmp_files), len(dmp_files))
+                   and old_dmp_files[first_file] == dmp_files[first_file]
+                   and dmp_files[first_file] not in stale):
+                first_file += 1
+
+            self.ecl, self.ecl_sources, self.__ecl_counts = ecl, ecl_sources, ecl_counts
+            self.__file_states = file_states
+            self.__dmp_resume_from = min(self.__dmp_resume_from, first_file)
+            if self.__streaming:
+                file_rows = self.__process_dmp_files(dmp_files, self.__dmp_resume_from)
+                self.dmp_sources = self.__get_streamed_sources(dmp_files, file_rows)
+            else:
+                self.dmp, self.dmp_sources = dmp, dmp_sources
+                self.__dmp_files = dmp_files
+            self.__invalidate('ecl', 'dmp')
+
+        except Exception as e:
+            # Fall back to a full reload so that no half updated state is kept
+            logging.error(f"Error refreshing folder, reloading it completely: {e}")
+            self.set_folder(self.__folder_path)
+
+        return changes
+
+    def set_config(self, json_config):
+        """
+        Apply a new config to the loaded data without reading the files
+        again. Only the derived products depending on the changed sections
+        are computed again, on their next access. The handler is changed in
+        place, configure a copy() of a handler other sessions use.
+        
+        Args:
+            json_config: Config file path, JSON string or dictionary, as
+                accepted by JSONConfigReader
+        
+        Returns:
+            list: Names of the changed config sections
+        """
+        # A dictionary is copied, so that later edits of it are not picked
+        # up before the next call
+        jcr = JSONConfigReader(copy.deepcopy(json_config) if isinstance(json_config, dict) else json_config)
+        changed = [section for section in DataHandler.CONFIG_SECTIONS
+                   if jcr.get_section(section) != self.jcr.get_section(section)]
+        if not changed:
+            return changed
+        logging.info(f"Config sections changed: {changed}")
+        self.jcr = jcr
+        try:
+            if 'ERROR_DESCRIPTION' in changed:
+                ecl_frames = self.__encode_descriptions({self.__folder_path: self.ecl})
+                self.ecl = ecl_frames[self.__folder_path]
+                self.__ecl_counts = self.__get_ecl_counts(self.ecl)
+            if 'SUMMARY_TAB' in changed or 'ERROR_DESCRIPTION' in changed:
+                self.__table_builder = None
+            if 'FILL_VENT_PAIRS' in changed:
+                # Every DMP file is processed again with the new pairs
+                self.fill_vent_pairs = FillVentEventDetector.get_pairs_from_config(self.jcr)
+                self.__fill_vent_checkpoints = [None]
+                self.__dmp_resume_from = 0
+                if self.__streaming:
+                    self.__process_dmp_files(self.__dmp_files)
+        except Exception as e:
+            logging.error(f"Error applying config, reloading folder: {e}")
+            self.set_folder(self.__folder_path)
+        self.__invalidate(*changed)
+        return changed
+
+    def has_dmp_data(self):
+        """Whether any DMP rows were loaded, also when they were only streamed."""
+        return not self.dmp_sources.empty
+
     def _reset_state(self):
         """Reset instance variables to empty state."""
         self.ecl = pd.DataFrame()
         self.dmp = pd.DataFrame()
-        self.ecl_freq_summary = pd.DataFrame()
-        self.filtered_dmp = pd.DataFrame()
-        self.dmp_freq_summary = pd.Series()
+        self.ecl_sources = pd.DataFrame(columns=FrameMerger.SOURCE_COLUMNS)
+        self.dmp_sources = pd.DataFrame(columns=FrameMerger.SOURCE_COLUMNS)
         # self.jcr = JSONConfigReader(json_config_path)
-        self.error_grps = dict()
-        self.tables = dict()
+        self.__derived = {}
+        self.__file_states = {}
+        self.__ecl_counts = pd.Series(dtype='int64')
+        self.__dmp_files = []
+        self.__dmp_file_totals = {}
+        self.__dmp_totals = pd.DataFrame(columns=DMPProcessor.TOTAL_COLUMNS)
+        self.__fill_vent_checkpoints = [None]
+        self.__fill_vent_events = {}
+        self.__dmp_resume_from = 0
 
     def get_folder(self):
         """Get current folder path."""
         return self.__folder_path
 
+    @staticmethod
+    def get_folder_fingerprint(folder_path):
+        """
+        Fingerprint of the CSV files of a folder, from their paths, sizes and
+        modification times. It changes whenever refresh() would find a
+        change, without reading any file.
+        
+        Args:
+            folder_path (str): Path to the folder containing CSV files
+        
+        Returns:
+            str: Hex digest of the file states
+        """
+        file_states = DataHandler.__get_file_states(folder_path)
+        state = '|'.join(f"{os.path.abspath(path)}:{size}:{mtime}" for path, (size, mtime) in file_states.items())
+        return hashlib.blake2b(state.encode(), digest_size=16).hexdigest()
+
+    def get_memory_usage(self):
+        """
+        Memory held by the loaded frames and the derived frames and pyramids
+        computed so far.
+        
+        Returns:
+            int: Size in bytes
+        """
+        with self.__lock:
+            products = list(self.__derived.values())
+        frames = [self.ecl, self.dmp]
+        frames += [product for product in products if isinstance(product, pd.DataFrame)]
+        size = sum(df.memory_usage(deep=True).sum() for df in frames)
+        size += sum(product.get_memory_usage() for product in products if isinstance(product, DMPDownsampler))
+        return int(size)
+
     def print_report(self, output_file='data_processing_report.log'):
         """
         Generate a detailed report of processed data and write it to a text file.
@@ -157,7 +832,8 @@ class DataHandler:
         
         report_lines.append("\nDATA SUMMARY:")
         report_lines.append(f"ECL Dataset: {len(self.ecl)} rows")
-        report_lines.append(f"DMP Dataset: {len(self.dmp)} rows")
+        dmp_rows = int(self.dmp_sources['Stop'].iloc[-1]) if self.has_dmp_data() else 0
+        report_lines.append(f"DMP Dataset: {dmp_rows} rows")
         report_lines.append(f"Filtered DMP Dataset: {len(self.filtered_dmp)} rows")
         
         if not self.ecl_freq_summary.empty:
@@ -171,7 +847,7 @@ class DataHandler:
         report_lines.append("\nPROCESSING STATUS:")
         status = ""
         status += "\nECL: " + ("SUCCESS" if not self.ecl.empty else "FAIL")
-        status += "\nDMP: " + ("SUCCESS" if not self.dmp.empty else "FAIL")
+        status += "\nDMP: " + ("SUCCESS" if self.has_dmp_data() else "FAIL")
         report_lines.append("OVERALL STATUS")
         report_lines.append(status)
         
@@ -193,7 +869,12 @@ class DataHandler:
             logging.error(f"Failed to write report to file: {e}")
 
     def get_detailed_data_for_group(self, group_name):
-        return self.error_group_details.get(group_name, pd.DataFrame())
+        index = self.__get_derived('error_group_index')
+        return index.get_group(group_name) if index is not None else pd.DataFrame()
+
+    def get_detailed_data_for_errors(self, descriptions):
+        index = self.__get_derived('error_group_index')
+        return index.get_rows(descriptions) if index is not None else pd.DataFrame()
 
 
 # main.py
@@ -1,10 +1,87 @@
+import numpy as np
+import pandas as pd
 from backend.json_config_loader import JSONConfigReader
+
+class ErrorGroupIndex:
+    """
+    Inverted index of the ECL rows by error description.
+
+    The rows are bucketed by description code once, with a stable argsort of
+    the codes of the description column, so the positions of every
+    description form a contiguous, ordered slice of a single array. Selecting
+    the rows of a group of descriptions then only concatenates their slices
+    instead of scanning the whole dataframe with isin, and nothing is
+    materialized until the rows of a group are asked for.
+    """
+
+    def __init__(self, ecl_df: pd.DataFrame, jcr: JSONConfigReader):
+        """
+        Args:
+            ecl_df (pd.DataFrame): Merged ECL dataframe
+            jcr (JSONConfigReader): Config reader
+        """
+        self.__ecl = ecl_df
+        self.__groups = jcr.get_error_log_tab()
+        error_desc_col = jcr.get_error_description()
+        if error_desc_col in ecl_df.columns:
+            descriptions = ecl_df[error_desc_col]
+            if not isinstance(descriptions.dtype, pd.CategoricalDtype):
+                descriptions = descriptions.astype('category')
+            self.__categories = descriptions.cat.categories
+            codes = descriptions.cat.codes.to_numpy()
+        else:
+            self.__categories = pd.Index([], dtype=object)
+            codes = np.empty(0, dtype=np.int8)
+        # Missing descriptions have code -1 and sort first, they are dropped
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.__categories))
+        self.__positions = order[len(order) - counts.sum():]
+        self.__offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def get_positions(self, descriptions) -> np.ndarray:
+        """
+        Row positions of the given descriptions.
+
+        Args:
+            descriptions (iterable): Error descriptions
+
+        Returns:
+            np.ndarray: Ascending positions of the rows in the ECL dataframe
+        """
+        codes = self.__categories.get_indexer(pd.unique(pd.Index(list(descriptions), dtype=object)))
+        slices = [self.__positions[self.__offsets[code]:self.__offsets[code + 1]] for code in codes[codes >= 0]]
+        if not slices:
+            return np.empty(0, dtype=np.intp)
+        # Every slice is ordered already, sorting restores the row order
+        # across descriptions
+        return np.sort(np.concatenate(slices))
+
+    def get_rows(self, descriptions) -> pd.DataFrame:
+        """
+        ECL rows of the given descriptions, with their original index.
+
+        Args:
+            descriptions (iterable): Error descriptions
+
+        Returns:
+            pd.DataFrame: Rows in ECL order
+        """
+        return self.__ecl.take(self.get_positions(descriptions))
+
+    def get_group(self, grp_name) -> pd.DataFrame:
+        """
+        ECL rows of an ERROR_LOG_TAB group.
+
+        Args:
+            grp_name (str): Name of the group
+
+        Returns:
+            pd.DataFrame: Rows of the group, empty for unknown groups
+        """
+        if grp_name not in self.__groups:
+            return pd.DataFrame()
+        return self.get_rows(self.__groups[grp_name]).reset_index(drop=True)
+
 def get_detailed_data_for_error_groups(ecl_df, error_grps, jcr: JSONConfigReader):
-    detailed_error_groups = {}
-    for grp_name, grp_df in error_grps.items():
-        # Get the list of descriptions in this group
-        descriptions = grp_df[jcr.get_error_description()].unique()
-        # Filter the ecl_df for rows with these descriptions
-        detailed_df = ecl_df[ecl_df[jcr.get_error_description()].isin(descriptions)].reset_index(drop=True)
-        detailed_error_groups[grp_name] = detailed_df
-    return detailed_error_groups
+    index = ErrorGroupIndex(ecl_df, jcr)
+    return {grp_name: index.get_group(grp_name) for grp_name in error_grps}
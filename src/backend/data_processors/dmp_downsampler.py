@@ -0,0 +1,130 @@
+import re
+import numpy as np
+import pandas as pd
+
+class DMPDownsampler:
+    """
+    Multi-resolution min/max pyramid of the analog DMP channels, for plotting
+    long dumps without sending every row to the browser.
+
+    Level k splits the rows into buckets of LEVEL_FACTOR**k rows and keeps
+    the rows holding the minimum and the maximum of every bucket, so peaks
+    and dips survive at every resolution. Every level is reduced from the
+    previous one, and only row positions are stored: values and x
+    coordinates are gathered from the DMP columns when a window is served.
+    A window is served from the finest level that fits in the requested
+    number of points.
+    """
+
+    LEVEL_FACTOR = 8
+    # Levels are built until one has at most this many points
+    MIN_LEVEL_POINTS = 1000
+    DEFAULT_MAX_POINTS = 4000
+    CHANNEL_PATTERN = re.compile(r'^(REF_SPEED|RF_SP_NF20|SPEED_\d+|SP_\d+_NF20|ACC_\d+)$')
+    X_COLUMN = 'MOD_TICK'
+
+    def __init__(self, df_dmp: pd.DataFrame, channels=None):
+        """
+        Args:
+            df_dmp (pd.DataFrame): Merged DMP dataframe
+            channels (list): Columns to build the pyramid of, the columns
+                matching CHANNEL_PATTERN if None
+        """
+        if channels is None:
+            channels = [column for column in df_dmp.columns if DMPDownsampler.CHANNEL_PATTERN.match(column)]
+        self.channels = [channel for channel in channels if channel in df_dmp.columns]
+        self.x_column = DMPDownsampler.X_COLUMN
+        x = df_dmp[self.x_column].to_numpy() if self.x_column in df_dmp.columns else None
+        # Windows are looked up by binary search, which needs a sorted x
+        if x is None or (len(x) > 1 and (np.diff(x) < 0).any()):
+            self.x_column = None
+            x = np.arange(len(df_dmp))
+        self.x = x
+        self.__values = {channel: df_dmp[channel].to_numpy() for channel in self.channels}
+        self.__levels = {channel: self.__build_levels(self.__values[channel]) for channel in self.channels}
+
+    @staticmethod
+    def __reduce(values, min_positions, max_positions, factor):
+        """Merge every factor consecutive buckets into one."""
+        count = -(-len(min_positions) // factor)
+        padding = count * factor - len(min_positions)
+        # The last bucket is padded with its own last candidate
+        min_positions = np.concatenate([min_positions, np.repeat(min_positions[-1:], padding)]).reshape(count, factor)
+        max_positions = np.concatenate([max_positions, np.repeat(max_positions[-1:], padding)]).reshape(count, factor)
+        rows = np.arange(count)
+        return (min_positions[rows, values[min_positions].argmin(axis=1)],
+                max_positions[rows, values[max_positions].argmax(axis=1)])
+
+    @staticmethod
+    def __build_levels(values):
+        """
+        Build the levels of a channel.
+
+        Returns:
+            list: Sorted row positions kept by every level, from level 1 on
+        """
+        levels = []
+        if len(values) == 0:
+            return levels
+        dtype = np.int32 if len(values) < 2**31 else np.int64
+        min_positions = max_positions = np.arange(len(values), dtype=dtype)
+        while 2 * len(min_positions) > DMPDownsampler.MIN_LEVEL_POINTS:
+            min_positions, max_positions = DMPDownsampler.__reduce(
+                values, min_positions, max_positions, DMPDownsampler.LEVEL_FACTOR)
+            # Both points of a bucket in row order, buckets are consecutive
+            levels.append(np.column_stack([np.minimum(min_positions, max_positions),
+                                           np.maximum(min_positions, max_positions)]).ravel())
+        return levels
+
+    def get_level_count(self, channel):
+        """Number of levels of a channel, raw rows not included."""
+        return len(self.__levels[channel])
+
+    def get_memory_usage(self):
+        """
+        Memory held by the levels, the channels are views of the DMP columns.
+
+        Returns:
+            int: Size in bytes
+        """
+        return int(sum(level.nbytes for levels in self.__levels.values() for level in levels))
+
+    def get_x_range(self):
+        """
+        Returns:
+            tuple: First and last x coordinate, None if there are no rows
+        """
+        if len(self.x) == 0:
+            return None
+        return self.x[0], self.x[-1]
+
+    def get_window(self, channel, x_start=None, x_end=None, max_points=DEFAULT_MAX_POINTS):
+        """
+        Points of a channel within an x window, from the finest level that
+        has at most max_points points in it.
+
+        Args:
+            channel (str): Channel name
+            x_start: First x coordinate of the window, None for the start
+            x_end: Last x coordinate of the window, None for the end
+            max_points (int): Maximum number of points to return, the
+                coarsest level is used if no level fits
+
+        Returns:
+            tuple: x coordinates, values, and the level they come from
+                   (0 for raw rows)
+        """
+        start = 0 if x_start is None else int(np.searchsorted(self.x, x_start, side='left'))
+        stop = len(self.x) if x_end is None else int(np.searchsorted(self.x, x_end, side='right'))
+        levels = self.__levels[channel]
+        level, positions = 0, None
+        if stop - start > max_points:
+            # Level k has about 2 points per LEVEL_FACTOR**k rows
+            while level < len(levels) and 2 * (stop - start) / DMPDownsampler.LEVEL_FACTOR ** level > max_points:
+                level += 1
+        if level == 0:
+            positions = np.arange(start, stop)
+        else:
+            points = levels[level - 1]
+            positions = points[np.searchsorted(points, start, side='left'):np.searchsorted(points, stop, side='left')]
+        return self.x[positions], self.__values[channel][positions], level
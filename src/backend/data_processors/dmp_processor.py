@@ -1,7 +1,10 @@
 import pandas as pd
 import logging
+from backend.data_processors.fill_vent_event_detector import FillVentEventDetector
 
 class DMPProcessor:
+    TOTAL_COLUMNS = ['Sum', 'Nonzero']
+
     @staticmethod
     def filter_dmp(df_dmp, jcr):
         """
@@ -59,12 +62,78 @@ class DMPProcessor:
             return pd.Series()
 
     @staticmethod
-    def process_fill_vent_events(df_dmp):
+    def get_filtered_statistics(f_df_dmp):
+        """
+        Get the statistics shown with the filtered DMP table.
+        
+        Args:
+            f_df_dmp (pd.DataFrame): Filtered DMP dataframe
+        
+        Returns:
+            tuple: describe() of the columns, and a dataframe of the
+                   'Column' and 'Non-Zero Count' of every column
+        """
+        non_zero_columns = ['Column', 'Non-Zero Count']
+        try:
+            if f_df_dmp is None or f_df_dmp.empty:
+                return pd.DataFrame(), pd.DataFrame(columns=non_zero_columns)
+
+            non_zero_counts = (f_df_dmp != 0).sum()
+            return f_df_dmp.describe(), pd.DataFrame({
+                'Column': non_zero_counts.index,
+                'Non-Zero Count': non_zero_counts.values
+            })
+        
+        except Exception as e:
+            logging.error(f"Error generating filtered DMP statistics: {e}")
+            return pd.DataFrame(), pd.DataFrame(columns=non_zero_columns)
+
+    @staticmethod
+    def get_column_totals(df_dmp, jcr):
+        """
+        Get the sum and number of non zero values of every FILL/VENT column.
+        Totals of separate parts of the DMP data can be added up and turned
+        into a frequency summary with get_summary_from_totals.
+        
+        Args:
+            df_dmp (pd.DataFrame): DMP dataframe
+        
+        Returns:
+            pd.DataFrame: 'Sum' and 'Nonzero' per FILL/VENT column, empty if
+                          a column is missing
+        """
+        required_columns = list(jcr.get_fill_vent_pairs().values())
+        if df_dmp is None or df_dmp.empty or any(col not in df_dmp.columns for col in required_columns):
+            return pd.DataFrame(columns=DMPProcessor.TOTAL_COLUMNS)
+        f_df_dmp = df_dmp[required_columns]
+        return pd.DataFrame({'Sum': f_df_dmp.sum(axis=0), 'Nonzero': (f_df_dmp != 0).sum(axis=0)})
+
+    @staticmethod
+    def get_summary_from_totals(totals):
+        """
+        Build the DMP frequency summary from column totals. Columns that are
+        zero throughout are left out, like in filter_dmp.
+        
+        Args:
+            totals (pd.DataFrame): Totals returned by get_column_totals
+        
+        Returns:
+            pd.Series: Frequency summary
+        """
+        summary = totals.loc[totals['Nonzero'] > 0, 'Sum']
+        if summary.empty:
+            return pd.Series()
+        return summary.rename(None)
+
+    @staticmethod
+    def process_fill_vent_events(df_dmp, jcr=None):
         """
         Process FILL and VENT events to count VENT transitions during FILL intervals.
         
         Args:
             df_dmp (pd.DataFrame): Input DMP dataframe
+            jcr (JSONConfigReader): Config reader giving the FILL/VENT pairs,
+                FILL_1/VENT_1 to FILL_4/VENT_4 if None
         
         Returns:
             dict: Dictionary containing events data for each FILL/VENT pair
@@ -74,54 +143,10 @@ class DMPProcessor:
                 logging.warning("Empty or None dataframe passed to process_fill_vent_events")
                 return {}
             
-            result = {}
-            for i in range(1, 5):
-                fill_col = f'FILL_{i}'
-                vent_col = f'VENT_{i}'
-                time_col = 'Time'
-                mod_tick_col = 'MOD_TICK'
-
-                if fill_col not in df_dmp.columns or vent_col not in df_dmp.columns \
-                   or time_col not in df_dmp.columns or mod_tick_col not in df_dmp.columns:
-                    logging.warning(f"Missing columns: {fill_col}, {vent_col}, {time_col}, or {mod_tick_col}")
-                    continue
-
-                # Extract relevant columns
-                df_subset = df_dmp[[time_col, mod_tick_col, fill_col, vent_col]]
-
-                # Find where FILL changes
-                fill_series = df_subset[fill_col]
-                fill_diff = fill_series.diff().fillna(0)
-                fill_start_indices = fill_diff[fill_diff == 1].index
-                fill_end_indices = fill_diff[fill_diff == -1].index
-
-                events = []
-                for idx, start_idx in enumerate(fill_start_indices):
-                    # Determine end index
-                    if idx < len(fill_end_indices):
-                        end_idx = fill_end_indices[idx]
-                    else:
-                        end_idx = df_subset.index[-1]
-
-                    interval_df = df_subset.loc[start_idx:end_idx]
-
-                    # Adjust vent_series to include previous value
-                    vent_start_idx = start_idx - 1 if start_idx > 0 else start_idx
-                    vent_series = df_subset[vent_col].iloc[vent_start_idx:end_idx + 1].reset_index(drop=True)
-                    vent_diff = vent_series.diff().fillna(vent_series.iloc[0])
-                    vent_transitions = (vent_diff == 1).sum()
-
-                    # Record event data
-                    event = {
-                        'start_time': interval_df.at[start_idx, time_col],
-                        'end_time': interval_df.at[end_idx, time_col],
-                        'mod_tick_start': interval_df.at[start_idx, mod_tick_col],
-                        'mod_tick_end': interval_df.at[end_idx, mod_tick_col],
-                        'vent_transition_count': int(vent_transitions)
-                    }
-                    events.append(event)
-
-                result[f'FILL_{i}_VENT_{i}'] = events
+            pairs = FillVentEventDetector.get_pairs_from_config(jcr) if jcr is not None else None
+            detector = FillVentEventDetector(pairs=pairs)
+            detector.feed(df_dmp)
+            result = detector.get_events()
 
             return result
 
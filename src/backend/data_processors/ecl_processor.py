@@ -1,14 +1,20 @@
+import numpy as np
 import pandas as pd
 import logging
+from backend.data_processors.error_code_dictionary import ErrorCodeDictionary
 
 class ECLProcessor:
     @staticmethod
-    def get_frequency_summary(df_ecl_fmtd, jcr):
+    def get_frequency_summary(df_ecl_fmtd, jcr, from_codes=None):
         """
         Get ECL frequency summary with error handling.
         
         Args:
             df_ecl_fmtd (pd.DataFrame): Formatted ECL dataframe
+            from_codes (bool): Count on categorical codes with a bincount
+                instead of hashing the descriptions with value_counts. None
+                does so when the description column is already categorical,
+                True converts it to categorical first.
         
         Returns:
             pd.DataFrame: Summary dataframe
@@ -18,14 +24,57 @@ class ECLProcessor:
                 logging.warning("Empty or None dataframe passed to get_ecl_freq_summary")
                 return pd.DataFrame()
 
-            summary = df_ecl_fmtd.groupby(by=[jcr.get_error_description()])
-            summary = summary.size().reset_index(name='Frequency')
-            summary['SortKey'] = summary[jcr.get_error_description()].apply(lambda x: (-len(str(x)), str(x).lower()))
-            summary = summary.sort_values(by="SortKey", ignore_index=True)
-            summary = summary.drop(columns='SortKey')
+            counts = ECLProcessor.get_frequency_counts(df_ecl_fmtd, jcr, from_codes)
+            summary = ECLProcessor.get_summary_from_counts(counts, jcr)
             
             return summary
         
         except Exception as e:
             logging.error(f"Error generating ECL frequency summary: {e}")
             return pd.DataFrame()
+
+    @staticmethod
+    def get_frequency_counts(df_ecl_fmtd, jcr, from_codes=None):
+        """
+        Count the occurrences of every error description. Counts of separate
+        parts of the ECL data can be added up and turned into a summary with
+        get_summary_from_counts.
+        
+        Args:
+            df_ecl_fmtd (pd.DataFrame): Formatted ECL dataframe
+            from_codes (bool): Count on categorical codes, see
+                get_frequency_summary
+        
+        Returns:
+            pd.Series: Number of rows per error description
+        """
+        descriptions = df_ecl_fmtd[jcr.get_error_description()]
+        is_categorical = isinstance(descriptions.dtype, pd.CategoricalDtype)
+        if from_codes is None:
+            from_codes = is_categorical
+        if not from_codes:
+            return descriptions.value_counts(sort=False)
+        if not is_categorical:
+            descriptions = descriptions.astype('category')
+        return ErrorCodeDictionary.count(descriptions)
+
+    @staticmethod
+    def get_summary_from_counts(counts, jcr):
+        """
+        Build the ECL frequency summary from counts per error description.
+        
+        Args:
+            counts (pd.Series): Number of rows per error description
+        
+        Returns:
+            pd.DataFrame: Summary dataframe
+        """
+        counts = counts[counts > 0].astype('int64')
+        # Longest descriptions first, then case-insensitive alphabetical and
+        # finally case-sensitive for descriptions differing in case only.
+        # np.lexsort sorts by the last key first.
+        names = counts.index.astype(str).to_numpy(dtype='U')
+        order = np.lexsort((names, np.char.lower(names), -np.char.str_len(names)))
+        counts = counts.iloc[order]
+        summary = counts.rename_axis(jcr.get_error_description()).reset_index(name='Frequency')
+        return summary
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+from backend.json_config_loader import JSONConfigReader
+
+class ErrorCodeDictionary:
+    """
+    Maps error descriptions to integer codes, shared by all ECL files of a
+    DataHandler.
+
+    Description columns are stored as categoricals whose categories are the
+    descriptions of the dictionary, so every row holds a small integer code
+    instead of its own Python string, and grouping and isin filtering
+    compare integers. Codes are only ever appended: a description keeps its
+    code for the lifetime of the dictionary, so frames encoded earlier only
+    need their categories extended before they are merged with newer ones.
+    """
+
+    def __init__(self, descriptions=()):
+        """
+        Args:
+            descriptions (iterable): Descriptions to assign the first codes to
+        """
+        self.__codes = {}
+        self.__descriptions = []
+        self.__dtype = None
+        self.add(descriptions)
+
+    @staticmethod
+    def from_config(jcr: JSONConfigReader):
+        """
+        Create a dictionary holding the error names listed in the ERROR_LOG_TAB
+        and SUMMARY_TAB sections, in the order they appear in the config.
+
+        Args:
+            jcr (JSONConfigReader): Config reader
+
+        Returns:
+            ErrorCodeDictionary: The seeded dictionary
+        """
+        descriptions = []
+        for error_list in jcr.get_error_log_tab().values():
+            descriptions.extend(error_list)
+        for table_details in jcr.get_summary_tab().values():
+            for row_name, row_details in table_details.items():
+                if row_name != "COLUMNS":
+                    descriptions.extend(row_details)
+        return ErrorCodeDictionary(descriptions)
+
+    def __len__(self):
+        return len(self.__descriptions)
+
+    def __contains__(self, description):
+        return description in self.__codes
+
+    def add(self, descriptions):
+        """
+        Assign codes to the descriptions not in the dictionary yet.
+
+        Args:
+            descriptions (iterable): Descriptions, missing values are ignored
+        """
+        for description in descriptions:
+            if isinstance(description, str) and description not in self.__codes:
+                self.__codes[description] = len(self.__descriptions)
+                self.__descriptions.append(description)
+                self.__dtype = None
+
+    @property
+    def dtype(self):
+        """pd.CategoricalDtype with the descriptions in code order."""
+        if self.__dtype is None:
+            self.__dtype = pd.CategoricalDtype(pd.Index(self.__descriptions, dtype=object))
+        return self.__dtype
+
+    def get_codes(self, descriptions):
+        """
+        Look up the codes of descriptions.
+
+        Args:
+            descriptions (iterable): Descriptions to look up
+
+        Returns:
+            np.ndarray: Code of every description, -1 for unknown ones
+        """
+        return np.array([self.__codes.get(description, -1) for description in descriptions], dtype=np.int64)
+
+    def encode(self, series):
+        """
+        Convert a description column to a categorical of this dictionary,
+        adding the descriptions it introduces. Columns that are already
+        categorical only have their categories remapped.
+
+        Args:
+            series (pd.Series): Descriptions, as strings or categorical
+
+        Returns:
+            pd.Series: Categorical with the dtype of the dictionary
+        """
+        self.add(ErrorCodeDictionary.__get_descriptions(series))
+        return series if series.dtype == self.dtype else series.astype(self.dtype)
+
+    @staticmethod
+    def __get_descriptions(series):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.cat.categories
+        return pd.unique(series.to_numpy(dtype=object))
+
+    def encode_frames(self, frames, column):
+        """
+        Encode the description column of several frames so that they share
+        the same categories and can be concatenated without losing them.
+
+        Args:
+            frames (dict): Dataframe per file path
+            column (str): Name of the description column
+
+        Returns:
+            dict: The frames with their description column encoded
+        """
+        for df in frames.values():
+            if column in df.columns:
+                self.add(ErrorCodeDictionary.__get_descriptions(df[column]))
+        # The dictionary is complete now, so every frame gets the same dtype
+        return {source: df.assign(**{column: df[column].astype(self.dtype)}) if column in df.columns else df
+                for source, df in frames.items()}
+
+    @staticmethod
+    def count(series):
+        """
+        Count the rows of every description of an encoded column on its codes.
+
+        Args:
+            series (pd.Series): Column returned by encode()
+
+        Returns:
+            pd.Series: Number of rows per description, including zeros
+        """
+        codes = series.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+        return pd.Series(counts, index=pd.Index(series.cat.categories, dtype=object, name=series.name),
+                         dtype='int64')
+
+    def find(self, pattern, case=False):
+        """
+        Descriptions containing a pattern, checked once per description
+        instead of once per row.
+
+        Args:
+            pattern (str): Regular expression to search for
+            case (bool): Whether the search is case sensitive
+
+        Returns:
+            list: Matching descriptions in code order
+        """
+        descriptions = pd.Series(self.__descriptions, dtype=object)
+        return descriptions[descriptions.str.contains(pattern, case=case)].tolist()
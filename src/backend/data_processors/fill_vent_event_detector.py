@@ -0,0 +1,256 @@
+import logging
+import numpy as np
+
+class FillVentEventDetector:
+    """
+    Detects FILL intervals and counts the VENT transitions inside them over a
+    DMP log that is fed in consecutive pieces (files or chunks).
+
+    A FILL interval starts on the row where FILL rises by one and ends on the
+    next row where it falls by one, or on the last row fed if it never falls.
+    The VENT transitions of an interval are the rising edges of VENT from the
+    row before the start up to the end row, plus one if VENT was already set
+    on the row before the start.
+
+    A FILL that is already set on the first row fed has no rising edge, so
+    it is not an interval and its fall is ignored; detection starts with the
+    next rise. (The implementation this replaced paired the n-th rise with
+    the n-th fall, failed on such logs and returned no events at all.)
+
+    Everything needed to continue the detection is kept between feeds, so
+    feeding a log piece by piece gives the same events as feeding it at once.
+    get_state() and the state argument of the constructor allow resuming the
+    detection from any earlier point.
+
+    All pairs are processed together on (pairs, rows) flag arrays, so the
+    cost of a feed grows only slightly with the number of pairs.
+    """
+
+    TIME_COLUMN = 'Time'
+    MOD_TICK_COLUMN = 'MOD_TICK'
+    DEFAULT_PAIRS = [(f'FILL_{i}', f'VENT_{i}') for i in range(1, 5)]
+
+    def __init__(self, pairs=None, state=None):
+        """
+        Args:
+            pairs (list): (fill_column, vent_column) tuples to detect events for
+            state (dict): State returned by get_state() to resume from
+        """
+        self.pairs = list(pairs) if pairs is not None else FillVentEventDetector.DEFAULT_PAIRS
+        self.__pair_states = {}
+        self.__last_row = None
+        if state is not None:
+            self.__last_row = state['last_row']
+            for key, pair_state in state['pairs'].items():
+                self.__pair_states[key] = FillVentEventDetector.__copy_pair_state(pair_state)
+
+    @staticmethod
+    def get_event_key(fill_col, vent_col):
+        return f'{fill_col}_{vent_col}'
+
+    @staticmethod
+    def get_pairs_from_config(jcr):
+        """
+        (fill_column, vent_column) pairs of the FILL_VENT_PAIRS config section.
+        Every FILL_<n> entry is paired with the VENT_<n> entry of the same
+        channel, the values are the DMP column names.
+
+        Args:
+            jcr (JSONConfigReader): Config reader
+
+        Returns:
+            list: Column pairs in config order, DEFAULT_PAIRS if the section
+                  is missing
+        """
+        fill_vent_pairs = jcr.get_fill_vent_pairs()
+        if not fill_vent_pairs:
+            return list(FillVentEventDetector.DEFAULT_PAIRS)
+
+        pairs = []
+        for key, fill_col in fill_vent_pairs.items():
+            if not key.startswith('FILL_'):
+                continue
+            vent_key = 'VENT_' + key[len('FILL_'):]
+            if vent_key not in fill_vent_pairs:
+                logging.warning(f"No {vent_key} configured for {key}")
+                continue
+            pairs.append((fill_col, fill_vent_pairs[vent_key]))
+        return pairs
+
+    def get_state(self):
+        """
+        Snapshot of the detection state after the rows fed so far.
+
+        Returns:
+            dict: State that can be passed to the constructor to resume
+        """
+        return {
+            'last_row': self.__last_row,
+            'pairs': {key: FillVentEventDetector.__copy_pair_state(pair_state)
+                      for key, pair_state in self.__pair_states.items()},
+        }
+
+    @staticmethod
+    def __copy_pair_state(pair_state):
+        # Closed events are never modified, only the containers are copied
+        open_event = pair_state['open']
+        return dict(pair_state,
+                    open=dict(open_event) if open_event is not None else None,
+                    events=list(pair_state['events']))
+
+    def feed(self, df_dmp):
+        """
+        Process the next rows of the DMP log.
+
+        Args:
+            df_dmp (pd.DataFrame): Rows following the ones fed before
+        """
+        if df_dmp is None or df_dmp.empty:
+            return
+
+        time_col = FillVentEventDetector.TIME_COLUMN
+        mod_tick_col = FillVentEventDetector.MOD_TICK_COLUMN
+        if time_col not in df_dmp.columns or mod_tick_col not in df_dmp.columns:
+            logging.warning(f"Missing columns: {time_col} or {mod_tick_col}")
+            return
+
+        times = df_dmp[time_col].to_numpy()
+        mod_ticks = df_dmp[mod_tick_col].to_numpy()
+
+        fill_cols, vent_cols, pair_states = [], [], []
+        for fill_col, vent_col in self.pairs:
+            if fill_col not in df_dmp.columns or vent_col not in df_dmp.columns:
+                logging.warning(f"Missing columns: {fill_col} or {vent_col}")
+                continue
+            key = FillVentEventDetector.get_event_key(fill_col, vent_col)
+            fill_cols.append(fill_col)
+            vent_cols.append(vent_col)
+            pair_states.append(self.__pair_states.setdefault(
+                key, {'prev_fill': None, 'prev_vent': None, 'open': None, 'events': []}))
+
+        if pair_states:
+            # One row per pair, all pairs are processed together
+            fill = FillVentEventDetector.__get_flag_array(df_dmp, fill_cols)
+            vent = FillVentEventDetector.__get_flag_array(df_dmp, vent_cols)
+            self.__feed_pairs(pair_states, fill, vent, times, mod_ticks)
+
+        self.__last_row = (times[-1], mod_ticks[-1])
+
+    @staticmethod
+    def __get_flag_array(df_dmp, columns):
+        # (pairs, rows) array, widened so that diffs of int8 flags cannot wrap
+        flags = df_dmp[columns].to_numpy().T
+        return flags.astype(np.promote_types(flags.dtype, np.int16), copy=False)
+
+    @staticmethod
+    def __get_previous(pair_states, name, first_values):
+        # The first row of the log has no previous row, its diff counts as 0
+        return np.array([first if pair_state[name] is None else pair_state[name]
+                         for pair_state, first in zip(pair_states, first_values)], dtype=first_values.dtype)
+
+    @staticmethod
+    def __feed_pairs(pair_states, fill, vent, times, mod_ticks):
+        rows = fill.shape[1]
+        prev_fill = FillVentEventDetector.__get_previous(pair_states, 'prev_fill', fill[:, 0])
+        prev_vent = FillVentEventDetector.__get_previous(pair_states, 'prev_vent', vent[:, 0])
+        fill_diff = np.diff(fill, axis=1, prepend=prev_fill[:, None])
+        # Number of VENT rising edges before every row of every pair, so that
+        # the edges on rows first..last are vent_rises[p, last + 1] - vent_rises[p, first]
+        vent_rises = np.zeros((fill.shape[0], rows + 1), dtype=np.int64)
+        np.cumsum(np.diff(vent, axis=1, prepend=prev_vent[:, None]) == 1, axis=1, out=vent_rises[:, 1:])
+
+        # FILL edges of all pairs, ordered by pair and then by row
+        pair_of_edge, edges = np.nonzero((fill_diff == 1) | (fill_diff == -1))
+        is_rise = fill_diff[pair_of_edge, edges] == 1
+
+        # A rise opens an interval unless one is open, a fall closes the open
+        # one. Edges repeating the direction of the previous edge of their
+        # pair are therefore ignored, what is left alternates between rise
+        # and fall within every pair.
+        was_open = np.array([pair_state['open'] is not None for pair_state in pair_states])
+        first_of_pair = np.concatenate(([True], pair_of_edge[1:] != pair_of_edge[:-1]))
+        prev_is_rise = np.where(first_of_pair, was_open[pair_of_edge], np.concatenate(([False], is_rise[:-1])))
+        keep = is_rise != prev_is_rise
+        pair_of_edge, edges, is_rise = pair_of_edge[keep], edges[keep], is_rise[keep]
+        # Open intervals without any edge in this piece stay open
+        still_open = was_open.copy()
+        still_open[pair_of_edge] = False
+
+        # The first edge of a pair with an open interval closes the interval
+        # carried over from the last piece
+        first_of_pair = np.concatenate(([True], pair_of_edge[1:] != pair_of_edge[:-1]))
+        carried = first_of_pair & was_open[pair_of_edge]
+        for pair, end in zip(pair_of_edge[carried].tolist(), edges[carried]):
+            pair_state = pair_states[pair]
+            open_event = pair_state['open']
+            pair_state['events'].append({
+                'start_time': open_event['start_time'],
+                'end_time': times[end],
+                'mod_tick_start': open_event['mod_tick_start'],
+                'mod_tick_end': mod_ticks[end],
+                'vent_transition_count': open_event['vent_transition_count'] + int(vent_rises[pair, end + 1]),
+            })
+            pair_state['open'] = None
+        pair_of_edge, edges, is_rise = pair_of_edge[~carried], edges[~carried], is_rise[~carried]
+
+        # Every rise is now followed by the fall that ends it, unless it is
+        # the last edge of its pair
+        has_end = np.concatenate((pair_of_edge[1:] == pair_of_edge[:-1], [False]))[is_rise]
+        pairs, starts = pair_of_edge[is_rise], edges[is_rise]
+        ends = np.where(has_end, np.concatenate((edges[1:], [0]))[is_rise], rows - 1)
+        # VENT set on the row before the start counts as a transition too
+        vent_before = np.where(starts > 0, vent[pairs, np.maximum(starts - 1, 0)], prev_vent[pairs]) == 1
+        counts = vent_before + vent_rises[pairs, ends + 1] - vent_rises[pairs, starts]
+
+        for pair, start, end, count, closed in zip(pairs.tolist(), starts, ends, counts.tolist(), has_end):
+            pair_state = pair_states[pair]
+            if closed:
+                pair_state['events'].append({
+                    'start_time': times[start],
+                    'end_time': times[end],
+                    'mod_tick_start': mod_ticks[start],
+                    'mod_tick_end': mod_ticks[end],
+                    'vent_transition_count': count,
+                })
+            else:
+                # Still open at the end of the piece, carried over to the next
+                # one with the transitions counted so far
+                pair_state['open'] = {
+                    'start_time': times[start],
+                    'mod_tick_start': mod_ticks[start],
+                    'vent_transition_count': count,
+                }
+
+        for pair, pair_state in enumerate(pair_states):
+            if still_open[pair]:
+                pair_state['open']['vent_transition_count'] += int(vent_rises[pair, -1])
+            pair_state['prev_fill'] = fill[pair, -1]
+            pair_state['prev_vent'] = vent[pair, -1]
+
+    def get_events(self):
+        """
+        Events detected so far. An interval that is still open ends on the
+        last row fed.
+
+        Returns:
+            dict: List of event dictionaries for every FILL/VENT pair
+        """
+        result = {}
+        for fill_col, vent_col in self.pairs:
+            key = FillVentEventDetector.get_event_key(fill_col, vent_col)
+            if key not in self.__pair_states:
+                continue
+            pair_state = self.__pair_states[key]
+            events = list(pair_state['events'])
+            open_event = pair_state['open']
+            if open_event is not None:
+                end_time, mod_tick_end = self.__last_row
+                events.append({
+                    'start_time': open_event['start_time'],
+                    'end_time': end_time,
+                    'mod_tick_start': open_event['mod_tick_start'],
+                    'mod_tick_end': mod_tick_end,
+                    'vent_transition_count': open_event['vent_transition_count'],
+                })
+            result[key] = events
+        return result
@@ -1,24 +1,86 @@
+import numpy as np
 import pandas as pd
 from backend.json_config_loader import JSONConfigReader
+from backend.data_processors.error_code_dictionary import ErrorCodeDictionary
 
-def __get_filtered_freqs(source_df: pd.DataFrame, error_list, jcr: JSONConfigReader):
-    error_desc_col = jcr.get_error_description()
-    if error_desc_col not in source_df.columns or 'Frequency' not in source_df.columns:
-        raise ValueError(f"Source DataFrame must contain {error_desc_col} and 'Frequency' columns.")
-    
-    # Filter and reorder the frequencies based on the given tag list
-    result = source_df.set_index(error_desc_col).reindex(error_list)['Frequency'].fillna(0.0).astype(int)
-    return result.reset_index(drop=True) 
+class SummaryTableBuilder:
+    """
+    Builds the tables of the SUMMARY_TAB config section.
+
+    The config is compiled once into an index matrix per table, holding the
+    error code of every (row, column) cell, and the matrices of all tables
+    are laid out one after the other in a single array. Building the tables
+    from a frequency summary turns the summary into a frequency array indexed
+    by error code, fills all cells with a single gather from it and then
+    only wraps a view of every table in a dataframe.
+    """
+
+    def __init__(self, jcr: JSONConfigReader, error_codes: ErrorCodeDictionary = None):
+        """
+        Args:
+            jcr (JSONConfigReader): Config reader
+            error_codes (ErrorCodeDictionary): Dictionary the cells are coded
+                with, a new one seeded from the config if None
+
+        Raises:
+            ValueError: If a row does not give one error per table column
+        """
+        self.__error_desc_col = jcr.get_error_description()
+        self.error_codes = error_codes if error_codes is not None else ErrorCodeDictionary.from_config(jcr)
+        self.__tables = []
+        cells, offset = [], 0
+        for table_name, table_details in jcr.get_summary_tab().items():
+            columns = table_details["COLUMNS"]
+            rows = [(row_name, row_details) for row_name, row_details in table_details.items()
+                    if row_name != "COLUMNS"]
+            for row_name, row_details in rows:
+                if len(row_details) != len(columns) - 1:
+                    raise ValueError(f"Row '{row_name}' of summary table '{table_name}' has {len(row_details)} "
+                                     f"errors for {len(columns) - 1} columns.")
+                self.error_codes.add(row_details)
+            shape = (len(rows), len(columns) - 1)
+            cells.extend(self.error_codes.get_codes(row_details) for _, row_details in rows)
+            self.__tables.append((table_name, columns, [row_name for row_name, _ in rows], offset, shape))
+            offset += shape[0] * shape[1]
+        self.__index_matrix = np.concatenate(cells) if cells else np.empty(0, dtype=np.int64)
+
+    def get_frequencies(self, ecl_freq_summary: pd.DataFrame):
+        """
+        Frequency of every error code, with a trailing zero that code -1
+        (descriptions unknown to the dictionary) points to.
+
+        Args:
+            ecl_freq_summary (pd.DataFrame): ECL frequency summary
+
+        Returns:
+            np.ndarray: int64 frequencies indexed by error code
+        """
+        if self.__error_desc_col not in ecl_freq_summary.columns or 'Frequency' not in ecl_freq_summary.columns:
+            raise ValueError(f"Source DataFrame must contain {self.__error_desc_col} and 'Frequency' columns.")
+        frequencies = np.zeros(len(self.error_codes) + 1, dtype=np.int64)
+        codes = self.error_codes.get_codes(ecl_freq_summary[self.__error_desc_col])
+        known = codes >= 0
+        frequencies[codes[known]] = ecl_freq_summary['Frequency'].to_numpy()[known]
+        return frequencies
+
+    def build(self, ecl_freq_summary: pd.DataFrame) -> dict[str, pd.DataFrame]:
+        """
+        Fill the summary tables with the frequencies of a summary.
+
+        Args:
+            ecl_freq_summary (pd.DataFrame): ECL frequency summary
+
+        Returns:
+            dict: Table per table name
+        """
+        values = self.get_frequencies(ecl_freq_summary)[self.__index_matrix]
+        df_dicts = dict()
+        for table_name, columns, row_names, offset, shape in self.__tables:
+            table_values = values[offset:offset + shape[0] * shape[1]].reshape(shape)
+            df = pd.DataFrame(table_values, columns=columns[1:])
+            df.insert(0, columns[0], pd.Series(row_names, dtype=object), allow_duplicates=True)
+            df_dicts[table_name] = df
+        return df_dicts
 
 def get_tables(ecl_freq_summary: pd.DataFrame, jcr: JSONConfigReader) -> dict[str, pd.DataFrame]:
-    df_dicts = dict()
-    for table_name, table_details in jcr.get_summary_tab().items():
-        # print(table_details)
-        df = pd.DataFrame(columns=table_details["COLUMNS"])
-        for row_name, row_details in table_details.items():
-            # print(row_name, row_details)
-            if row_name != "COLUMNS":
-                df.loc[len(df)] = [row_name] + __get_filtered_freqs(ecl_freq_summary, row_details, jcr).tolist()
-        # display(table_name, df)
-        df_dicts[table_name] = df
-    return df_dicts
\ No newline at end of file
+    return SummaryTableBuilder(jcr).build(ecl_freq_summary)
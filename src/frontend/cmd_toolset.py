@@ -5,6 +5,8 @@ import sys
 from tabulate import tabulate
 from PIL import Image
 from backend.data_handler import DataHandler
+from backend.data_extractor.parsed_file_cache import ParsedFileCache
+from backend.batch_processor import BatchProcessor, OUTPUT_FORMATS
 from backend.plotter import Plotter
 
 
@@ -37,13 +39,18 @@ def display_intro(image_path):
 Welcome to the Wabtec Interactive CLI Tool!
 -------------------------------------
 Available Commands:
-  1. import <folder_path>    Import folder containing CSV files.
-  2. summary                 Display summary of the data.
-  3. bar <tags>              Plot bar chart for specific tags.
-  4. pie <tags>              Plot pie chart for specific tags.
-  5. c_bar                   Plot bar chart for all tags.
-  6. c_pie                   Plot pie chart for all tags.
-  7. exit                    Exit the tool.
+  1. import <folder_path>    Import folder containing CSV files (-w N for N workers,
+                             -s to stream large DMP files).
+  2. refresh                 Read the files added or changed since the import.
+  3. summary                 Display summary of the data.
+  4. bar <tags>              Plot bar chart for specific tags.
+  5. pie <tags>              Plot pie chart for specific tags.
+  6. c_bar                   Plot bar chart for all tags.
+  7. c_pie                   Plot pie chart for all tags.
+  8. clear_cache             Clear the cache of parsed CSV files.
+  9. batch <folders|globs>   Process many folders and write their results (-o output
+                             folder, -f csv json feather, -w N parallel folders).
+ 10. exit                    Exit the tool.
 
 Type 'exit' to quit.
 Type '--help' for detailed usage information.
@@ -61,7 +68,7 @@ Type '--help' for detailed usage information.
     print("=" * 80)
 
 
-def import_folder(folder_path=None):
+def import_folder(folder_path=None, workers=1, stream=False):
     if not (os.path.exists(folder_path) and
             os.path.isdir(folder_path) and
             os.access(folder_path, os.R_OK)):
@@ -69,7 +76,7 @@ def import_folder(folder_path=None):
             f"Invalid folder path: '{folder_path}'. Ensure it exists, is a directory, and is accessible.")
     print(f"Importing new folder...")
     print(f"Folder path: {folder_path}")
-    dh = DataHandler(folder_path,"src/config.json")
+    dh = DataHandler(folder_path,"src/config.json", max_workers=workers, streaming=stream)
     return dh
 
 
@@ -136,25 +143,93 @@ def show_summary(dh: DataHandler):
     print(tabulate(dh.ecl_freq_summary, headers='keys', tablefmt='grid'))
 
 
+def worker_count(value):
+    """
+    Parse a number of worker processes, 0 meaning one per CPU core.
+
+    Returns:
+        int: Number of workers, None for one per CPU core
+    """
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number of workers: {value!r}")
+    if workers < 0:
+        raise argparse.ArgumentTypeError(f"number of workers must be 0 or more, got {workers}")
+    return workers or None
+
+
+def run_batch(args):
+    """
+    Process the folders of a batch command and print the throughput report.
+
+    Returns:
+        int: Exit code, 1 if no folder matched or any folder failed
+    """
+    print(f"Processing folders into {args.output}...")
+    report = BatchProcessor.run(args.folders, args.output, args.config, formats=args.formats,
+                                max_workers=args.workers, streaming=args.stream)
+    if not report['folders']:
+        print(f"No folders match: {args.folders}")
+        return 1
+    rows = [[os.path.basename(result['output']), result['ecl_rows'], result['dmp_rows'], result['files'],
+             f"{result['seconds']:.2f}", result['error'] or "OK"] for result in report['folders']]
+    print(tabulate(rows, headers=["Folder", "ECL rows", "DMP rows", "Files", "Seconds", "Status"], tablefmt='grid'))
+    print(f"{report['processed']} processed, {report['failed']} failed in {report['seconds']:.2f} s "
+          f"with {report['max_workers']} workers.")
+    print(f"Throughput: {report['folders_per_second']:.2f} folders/s, {report['rows_per_second']:,.0f} rows/s.")
+    print(f"Report written to {os.path.join(args.output, BatchProcessor.REPORT_FILE)}")
+    return 1 if report['failed'] else 0
+
+
 def create_parser():
     parser = argparse.ArgumentParser(
         description="CLI tool for performing actions with options and parameters"
     )
     subparsers = parser.add_subparsers(dest="action", required=True, help="Available actions")
-    subparsers.add_parser("import", help="Import folder containing CSV files.").add_argument("folder_path", type=str, help="Path to folder.")
+    import_parser = subparsers.add_parser("import", help="Import folder containing CSV files.")
+    import_parser.add_argument("folder_path", type=str, help="Path to folder.")
+    import_parser.add_argument("-w", "--workers", type=worker_count, default=1, help="Number of worker processes used to read the files, 0 for one per CPU core.")
+    import_parser.add_argument("-s", "--stream", action="store_true", help="Stream DMP files in chunks instead of keeping them in memory.")
+    subparsers.add_parser("refresh", help="Read the files added or changed since the import.")
     subparsers.add_parser("exit", help="Exit the command line tool.")
     subparsers.add_parser("bar", help="Plot bar chart of given tags.").add_argument("tags", nargs="+", help="Tags for the error description.")
     subparsers.add_parser("pie", help="Plot pie chart of given tags.").add_argument("tags", nargs="+", help="Tags for the error description.")
     subparsers.add_parser("c_bar", help="Plot bar chart of all tags.")
     subparsers.add_parser("c_pie", help="Plot pie chart of all tags.")
     subparsers.add_parser("summary", help="Get the frequency summary description.")
+    subparsers.add_parser("clear_cache", help="Clear the cache of parsed CSV files.")
+    batch_parser = subparsers.add_parser("batch", help="Process many folders and write their results to files.")
+    batch_parser.add_argument("folders", nargs="+", help="Folders or glob patterns of folders ('**' matches nested folders).")
+    batch_parser.add_argument("-o", "--output", type=str, default="batch_output", help="Folder the results are written to.")
+    batch_parser.add_argument("-f", "--formats", nargs="+", choices=list(OUTPUT_FORMATS), default=["csv"], help="Output file formats.")
+    batch_parser.add_argument("-w", "--workers", type=worker_count, default=1, help="Number of folders processed in parallel, 0 for one per CPU core.")
+    batch_parser.add_argument("-s", "--stream", action="store_true", help="Stream DMP files in chunks instead of keeping them in memory.")
+    batch_parser.add_argument("-c", "--config", type=str, default="src/config.json", help="Path to the JSON config.")
     return parser
 
 
-def main():
+def main(argv=None):
+    """
+    Run the interactive tool, or a single batch command when argv is given.
+
+    Args:
+        argv (list): Command line arguments, e.g. ['batch', 'logs/*'], None
+                     or empty starts the interactive tool
+
+    Returns:
+        int: Exit code of the single command
+    """
+    parser = create_parser()
+    if argv:
+        args = parser.parse_args(argv)
+        if args.action != "batch":
+            print("Only the batch command can be run non-interactively.")
+            return 2
+        return run_batch(args)
+
     image_path = "./image.png"  # Path to your ASCII art image
     display_intro(image_path)
-    parser = create_parser()
 
     dh = None
     while True:
@@ -169,9 +244,17 @@ def main():
             args = parser.parse_args(shlex.split(command))
 
             if args.action == "import":
-                dh = import_folder(args.folder_path)
+                dh = import_folder(args.folder_path, args.workers, args.stream)
+                validate_data_handler(dh)
+                show_summary(dh)
+                dh.print_report()
+            elif args.action == "refresh":
                 validate_data_handler(dh)
+                changes = dh.refresh()
+                print(f"{len(changes['added'])} added, {len(changes['modified'])} modified, "
+                      f"{len(changes['removed'])} removed.")
                 show_summary(dh)
+                dh.print_report()
             elif args.action == "bar":
                 validate_data_handler(dh)
                 plot_bar(args.tags, dh)
@@ -187,6 +270,10 @@ def main():
             elif args.action == "summary":
                 validate_data_handler(dh)
                 show_summary(dh)
+            elif args.action == "clear_cache":
+                print(f"Removed {ParsedFileCache().invalidate()} cached files.")
+            elif args.action == "batch":
+                run_batch(args)
             else:
                 print("Unknown action. Type '--help' for usage information.\n")
 
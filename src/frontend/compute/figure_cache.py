@@ -0,0 +1,139 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+# Name of the annotation holding the analysis time, see FigureCache.get()
+ANALYSIS_TIME_ANNOTATION = 'analysis_time'
+ANALYSIS_TIME_FORMAT = '%d-%m-%Y %I:%M:%S %p'
+
+class FigureCache:
+    """
+    In-memory cache of built Plotly figures, so that a rerun that does not
+    change a chart serves the figure from memory instead of building it
+    again with its traces, logo and annotations.
+
+    Keys are built by the callers from the fingerprint of the plotted data
+    and every view parameter the figure depends on. The cache is shared by
+    all sessions, so figures are handed out as copies carrying the time of
+    the request, see get(). The memory held by the cached figures is capped
+    by their estimated size, the least recently used ones are evicted
+    first, but the most recent one is always kept.
+    """
+
+    DEFAULT_MAX_BYTES = 256 << 20  # 256 MiB
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Memory cap of the cached figures in bytes
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # key -> [figure, size in bytes], least recently used first
+        self.__figures = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def get_data_fingerprint(df: pd.DataFrame):
+        """
+        Fingerprint of the contents of a dataframe, including its column
+        names and row order.
+
+        Args:
+            df (pd.DataFrame): Plotted data
+
+        Returns:
+            str: Hex digest of the data
+        """
+        data_hash = hashlib.blake2b(digest_size=16)
+        data_hash.update(repr(list(df.columns)).encode())
+        data_hash.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return data_hash.hexdigest()
+
+    @staticmethod
+    def get_figure_size(figure: go.Figure):
+        """
+        Estimated memory of a figure, from the size of its JSON form.
+
+        Args:
+            figure (go.Figure): Built figure
+
+        Returns:
+            int: Size in bytes
+        """
+        return len(figure.to_json())
+
+    @staticmethod
+    def stamp_analysis_time(figure: go.Figure):
+        """Set the analysis time annotation of a figure to the current time."""
+        figure.update_annotations(text=datetime.now().strftime(ANALYSIS_TIME_FORMAT),
+                                  selector=dict(name=ANALYSIS_TIME_ANNOTATION))
+        return figure
+
+    def get(self, key, build):
+        """
+        Get a cached figure, building and caching it on a miss. The cached
+        figure is never handed out: the caller gets a copy with the analysis
+        time set to the time of this call.
+
+        Args:
+            key (tuple): Hashable key of the figure
+            build (callable): Builds the figure, called without arguments
+
+        Returns:
+            go.Figure: Copy of the figure
+        """
+        with self.__lock:
+            entry = self.__figures.get(key)
+            if entry is not None:
+                self.hits += 1
+                self.__figures.move_to_end(key)
+                figure = entry[0]
+            else:
+                self.misses += 1
+        if entry is None:
+            figure = build()
+            size = FigureCache.get_figure_size(figure)
+            with self.__lock:
+                self.__figures[key] = [figure, size]
+                self.__figures.move_to_end(key)
+                self.__evict()
+        return FigureCache.stamp_analysis_time(go.Figure(figure))
+
+    def __evict(self):
+        total = sum(size for _, size in self.__figures.values())
+        while total > self.max_bytes and len(self.__figures) > 1:
+            _, (_, size) = self.__figures.popitem(last=False)
+            total -= size
+
+    def clear(self):
+        """Drop every cached figure."""
+        with self.__lock:
+            self.__figures.clear()
+
+    def get_stats(self):
+        """
+        Usage statistics of the cache.
+
+        Returns:
+            dict: Number of entries, hits and misses, and the cached and
+                  maximum size in bytes
+        """
+        with self.__lock:
+            return {'entries': len(self.__figures), 'hits': self.hits, 'misses': self.misses,
+                    'size': sum(size for _, size in self.__figures.values()), 'max_size': self.max_bytes}
+
+@st.cache_resource
+def get_figure_cache():
+    """Figure cache shared by all sessions"""
+    return FigureCache()
+
+def get_annotation_key():
+    """Folder metadata drawn on every figure, part of every figure key."""
+    return (st.session_state.get('depot_name'), st.session_state.get('coach_name'))
@@ -2,9 +2,8 @@ from datetime import datetime
 from frontend.compute.visualizations import get_color
 import plotly.graph_objects as go
 import streamlit as st
-from PIL import Image
-logo_path = "wabtec-logo-red.png"
-wabtec_logo = Image.open(logo_path)
+from frontend.utils.asset_registry import AssetRegistry
+from frontend.compute.figure_cache import ANALYSIS_TIME_ANNOTATION
 
 # Responsible for creating the bar charts in the summary tab
 # Default mode, grouped by error_type, subdivision is the various axles
@@ -109,7 +108,7 @@ def create_clubbed_horizontal_bar_chart(df,table_name,random_offset, swap_axes=F
     annotations = [
         {"label": "Depot Name:", "value": st.session_state.depot_name},
         {"label": "Coach Num:", "value": st.session_state.coach_name},
-        {"label": "Analysis Time:", "value": datetime.now().strftime('%d-%m-%Y %I:%M:%S %p')}
+        {"label": "Analysis Time:", "value": datetime.now().strftime('%d-%m-%Y %I:%M:%S %p'), "name": ANALYSIS_TIME_ANNOTATION}
     ]
 
     for i, anno in enumerate(annotations):
@@ -132,6 +131,7 @@ def create_clubbed_horizontal_bar_chart(df,table_name,random_offset, swap_axes=F
             xref='paper',
             yref='paper',
             text=anno["value"],
+            name=anno.get("name"),
             showarrow=False,
             xanchor='left',
             yanchor='bottom',
@@ -140,7 +140,7 @@ def create_clubbed_horizontal_bar_chart(df,table_name,random_offset, swap_axes=F
     # Add wabtec logo
     fig.add_layout_image(
         dict(
-            source=wabtec_logo,
+            source=AssetRegistry.get_logo(),
             xref="paper",
             yref="paper",
             x=-0.01,
@@ -271,7 +271,7 @@ def create_axle_grouped_bar_chart(df, table_name, random_offset, swap_axes=False
     annotations = [
         {"label": "Depot Name:", "value": st.session_state.depot_name},
         {"label": "Coach Num:", "value": st.session_state.coach_name},
-        {"label": "Analysis Time:", "value": datetime.now().strftime('%d-%m-%Y %I:%M:%S %p')}
+        {"label": "Analysis Time:", "value": datetime.now().strftime('%d-%m-%Y %I:%M:%S %p'), "name": ANALYSIS_TIME_ANNOTATION}
     ]
 
     for i, anno in enumerate(annotations):
@@ -292,6 +292,7 @@ def create_axle_grouped_bar_chart(df, table_name, random_offset, swap_axes=False
             xref='paper',
             yref='paper',
             text=anno["value"],
+            name=anno.get("name"),
             showarrow=False,
             xanchor='left',
             yanchor='bottom',
@@ -301,7 +302,7 @@ def create_axle_grouped_bar_chart(df, table_name, random_offset, swap_axes=False
     # Add wabtec logo
     fig.add_layout_image(
         dict(
-            source=wabtec_logo,
+            source=AssetRegistry.get_logo(),
             xref="paper",
             yref="paper",
             x=-0.01,
@@ -413,7 +414,7 @@ def create_simple_bar_chart(df, table_name, random_offset, swap_axes=False) -> g
     annotations = [
         {"label": "Depot Name:", "value": st.session_state.depot_name},
         {"label": "Coach Num:", "value": st.session_state.coach_name},
-        {"label": "Analysis Time:", "value": datetime.now().strftime('%d-%m-%Y %I:%M:%S %p')}
+        {"label": "Analysis Time:", "value": datetime.now().strftime('%d-%m-%Y %I:%M:%S %p'), "name": ANALYSIS_TIME_ANNOTATION}
     ]
 
     for i, anno in enumerate(annotations):
@@ -434,6 +435,7 @@ def create_simple_bar_chart(df, table_name, random_offset, swap_axes=False) -> g
             xref='paper',
             yref='paper',
             text=anno["value"],
+            name=anno.get("name"),
             showarrow=False,
             xanchor='left',
             yanchor='bottom',
@@ -443,7 +445,7 @@ def create_simple_bar_chart(df, table_name, random_offset, swap_axes=False) -> g
     # Add wabtec logo
     fig.add_layout_image(
         dict(
-            source=wabtec_logo,
+            source=AssetRegistry.get_logo(),
             xref="paper",
             yref="paper",
             x=-0.01,
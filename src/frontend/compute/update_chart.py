@@ -1,7 +1,9 @@
 import streamlit as st
 
+from backend.data_extractor.ecl_decoder import ECLDecoder
 from frontend.utils.css_utils import get_metrics_css
 from frontend.compute.visualizations import create_bar_chart, create_pie_chart, create_treemap, get_color
+from frontend.compute.figure_cache import FigureCache, get_figure_cache, get_annotation_key
 def update_chart(data_handler, selected_errors, chart_type):
         if not data_handler or len(selected_errors) == 0:
             st.warning("No data to display. Please select errors to visualize.")
@@ -87,13 +89,18 @@ def update_chart(data_handler, selected_errors, chart_type):
                     ):
                         st.session_state.show_percentage = not st.session_state.show_percentage
             
-            # Create and display the selected chart type
+            # Create and display the selected chart type. The fingerprint of
+            # the sorted data covers the selected errors and the sort order.
+            figure_key = (
+                'error_chart', chart_type, FigureCache.get_data_fingerprint(filtered_data),
+                st.session_state.axes_swapped, st.session_state.show_percentage, get_annotation_key()
+            )
             if chart_type == "Bar Chart":
-                fig = create_bar_chart(filtered_data, get_color, st.session_state)
+                fig = get_figure_cache().get(figure_key, lambda: create_bar_chart(filtered_data, get_color, st.session_state))
             elif chart_type == "Pie Chart":
-                fig = create_pie_chart(filtered_data, get_color)
+                fig = get_figure_cache().get(figure_key, lambda: create_pie_chart(filtered_data, get_color))
             else:  # Treemap
-                fig = create_treemap(filtered_data)
+                fig = get_figure_cache().get(figure_key, lambda: create_treemap(filtered_data))
             
             # Display the chart with custom config
             st.plotly_chart(
@@ -145,9 +152,7 @@ def update_chart(data_handler, selected_errors, chart_type):
                             options=list(selected_errors),
                             help="Select an error to view details"
                         )
-                        detailed_data = data_handler.ecl[
-                            data_handler.ecl['Description'] == selected_error
-                        ]
+                        detailed_data = data_handler.get_detailed_data_for_errors([selected_error])
                     else:
                         st.write("No errors selected.")
                         return
@@ -155,7 +160,9 @@ def update_chart(data_handler, selected_errors, chart_type):
             with col2:
                 if not detailed_data.empty:
                     # Get available columns
-                    available_tags = detailed_data.columns.tolist()
+                    # The decoded helper columns duplicate the text columns they come from
+                    decoded_columns = ECLDecoder.get_decoded_columns(detailed_data.columns)
+                    available_tags = [col for col in detailed_data.columns if col not in decoded_columns]
                     
                     # Define group-specific default tags
                     group_specific_tags = {
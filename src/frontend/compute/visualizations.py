@@ -4,7 +4,8 @@ import plotly.express as px
 from functools import lru_cache
 from datetime import datetime
 import streamlit as st
-from PIL import Image
+from frontend.utils.asset_registry import AssetRegistry
+from frontend.compute.figure_cache import ANALYSIS_TIME_ANNOTATION
 
 # Extended color palette
 base_colors = (
@@ -14,15 +15,13 @@ base_colors = (
     px.colors.qualitative.Pastel2 +
     px.colors.qualitative.Set2
 )
-logo_path = "wabtec-logo-red.png"
-wabtec_logo = Image.open(logo_path)
 
 def annotate_folder_stats(fig):
     # Moved from the function that draws charts to this one
     # Add logo in the top right corner
     fig.add_layout_image(
         dict(
-            source=wabtec_logo,
+            source=AssetRegistry.get_logo(),
             xref="paper",
             yref="paper",
             x=0,
@@ -38,7 +37,7 @@ def annotate_folder_stats(fig):
     annotations = [
         {"label": "Depot Name:", "value": st.session_state.depot_name},
         {"label": "Coach Num:", "value": st.session_state.coach_name},
-        {"label": "Analysis Time:", "value":  datetime.now().strftime('%d-%m-%Y %I:%M:%S %p')}
+        {"label": "Analysis Time:", "value":  datetime.now().strftime('%d-%m-%Y %I:%M:%S %p'), "name": ANALYSIS_TIME_ANNOTATION}
     ]
         
     num_annotations = len(annotations)
@@ -63,6 +62,7 @@ def annotate_folder_stats(fig):
             xref='paper',
             yref='paper',
             text=anno["value"],
+            name=anno.get("name"),
             showarrow=False,
             xanchor='left',
             yanchor='bottom',
@@ -12,6 +12,7 @@ from frontend.tabs.render_settings import render_settings
 # Import core libs
 import streamlit as st
 import os
+import time
 from pathlib import Path
 from functools import lru_cache
 import tkinter as tk
@@ -19,6 +20,32 @@ from tkinter import filedialog
 import re  
 #==============================================
 
+def render_timed(name, render_function):
+    """Render a tab and show how long it took, to check the cost of a rerun"""
+    start = time.perf_counter()
+    render_function()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    st.session_state.render_timings[name] = elapsed_ms
+    st.caption(f"⏱️ {name} rendered in {elapsed_ms:.0f} ms")
+
+# Every tab is a fragment: a widget inside it only reruns that tab, the
+# other tabs keep their output from the last full run
+@st.fragment
+def render_summary_fragment():
+    render_timed("Summary", render_summary)
+
+@st.fragment
+def render_brakes_log_fragment():
+    render_timed("Error Log", render_brakes_log)
+
+@st.fragment
+def render_dump_log_fragment():
+    render_timed("WSP Activity Log", render_dump_log)
+
+@st.fragment
+def render_settings_fragment():
+    render_timed("Settings", render_settings)
+
 class StreamlitGUI:
     def __init__(self):
         self.init_page_config()
@@ -73,27 +100,40 @@ class StreamlitGUI:
             st.session_state.pin_attempts = 0
         if 'last_attempt_time' not in st.session_state:
             st.session_state.last_attempt_time = 0
+        # Render time of every tab in ms, and of the last full run
+        if 'render_timings' not in st.session_state:
+            st.session_state.render_timings = {}
+        if 'last_full_run_ms' not in st.session_state:
+            st.session_state.last_full_run_ms = None
     
     def render(self):
         # Create tabs for navigation
         # Update tabs to include Settings
         tabs = st.tabs(["Summary", "Error Log", "WSP Activity Log",  "Settings"])
         
-        # Sidebar content
+        start = time.perf_counter()
+        
+        # Sidebar content, outside of the fragments so that loading a
+        # folder reruns every tab
         with st.sidebar:
             render_sidebar()
+            if st.session_state.last_full_run_ms is not None:
+                # Tabs rerun on their own since then show their latest time
+                tab_timings = ", ".join(f"{name} {elapsed_ms:.0f} ms"
+                                        for name, elapsed_ms in st.session_state.render_timings.items())
+                st.caption(f"⏱️ Last full run: {st.session_state.last_full_run_ms:.0f} ms ({tab_timings})")
         
         # Render content based on active tab
         with tabs[0]:
-            render_summary()
+            render_summary_fragment()
         with tabs[1]:
-            render_brakes_log()
-            pass
+            render_brakes_log_fragment()
         with tabs[2]:
-            render_dump_log()
-            pass
+            render_dump_log_fragment()
         with tabs[3]:  # Add settings tab
-            render_settings()
+            render_settings_fragment()
+        
+        st.session_state.last_full_run_ms = (time.perf_counter() - start) * 1000
 
 def main():
     gui = StreamlitGUI()
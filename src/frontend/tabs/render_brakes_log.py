@@ -1,8 +1,59 @@
 import streamlit as st
 from frontend.compute.update_chart import update_chart
+from frontend.compute.figure_cache import FigureCache
 from frontend.utils.render_section_header import render_section_header
 # from backend.data_processors.ecl_error_grouper import ECLErrorGrouper
 
+def render_error_selection_grid(search_term):
+    """
+    Selection of individual errors as a single editable grid with a
+    checkbox column, instead of a row of widgets per error. The selection is
+    kept in st.session_state.selected_errors.
+    """
+    data_handler = st.session_state.data_handler
+    error_data = data_handler.ecl_freq_summary
+    matching_errors = data_handler.error_codes.find(search_term)
+    filtered_data = error_data[error_data['Description'].isin(matching_errors)]
+    shown_errors = set(filtered_data['Description'])
+    
+    # The grid keeps its edits relative to the data it was created with, so
+    # it gets a new key whenever that data changes other than by its edits
+    if 'error_grid_version' not in st.session_state:
+        st.session_state.error_grid_version = 0
+    col_select, col_deselect = st.columns(2)
+    with col_select:
+        if st.button("Select All", key="select_all_errors", use_container_width=True):
+            st.session_state.selected_errors |= shown_errors
+            st.session_state.error_grid_version += 1
+    with col_deselect:
+        if st.button("Deselect All", key="deselect_all_errors", use_container_width=True):
+            st.session_state.selected_errors -= shown_errors
+            st.session_state.error_grid_version += 1
+    
+    grid = filtered_data[['Description', 'Frequency']].reset_index(drop=True)
+    # Keyed on the contents of the grid, which also change with the search
+    # or a refreshed folder
+    grid_fingerprint = FigureCache.get_data_fingerprint(grid)
+    grid.insert(0, 'Selected', grid['Description'].isin(st.session_state.selected_errors))
+    edited = st.data_editor(
+        grid,
+        key=f"error_grid_{st.session_state.error_grid_version}_{grid_fingerprint}",
+        column_config={
+            'Selected': st.column_config.CheckboxColumn("", width="small"),
+            'Description': st.column_config.TextColumn("Description"),
+            'Frequency': st.column_config.NumberColumn("Frequency"),
+        },
+        disabled=['Description', 'Frequency'],
+        hide_index=True,
+        use_container_width=True,
+    )
+    
+    # Errors hidden by the search keep their selection
+    st.session_state.selected_errors = (
+        (st.session_state.selected_errors - shown_errors)
+        | set(edited.loc[edited['Selected'], 'Description'])
+    )
+
 def render_brakes_log():
     # Title and description
     render_section_header(
@@ -32,48 +83,25 @@ def render_brakes_log():
             if 'last_view_mode' not in st.session_state or st.session_state.last_view_mode != st.session_state.error_view_mode:
                 st.session_state.selected_errors = set()
                 st.session_state.last_view_mode = st.session_state.error_view_mode
-            
-            # Table headings
-            col1_1, col1_2, col1_3 = st.columns([0.15, 0.6, 0.25])
-            
-            with col1_1:
-                select_all = st.checkbox("", key="select_all_items")
-            
-            with col1_2:
-                st.markdown("**Description**")
-            with col1_3:
-                st.markdown("**Frequency**")
+                st.session_state.error_grid_version = st.session_state.get('error_grid_version', 0) + 1
             
             # Handling Individual Errors
             if st.session_state.error_view_mode == "Individual Errors":
-                error_data = st.session_state.data_handler.ecl_freq_summary
-                filtered_data = error_data[error_data['Description'].str.contains(search_term, case=False)]
-                
-                if select_all:
-                    st.session_state.selected_errors = set(filtered_data['Description'])
-                else:
-                    st.session_state.selected_errors.clear()
-                
-                # Display errors in a table format
-                for _, row in filtered_data.iterrows():
-                    error_desc = row['Description']
-                    frequency = row['Frequency']
-                    col1_1, col1_2, col1_3 = st.columns([0.1, 0.7, 0.2])
-                    with col1_1:
-                        if st.checkbox(
-                            "", key=f"cb_{error_desc}",
-                            value=error_desc in st.session_state.selected_errors
-                        ):
-                            st.session_state.selected_errors.add(error_desc)
-                        else:
-                            st.session_state.selected_errors.discard(error_desc)
-                    with col1_2:
-                        st.write(error_desc)
-                    with col1_3:
-                        st.write(frequency)
+                render_error_selection_grid(search_term)
             
             # Handling Error Groups
             else:
+                # Table headings
+                col1_1, col1_2, col1_3 = st.columns([0.15, 0.6, 0.25])
+                
+                with col1_1:
+                    select_all = st.checkbox("", key="select_all_items")
+                
+                with col1_2:
+                    st.markdown("**Description**")
+                with col1_3:
+                    st.markdown("**Frequency**")
+                
                 # Get error groups from data_handler
                 error_groups = st.session_state.data_handler.error_grps
                 
@@ -6,6 +6,7 @@ from frontend.utils.render_section_header import render_section_header
 from frontend.utils.wsp_activity_log.summary import summary
 from frontend.utils.wsp_activity_log.detailed_analysis import detailed_analysis
 from frontend.utils.wsp_activity_log.time_series import time_series
+from frontend.utils.wsp_activity_log.channel_series import channel_series
 from frontend.utils.wsp_activity_log.charts import charts
 from frontend.utils.wsp_activity_log.analysis import analysis
 
@@ -17,7 +18,7 @@ def render_dump_log():
         "📊"
     )
     
-    if not st.session_state.data_handler or st.session_state.data_handler.dmp.empty:
+    if not st.session_state.data_handler or not st.session_state.data_handler.has_dmp_data():
         st.warning("Please upload DMP log files to begin analysis")
         return
 
@@ -32,6 +33,9 @@ def render_dump_log():
     
     # Time series visualization
     time_series()
+
+    # Speed and acceleration channels at the level of detail of the zoom window
+    channel_series()
     
     # Add additional analysis options
     with st.expander("Advanced Analysis Options"):
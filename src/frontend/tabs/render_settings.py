@@ -5,6 +5,8 @@ from datetime import datetime
 import hashlib
 import time
 
+from frontend.utils.render_sidebar import CONFIG_PATH, get_data_handler_cache
+
 CORRECT_PIN_HASH = "8d969eef6ecad3c29a3a629280e686cf0c3f5d5a86aff3ca12020c923adc6c92"  
 # This is hash for PIN = 123456
 MAX_ATTEMPTS = 3
@@ -326,6 +328,8 @@ def render_config_settings():
         
         config = st.session_state.config
         modified = False
+        if st.session_state.get('config_notice'):
+            st.info(st.session_state.pop('config_notice'))
         
         # Error description
         with st.expander("Error Description"):
@@ -343,6 +347,16 @@ def render_config_settings():
             try:
                 save_config(config)
                 st.success("Configuration saved successfully!")
+                # Apply it to the loaded folder, only the affected tabs are recomputed
+                if st.session_state.get('data_handler') is not None:
+                    # A configured copy, the cached handler may be used by other sessions
+                    st.session_state.data_handler, changed = get_data_handler_cache().set_config(
+                        st.session_state.data_handler, config, str(CONFIG_PATH))
+                    if changed:
+                        # The other tabs are fragments and only pick up the
+                        # change on a full rerun
+                        st.session_state.config_notice = f"Updated loaded data for: {', '.join(changed)}"
+                        st.rerun(scope="app")
             except Exception as e:
                 st.error(f"Error saving configuration: {str(e)}")
     
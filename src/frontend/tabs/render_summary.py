@@ -8,18 +8,22 @@ from backend.data_handler import DataHandler
 from frontend.utils.edit_folder_metadata import edit_folder_metadata
 from frontend.utils.render_section_header import render_section_header
 from frontend.compute.summary_viz import create_axle_grouped_bar_chart, create_clubbed_horizontal_bar_chart, create_simple_bar_chart
+from frontend.compute.figure_cache import FigureCache, get_figure_cache, get_annotation_key
 
 def render_chart(df, table_name, axle_mode, color_seed):
     """Helper function to render chart based on mode and swap_axes state."""
     swap_axes = st.session_state.swap_axes  # Get swap_axes state
     if len(df.columns) == 2:
-        fig = create_simple_bar_chart(df, table_name, color_seed, swap_axes)
+        build = lambda: create_simple_bar_chart(df, table_name, color_seed, swap_axes)
     else:
-        fig = (
+        build = lambda: (
             create_clubbed_horizontal_bar_chart(df, table_name, color_seed, swap_axes)
             if not axle_mode
             else create_axle_grouped_bar_chart(df, table_name, color_seed, swap_axes)
         )
+    figure_key = ('summary_chart', table_name, FigureCache.get_data_fingerprint(df),
+                  axle_mode, color_seed, swap_axes, get_annotation_key())
+    fig = get_figure_cache().get(figure_key, build)
     st.plotly_chart(fig, key=f"{table_name}_{axle_mode}_{swap_axes}", use_container_width=True)
 
 def add_total_occurrences(df):
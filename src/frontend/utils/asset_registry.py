@@ -0,0 +1,72 @@
+import base64
+import io
+import logging
+import threading
+from PIL import Image
+
+LOGO_PATH = "wabtec-logo-red.png"
+
+class AssetRegistry:
+    """
+    Branding images shared by all chart modules.
+
+    Plotly converts a PIL image given as layout image source into a base64
+    PNG every time it is added to a figure, so every chart of every rerun
+    encoded the full size logo again. Images are loaded, downsized and
+    encoded into a data URI once per process here instead, and figures only
+    reference that string.
+    """
+
+    # Logos take at most a fifth of a 600 to 720 px high chart
+    DEFAULT_MAX_HEIGHT = 160
+    __data_uris = {}
+    __lock = threading.Lock()
+
+    @staticmethod
+    def encode_image(image_path, max_height=DEFAULT_MAX_HEIGHT):
+        """
+        Load an image, downsize it to max_height pixels keeping its aspect
+        ratio and encode it as a PNG data URI.
+
+        Args:
+            image_path (str): Path to the image file
+            max_height (int): Maximum height in pixels, None keeps the size
+
+        Returns:
+            str: data:image/png;base64 URI of the image
+        """
+        with Image.open(image_path) as image:
+            image.load()
+            if max_height is not None and image.height > max_height:
+                width = max(1, round(image.width * max_height / image.height))
+                image = image.resize((width, max_height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG', optimize=True)
+        return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+    @staticmethod
+    def get_data_uri(image_path, max_height=DEFAULT_MAX_HEIGHT):
+        """
+        Get the encoded image, encoding it on the first request.
+
+        Args:
+            image_path (str): Path to the image file
+            max_height (int): Maximum height in pixels
+
+        Returns:
+            str: data URI of the image, None if it cannot be loaded
+        """
+        key = (image_path, max_height)
+        with AssetRegistry.__lock:
+            if key not in AssetRegistry.__data_uris:
+                try:
+                    AssetRegistry.__data_uris[key] = AssetRegistry.encode_image(image_path, max_height)
+                except (OSError, ValueError) as e:
+                    logging.error(f"Could not load image {image_path}: {e}")
+                    AssetRegistry.__data_uris[key] = None
+            return AssetRegistry.__data_uris[key]
+
+    @staticmethod
+    def get_logo():
+        """Data URI of the logo drawn on the charts."""
+        return AssetRegistry.get_data_uri(LOGO_PATH)
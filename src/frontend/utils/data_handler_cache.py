@@ -0,0 +1,208 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from backend.data_handler import DataHandler
+
+class DataHandlerCache:
+    """
+    In-memory cache of loaded DataHandlers, shared by all sessions of the
+    app.
+
+    An entry is keyed by the fingerprint of the folder's CSV files, the hash
+    of the config file contents and the loading options, so editing a file
+    or the config makes the old entry unreachable. The memory held by the
+    cached handlers is capped; when the cap is exceeded the least recently
+    used handlers are evicted, but the most recent one is always kept.
+    Cached handlers are never refreshed or reconfigured in place, see
+    refresh() and set_config().
+    """
+
+    DEFAULT_MAX_BYTES = 2 << 30  # 2 GiB
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Memory cap of the cached handlers in bytes
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> [handler, size in bytes], least recently used first
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def get_config_hash(json_config_path):
+        """
+        Hash of the contents of a config file.
+
+        Args:
+            json_config_path (str): Path to the config file
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        with open(json_config_path, 'rb') as config_file:
+            return hashlib.blake2b(config_file.read(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def get_key(folder_path, json_config_path, max_workers=1, streaming=False):
+        """
+        Build the cache key of a folder loaded with a config and options.
+
+        Returns:
+            tuple: Hashable key of the cache entry
+        """
+        return (os.path.abspath(folder_path), DataHandler.get_folder_fingerprint(folder_path),
+                DataHandlerCache.get_config_hash(json_config_path), max_workers, streaming)
+
+    def get(self, folder_path, json_config_path, max_workers=1, streaming=False):
+        """
+        Get the handler of a folder, loading it on a miss.
+
+        Args:
+            folder_path (str): Path to the folder containing CSV files
+            json_config_path (str): Path to the config file
+            max_workers (int): Worker processes used to read the files
+            streaming (bool): Stream the DMP files, see DataHandler
+
+        Returns:
+            DataHandler: The cached or newly loaded handler
+        """
+        key = DataHandlerCache.get_key(folder_path, json_config_path, max_workers, streaming)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                # Derived frames computed since the last access count too
+                entry[1] = entry[0].get_memory_usage()
+                self.__evict()
+                return entry[0]
+            self.misses += 1
+
+        # Loaded outside the lock so that other sessions are not blocked
+        data_handler = DataHandler(folder_path, json_config_path, max_workers=max_workers, streaming=streaming)
+        with self.__lock:
+            self.__entries[key] = [data_handler, data_handler.get_memory_usage()]
+            self.__entries.move_to_end(key)
+            self.__evict()
+        return data_handler
+
+    def refresh(self, data_handler, json_config_path):
+        """
+        Refresh a handler without changing it for the other sessions using
+        it. A copy is refreshed and replaces the handler in the cache, under
+        the key of the refreshed folder.
+
+        Args:
+            data_handler (DataHandler): Handler returned by get()
+            json_config_path (str): Path to the config file
+
+        Returns:
+            tuple: The refreshed handler, the given one if nothing changed,
+                   and the changes, see DataHandler.refresh()
+        """
+        refreshed = data_handler.copy()
+        changes = refreshed.refresh()
+        if not any(changes.values()):
+            return data_handler, changes
+        self.__replace(data_handler, refreshed, json_config_path)
+        return refreshed, changes
+
+    def set_config(self, data_handler, json_config, json_config_path):
+        """
+        Apply a new config to a handler without changing it for the other
+        sessions using it. A copy is configured and replaces the handler in
+        the cache, under the key of the saved config file.
+
+        Args:
+            data_handler (DataHandler): Handler returned by get()
+            json_config: Config, see DataHandler.set_config()
+            json_config_path (str): Path to the config file, already holding
+                the new config
+
+        Returns:
+            tuple: The configured handler, the given one if no section
+                   changed, and the names of the changed config sections
+        """
+        configured = data_handler.copy()
+        changed = configured.set_config(json_config)
+        if not changed:
+            return data_handler, changed
+        self.__replace(data_handler, configured, json_config_path)
+        return configured, changed
+
+    def __replace(self, old_handler, new_handler, json_config_path):
+        """Re-key the entry of old_handler to new_handler, if it is still cached."""
+        with self.__lock:
+            old_key = next((key for key, (handler, _) in self.__entries.items() if handler is old_handler), None)
+        if old_key is None:
+            return
+        # Fingerprinting reads the folder, so it is done outside the lock
+        key = DataHandlerCache.get_key(new_handler.get_folder(), json_config_path, *old_key[3:])
+        size = new_handler.get_memory_usage()
+        with self.__lock:
+            self.__entries.pop(old_key, None)
+            self.__entries[key] = [new_handler, size]
+            self.__entries.move_to_end(key)
+            self.__evict()
+
+    def __evict(self):
+        total = sum(size for _, size in self.__entries.values())
+        while total > self.max_bytes and len(self.__entries) > 1:
+            key, (_, size) = self.__entries.popitem(last=False)
+            total -= size
+            self.evictions += 1
+            logging.info(f"Evicting cached data of {key[0]} ({size} bytes)")
+
+    def invalidate(self, folder_path=None):
+        """
+        Drop cached handlers.
+
+        Args:
+            folder_path (str): Only drop the handlers of this folder, None
+                drops everything.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self.__lock:
+            if folder_path is None:
+                keys = list(self.__entries)
+            else:
+                folder_path = os.path.abspath(folder_path)
+                keys = [key for key in self.__entries if key[0] == folder_path]
+            for key in keys:
+                del self.__entries[key]
+        logging.info(f"Invalidated {len(keys)} cached data handlers")
+        return len(keys)
+
+    def get_size(self):
+        """Memory held by the cached handlers in bytes, as last measured."""
+        with self.__lock:
+            return sum(size for _, size in self.__entries.values())
+
+    def get_stats(self):
+        """
+        Usage statistics of the cache.
+
+        Returns:
+            dict: Number of entries, hits, misses and evictions, hit rate,
+                  and the cached and maximum size in bytes
+        """
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.__entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': sum(size for _, size in self.__entries.values()),
+                'max_size': self.max_bytes,
+            }
@@ -4,17 +4,20 @@ import streamlit as st
 def edit_folder_metadata():
     # Settings to edit and save folder metadata moved from settings panel to here
     # Add inputs for Date, Depot Name, and Coach Name
+    # Defaults are set before the metadata is compared, so that only edits
+    # count as changes, also of metadata that was never set
+    if 'folder_date' not in st.session_state:
+        st.session_state.folder_date = datetime.now().strftime("%d-%m-%Y")
+    previous_metadata = (st.session_state.folder_date, st.session_state.get('depot_name', ""),
+                         st.session_state.get('coach_name', ""))
     col1, col2, col3,col4 = st.columns(4)
     with col1:
         # Date input
         date_value = None
-        if 'folder_date' not in st.session_state:
-            st.session_state.folder_date = datetime.now().strftime("%d-%m-%Y")
-        else:
-            try:
-                date_value = datetime.strptime(st.session_state.folder_date, "%d-%m-%Y")
-            except:
-                pass
+        try:
+            date_value = datetime.strptime(st.session_state.folder_date, "%d-%m-%Y")
+        except:
+            pass
         new_date = st.date_input(
             "Date",
             value=date_value or datetime.now(),
@@ -34,4 +37,9 @@ def edit_folder_metadata():
             "Coach Name",
             value=st.session_state.get('coach_name', ""),
         )
-        st.session_state.coach_name = new_coach
\ No newline at end of file
+        st.session_state.coach_name = new_coach
+    # The metadata is drawn on the charts of the other tabs as well, which
+    # are fragments and only pick up the change on a full rerun
+    metadata = (st.session_state.folder_date, st.session_state.depot_name, st.session_state.coach_name)
+    if metadata != previous_metadata:
+        st.rerun(scope="app")
@@ -1,4 +1,3 @@
-from functools import lru_cache
 import os
 from pathlib import Path
 import re
@@ -6,13 +5,42 @@ import streamlit as st
 import tkinter as tk
 from tkinter import filedialog
 
-from backend.data_handler import DataHandler
+from backend.data_extractor.parsed_file_cache import ParsedFileCache
+from frontend.utils.data_handler_cache import DataHandlerCache
+from frontend.compute.figure_cache import get_figure_cache
 from frontend.utils.sidebar_utils import show_credits, show_help
 
-@lru_cache(maxsize=32)
-def process_folder(folder_path: str):
-    """Cache folder processing to avoid recomputing"""
-    return DataHandler(folder_path,"src\\config.json")
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config.json"
+
+@st.cache_resource
+def get_data_handler_cache():
+    """Cache of loaded folders, shared by all sessions"""
+    return DataHandlerCache()
+
+def process_folder(folder_path: str, max_workers: int = 1, streaming: bool = False):
+    """Load a folder, reusing the cached data while its files and the config are unchanged"""
+    return get_data_handler_cache().get(folder_path, str(CONFIG_PATH), max_workers=max_workers, streaming=streaming)
+
+def show_cache_stats():
+    cache = get_data_handler_cache()
+    with st.sidebar.expander("Data Cache", expanded=False):
+        stats = cache.get_stats()
+        st.write(f"Folders cached: {stats['entries']}")
+        st.write(f"Memory: {stats['size'] / 2**20:.1f} of {stats['max_size'] / 2**20:.0f} MiB")
+        st.write(f"Hits: {stats['hits']}, misses: {stats['misses']} ({stats['hit_rate']:.0%} hit rate)")
+        st.write(f"Evictions: {stats['evictions']}")
+        figure_stats = get_figure_cache().get_stats()
+        st.write(f"Charts cached: {figure_stats['entries']}, {figure_stats['size'] / 2**20:.1f} of "
+                 f"{figure_stats['max_size'] / 2**20:.0f} MiB "
+                 f"(hits: {figure_stats['hits']}, misses: {figure_stats['misses']})")
+        data_handler = st.session_state.get('data_handler')
+        if data_handler is not None and st.button("Forget Current Folder"):
+            cache.invalidate(data_handler.get_folder())
+            st.success("Current folder will be read again on the next upload")
+        if st.button("Clear Data Cache"):
+            removed = cache.invalidate()
+            get_figure_cache().clear()
+            st.success(f"Removed {removed} cached folders")
 
 def get_csv_files(folder_path: str) -> list:
     """Efficiently get CSV files using pathlib"""
@@ -30,6 +58,22 @@ def render_sidebar():
             root.destroy()
             return folder_selected
 
+        # Number of processes used to read the CSV files of a folder
+        max_workers = st.number_input(
+            "Worker processes",
+            min_value=1,
+            max_value=os.cpu_count() or 1,
+            value=1,
+            help="Read the CSV files of a folder in parallel using this many processes",
+        )
+
+        # Large dumps can be streamed so that they never sit in memory
+        streaming = st.checkbox(
+            "Stream DMP files",
+            value=False,
+            help="Process DMP files in chunks to limit memory use. Row level DMP data is not kept.",
+        )
+
         # Replace file uploader with 'Upload Folder' button
         if st.button("Upload Folder"):
             folder_path = select_folder()
@@ -50,7 +94,7 @@ def render_sidebar():
                                 st.warning("Folder name does not match the expected pattern")
 
                             # Use cached processing
-                            st.session_state.data_handler = process_folder(folder_path)
+                            st.session_state.data_handler = process_folder(folder_path, int(max_workers), streaming)
                             
                             if len(st.session_state.data_handler.ecl_freq_summary) == 0:
                                 st.error("No data found in the CSV files!")
@@ -66,5 +110,25 @@ def render_sidebar():
             else:
                 st.info("👆 Please select a folder")
 
+        # Only read the files added or changed since the folder was loaded
+        if "data_handler" in st.session_state and st.button("Refresh Folder"):
+            with st.spinner('Refreshing files...'):
+                # A refreshed copy, the cached handler may be used by other sessions
+                st.session_state.data_handler, changes = get_data_handler_cache().refresh(
+                    st.session_state.data_handler, str(CONFIG_PATH))
+            if any(changes.values()):
+                st.success(f"{len(changes['added'])} added, {len(changes['modified'])} modified, "
+                           f"{len(changes['removed'])} removed")
+            else:
+                st.info("No changes in the folder")
+
+        # Parsed frames are cached on disk, clearing it forces every
+        # CSV file to be parsed again on the next upload
+        if st.button("Clear Parse Cache"):
+            removed = ParsedFileCache().invalidate()
+            get_data_handler_cache().invalidate()
+            st.success(f"Removed {removed} cached files")
+
+        show_cache_stats()
         show_help()
         show_credits()
\ No newline at end of file
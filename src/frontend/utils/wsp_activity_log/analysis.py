@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from backend.data_processors.fill_vent_event_detector import FillVentEventDetector
 def analysis():
     st.subheader("FILL ↔ VENT Analysis", divider="gray")
     fill_vent_events = st.session_state.data_handler.fill_vent_events
@@ -11,16 +12,16 @@ def analysis():
         fill_vent_data = {}
         empty_events = []
         max_length = 0
-        for i in range(1, 5):
-            key = f'FILL_{i}_VENT_{i}'
+        for fill_col, vent_col in st.session_state.data_handler.fill_vent_pairs:
+            key = FillVentEventDetector.get_event_key(fill_col, vent_col)
             events = fill_vent_events.get(key, [])
             if not events:
                 empty_events.append(key)
                 continue
             fill_instances = [j + 1 for j in range(len(events))]
             vent_counts = [event['vent_transition_count'] for event in events]
-            fill_vent_data[f'FILL_{i} (instance)'] = fill_instances
-            fill_vent_data[f'VENT_{i} (count)'] = vent_counts
+            fill_vent_data[f'{fill_col} (instance)'] = fill_instances
+            fill_vent_data[f'{vent_col} (count)'] = vent_counts
             if len(events) > max_length:
                 max_length = len(events)
         if fill_vent_data:
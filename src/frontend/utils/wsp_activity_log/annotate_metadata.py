@@ -1,10 +1,8 @@
-from PIL import Image
 import streamlit as st
 import plotly.graph_objects as go
 from datetime import datetime
+from frontend.utils.asset_registry import AssetRegistry
 
-logo_path = "wabtec-logo-red.png"
-wabtec_logo = Image.open(logo_path)
 
 def annotate_metadata(fig: go.Figure, logo_x: float, logo_y: float, logo_sizex: float, logo_sizey: float, logo_xanchor: str, logo_yanchor: str, title_x: float, title_y: float, title_text:str, title_xanchor: str, title_yanchor: str,title_fontsize:int, title_color:str,top:int,bottom:int,left:int,right:int) -> go.Figure:
     annotations = [
@@ -40,7 +38,7 @@ def annotate_metadata(fig: go.Figure, logo_x: float, logo_y: float, logo_sizex:
     # Add wabtec logo
     fig.add_layout_image(
         dict(
-            source=wabtec_logo,
+            source=AssetRegistry.get_logo(),
             xref="paper",
             yref="paper",
             x=logo_x,
@@ -0,0 +1,56 @@
+import streamlit as st
+import plotly.graph_objects as go
+from frontend.utils.wsp_activity_log.annotate_metadata import annotate_metadata as addFig
+
+def channel_series():
+    st.subheader("Speed & Acceleration Channels", divider="gray")
+    data_handler = st.session_state.data_handler
+    # Streamed DMP files leave no rows, and so no channels, behind
+    if data_handler.has_dmp_data() and data_handler.dmp.empty:
+        st.info("Channel time series are not kept when DMP files are streamed.")
+        return
+    downsampler = data_handler.dmp_downsampler
+
+    x_range = downsampler.get_x_range() if downsampler is not None else None
+    if x_range is None or not downsampler.channels:
+        st.warning("No speed or acceleration channels to display.")
+        return
+
+    default_channels = [channel for channel in downsampler.channels if channel.startswith('SPEED_')]
+    channels = st.multiselect("Channels", downsampler.channels, default=default_channels or downsampler.channels[:1],
+                              key="channel_series_channels")
+    if not channels:
+        st.info("Select at least one channel to plot.")
+        return
+
+    # Plotly zoom events do not reach the server, the zoomed window is chosen
+    # here so that the rows of the window are served at the matching level
+    x_start, x_end = int(x_range[0]), int(x_range[1])
+    if x_start < x_end:
+        x_start, x_end = st.slider("Zoom window", min_value=x_start, max_value=x_end, value=(x_start, x_end),
+                                   key="channel_series_window")
+
+    fig = go.Figure()
+    levels = []
+    for channel in channels:
+        x, y, level = downsampler.get_window(channel, x_start, x_end)
+        levels.append(level)
+        # WebGL traces keep panning smooth with thousands of points per channel
+        fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name=channel,
+                                   hovertemplate=channel + ': %{y}<extra></extra>'))
+    fig.update_layout(
+        xaxis_title=downsampler.x_column or 'Row',
+        yaxis_title='Value',
+        height=450,
+        hovermode='x unified',
+        showlegend=True,
+    )
+    addFig(fig,0.95,-0.12,0.13,0.13,"right","top",0,1.12,"Channel Time Series","left","bottom",16,"black",50,50,50,50)
+    st.plotly_chart(fig, use_container_width=True)
+
+    level = max(levels)
+    if level:
+        bucket_rows = downsampler.LEVEL_FACTOR ** level
+        st.caption(f"Minimum and maximum of every {bucket_rows} rows shown, zoom in for more detail.")
+    else:
+        st.caption("Every row of the window shown.")
@@ -2,14 +2,15 @@ import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
 from frontend.utils.wsp_activity_log.annotate_metadata import annotate_metadata as addFig
+from backend.data_processors.fill_vent_event_detector import FillVentEventDetector
 def charts():
     
     st.subheader("FILL ↔ VENT Charts", divider="gray")
     fill_vent_events = st.session_state.data_handler.fill_vent_events
 
     charts = []
-    for i in range(1, 5):
-        key = f'FILL_{i}_VENT_{i}'
+    for fill_col, vent_col in st.session_state.data_handler.fill_vent_pairs:
+        key = FillVentEventDetector.get_event_key(fill_col, vent_col)
         events = fill_vent_events.get(key, [])
         if not events:
             continue
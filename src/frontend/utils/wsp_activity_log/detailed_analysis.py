@@ -1,5 +1,18 @@
+import io
+import math
 import streamlit as st
 import pandas as pd
+from frontend.compute.figure_cache import FigureCache
+
+PAGE_SIZES = [100, 500, 1000, 5000]
+
+def export_csv(df: pd.DataFrame):
+    """CSV file of a dataframe, only written when the download is requested."""
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return buffer
+
 def detailed_analysis():
     st.subheader("Detailed Event Log")
     
@@ -21,34 +34,54 @@ def detailed_analysis():
             default=filtered_dmp.columns.tolist()
         )
         
+        # Only the rows of the current page are sent to the browser
+        col1, col2 = st.columns(2)
+        with col1:
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+        page_count = max(1, math.ceil(len(filtered_dmp) / page_size))
+        with col2:
+            # Keyed on the loaded files, the filter columns and the page
+            # size, so a new dataset starts at page 1
+            dataset = FigureCache.get_data_fingerprint(st.session_state.data_handler.dmp_sources)
+            filter_columns = '_'.join(st.session_state.data_handler.jcr.get_fill_vent_pairs().values())
+            page = st.number_input(
+                "Page",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                key=f"filtered_dmp_page_{dataset}_{filter_columns}_{page_size}"
+            )
+        start = (int(page) - 1) * page_size
+        stop = min(start + page_size, len(filtered_dmp))
+
         # Show filtered data
-        st.dataframe(filtered_dmp[selected_columns], height=400)
+        st.dataframe(filtered_dmp.iloc[start:stop][selected_columns], height=400)
+        st.caption(f"Rows {start + 1:,} to {stop:,} of {len(filtered_dmp):,}")
         
-        # Add download button
-        csv = filtered_dmp.to_csv(index=False)
+        # Add download button, the CSV is only written when it is clicked
         st.download_button(
             label="Download filtered data as CSV",
-            data=csv,
+            data=lambda: export_csv(filtered_dmp),
             file_name="filtered_dump_log.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
         
-        # Add summary statistics for filtered data
+        # Add summary statistics for filtered data, computed once per dataset
         st.subheader("Filtered Data Statistics")
+        statistics, non_zero_counts = st.session_state.data_handler.filtered_dmp_stats
         
         col3, col4 = st.columns(2)
         
         with col3:
             st.write("Numerical Columns Statistics")
-            st.dataframe(filtered_dmp.describe())
+            st.dataframe(statistics)
             
         with col4:
             st.write("Non-Zero Events Count")
-            non_zero_counts = (filtered_dmp != 0).sum()
-            st.dataframe(pd.DataFrame({
-                'Column': non_zero_counts.index,
-                'Non-Zero Count': non_zero_counts.values
-            }))
+            st.dataframe(non_zero_counts)
             
+    elif st.session_state.data_handler.has_dmp_data():
+        st.info("Row level data is not kept when DMP files are streamed")
     else:
         st.info("No filtered data available")
\ No newline at end of file
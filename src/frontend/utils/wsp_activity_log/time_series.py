@@ -1,5 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
+from backend.data_processors.fill_vent_event_detector import FillVentEventDetector
+
+# Above this many events a pair is drawn with WebGL, without spline smoothing
+WEBGL_MIN_POINTS = 1000
+
 def time_series():
     st.subheader("FILL ↔ VENT Time Series", divider="gray")
     
@@ -9,9 +14,9 @@ def time_series():
     time_series_data = []
     
     if fill_vent_events:
-        # Process each FILL/VENT pair
-        for i in range(1, 5):
-            key = f'FILL_{i}_VENT_{i}'
+        # Process each configured FILL/VENT pair
+        for fill_col, vent_col in st.session_state.data_handler.fill_vent_pairs:
+            key = FillVentEventDetector.get_event_key(fill_col, vent_col)
             events = fill_vent_events.get(key, [])
             if not events:
                 continue
@@ -44,18 +49,16 @@ def time_series():
                 for idx in range(num_points)
             ] if num_points > 1 else ['rgb(0, 0, 255)']
             
-            fig_series = go.Scatter(
+            # Splines are only drawn by SVG traces
+            large_series = num_points > WEBGL_MIN_POINTS
+            trace_type = go.Scattergl if large_series else go.Scatter
+            line = dict(width=2) if large_series else dict(shape='spline', smoothing=0.5, width=2)
+            fig_series = trace_type(
                 x=time_positions,
                 y=vent_counts,
                 mode='lines+markers',
                 name=key,
-                line=dict(
-                    shape='spline',
-                    smoothing=0.5,
-                    width=2,
-                    
-                    # Apply color gradient by setting individual segment colors
-                ),
+                line=line,
                 marker=dict(
                     size=10,
                     color=colors,
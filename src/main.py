@@ -2,6 +2,7 @@ import sys
 from frontend.gui import StreamlitGUI
 from frontend import cmd_toolset
 import ctypes
+import multiprocessing
 import streamlit.web.cli as stcli
 import sys
 import os
@@ -15,8 +16,8 @@ from pathlib import Path
 # [print(i) for i in list(sys.modules.keys())]
 
 def run_cli():
-    """Run the CLI version of the application."""
-    cmd_toolset.main()
+    """Run the CLI version of the application, a single batch command if one is given."""
+    sys.exit(cmd_toolset.main(sys.argv[2:]))
 
 def run_gui():
     """Run the GUI version of the application."""
@@ -82,4 +83,7 @@ def main():
         run_gui()
 
 if __name__ == '__main__':
+    # Lets the frozen executable act as a worker process of the
+    # file ingestion pool when it is re-launched by multiprocessing.
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from backend.data_processors.dmp_processor import DMPProcessor
+from backend.data_processors.fill_vent_event_detector import FillVentEventDetector
+
+
+def make_dmp(fill, vent):
+    rows = len(fill)
+    return pd.DataFrame({
+        'Time': [0.1 * row for row in range(rows)],
+        'MOD_TICK': [100 * row for row in range(rows)],
+        'FILL_1': fill,
+        'VENT_1': vent,
+    })
+
+
+def test_log_starting_with_fill_set_ignores_the_leading_fall():
+    # FILL is already set on the first row: its fall on row 2 closes no
+    # interval, the only event is the one starting on row 4
+    df_dmp = make_dmp(fill=[1, 1, 0, 0, 1, 1, 0, 0], vent=[0, 1, 0, 0, 0, 1, 0, 0])
+    events = DMPProcessor.process_fill_vent_events(df_dmp)
+
+    assert events['FILL_1_VENT_1'] == [{
+        'start_time': df_dmp['Time'][4],
+        'end_time': df_dmp['Time'][6],
+        'mod_tick_start': 400,
+        'mod_tick_end': 600,
+        'vent_transition_count': 1,
+    }]
+
+
+def test_log_starting_with_fill_set_fed_in_pieces():
+    df_dmp = make_dmp(fill=[1, 1, 0, 0, 1, 1, 0, 0], vent=[0, 1, 0, 0, 0, 1, 0, 0])
+    detector = FillVentEventDetector(pairs=[('FILL_1', 'VENT_1')])
+    for start in range(0, len(df_dmp), 3):
+        detector.feed(df_dmp.iloc[start:start + 3])
+
+    assert detector.get_events() == DMPProcessor.process_fill_vent_events(df_dmp)